@@ -0,0 +1,468 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import Any, Awaitable, Callable, TypeVar, cast
+
+from telebot import types
+from telebot.async_telebot import AsyncTeleBot
+from telebot.asyncio_helper import ApiTelegramException
+
+from ..exceptions.telebot_utils import ChatNotSpecified, UnableCacheFile
+from .cache import Cache, RealCachedFile, TeleCache, VirtualCachedFile
+
+ReturnType = TypeVar("ReturnType")
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class AsyncTeleCache:
+	"""
+	Асинхронный менеджер кэша загружаемых в Telegram файлов для `telebot.async_telebot`.
+
+	Является обёрткой над `TeleCache`: файлы выгружаются через `AsyncTeleBot`, а чтение и запись данных кэша выполняются в пуле потоков и не блокируют цикл событий. Одновременные запросы кэширования одного файла объединяются в одну выгрузку. Формат хранения полностью совпадает с синхронным менеджером.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def cache(self) -> TeleCache:
+		"""Синхронный менеджер кэша."""
+
+		return self.__Cache
+
+	@property
+	def chat_id(self) -> int | None:
+		"""ID чата, в который выгружаются файлы."""
+
+		return self.__ChatID
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Call(self, function: Callable[..., ReturnType], *args: Any) -> ReturnType:
+		"""
+		Вызывает функцию под блокировкой синхронного менеджера кэша.
+
+		:param function: Вызываемая функция.
+		:type function: Callable[..., ReturnType]
+		:return: Результат выполнения функции.
+		:rtype: ReturnType
+		"""
+
+		with self.__Lock: return function(*args)
+
+	async def __CacheRealFile(self, path: str, attachment_type: type[types.InputMedia], data: dict | None) -> RealCachedFile:
+		"""
+		Возвращает данные кэша реального файла, выгружая его при отсутствии в кэше.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:return: Данные кэша реального файла.
+		:rtype: RealCachedFile
+		"""
+
+		try: return await self.run_blocking(self.__Cache.get_real_cached_file, path)
+		except KeyError: pass
+
+		Cache = await self.__UploadFile(path, attachment_type)
+
+		return await self.run_blocking(self.__Cache.register_real_file, path, cast(int, self.__ChatID), Cache.file_id, Cache.message_id, data, Cache.file_type)
+
+	async def __CacheVirtualFile(self, path: str, identificator: str, attachment_type: type[types.InputMedia], data: dict | None) -> VirtualCachedFile:
+		"""
+		Возвращает данные кэша виртуального файла, выгружая его при отсутствии в кэше.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:return: Данные кэша виртуального файла.
+		:rtype: VirtualCachedFile
+		"""
+
+		try: return await self.run_blocking(self.__Cache.get_virtual_cached_file, identificator)
+		except KeyError: pass
+
+		Cache = await self.__UploadFile(path, attachment_type)
+
+		return await self.run_blocking(self.__Cache.register_virtual_file, identificator, cast(int, self.__ChatID), Cache.file_id, Cache.message_id, data, Cache.file_type)
+
+	def __GetFileID(self, message: types.Message, attachment_type: type[types.InputMedia]) -> str | None:
+		"""
+		Возвращает ID выгруженного файла из сообщения.
+
+		:param message: Сообщение с файлом.
+		:type message: types.Message
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:raise TypeError: Выбрасывается при попытке использования полноценного видео в качестве анимации.
+		:return: ID файла или `None` в случае неудачи.
+		:rtype: str | None
+		"""
+
+		match attachment_type:
+			case types.InputMediaAnimation:
+				if message.animation: return message.animation.file_id
+				# Некоторые анимации отображаются верно, но распознаются как документы.
+				if message.document: return message.document.file_id
+				if message.video: raise TypeError("Use InputMediaVideo for this file.")
+
+			case types.InputMediaAudio: return message.audio.file_id if message.audio else None
+			case types.InputMediaDocument: return message.document.file_id if message.document else None
+			case types.InputMediaPhoto: return message.photo[-1].file_id if message.photo else None
+			case types.InputMediaVideo: return message.video.file_id if message.video else None
+
+		return None
+
+	def __SingleFlight(self, key: tuple[str, str], coroutine: Callable[[], Awaitable[ReturnType]]) -> "asyncio.Future[ReturnType]":
+		"""
+		Возвращает выполняющуюся задачу кэширования по ключу или запускает новую.
+
+		:param key: Тип кэша и ключ файла.
+		:type key: tuple[str, str]
+		:param coroutine: Функция, возвращающая сопрограмму кэширования.
+		:type coroutine: Callable[[], Awaitable[ReturnType]]
+		:return: Задача кэширования, защищённая от отмены ожидающими её сопрограммами.
+		:rtype: asyncio.Future[ReturnType]
+		"""
+
+		Task = self.__Uploads.get(key)
+
+		if not Task:
+			Task = asyncio.ensure_future(coroutine())
+			self.__Uploads[key] = Task
+			Task.add_done_callback(lambda _: self.__Uploads.pop(key, None))
+
+		# Отмена одного из ожидающих не прерывает выгрузку для остальных.
+		return asyncio.shield(Task)
+
+	async def __UploadFile(self, path: str, attachment_type: type[types.InputMedia]) -> Cache:
+		"""
+		Выгружает файл, повторяя выгрузку при превышении лимитов Telegram через указанное сервером время.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:raise ChatNotSpecified: Выбрасывается, если не указан чат для выгрузки.
+		:raise TypeError: Выбрасывается при попытке использования полноценного видео в качестве анимации.
+		:raise UnableCacheFile: Выбрасывается, если Telegram не вернул ID файла.
+		:return: Данные кэша.
+		:rtype: Cache
+		"""
+
+		if not self.__ChatID: raise ChatNotSpecified()
+
+		for Attempt in range(self.__Retries + 1):
+			try:
+				Message = await self.__Send(path, attachment_type)
+				break
+
+			except ApiTelegramException as ExceptionData:
+				if ExceptionData.error_code != 429 or Attempt == self.__Retries: raise
+				Parameters = ExceptionData.result_json.get("parameters") or {}
+				await asyncio.sleep(Parameters.get("retry_after", 1))
+
+		FileID = self.__GetFileID(Message, attachment_type)
+
+		if not FileID: raise UnableCacheFile(Path(path))
+
+		return Cache(FileID, Message.id, attachment_type)
+
+	async def __Send(self, path: str, attachment_type: type[types.InputMedia]) -> types.Message:
+		"""
+		Отправляет файл в чат выгрузки.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:raise ValueError: Выбрасывается при неподдерживаемом типе вложения.
+		:return: Отправленное сообщение.
+		:rtype: types.Message
+		"""
+
+		ChatID = cast(int, self.__ChatID)
+		File = types.InputFile(path)
+
+		match attachment_type:
+			case types.InputMediaAnimation: return await self.__Bot.send_animation(chat_id = ChatID, animation = File)
+			case types.InputMediaAudio: return await self.__Bot.send_audio(chat_id = ChatID, audio = File)
+			case types.InputMediaDocument: return await self.__Bot.send_document(chat_id = ChatID, document = File)
+			case types.InputMediaPhoto: return await self.__Bot.send_photo(chat_id = ChatID, photo = File)
+			case types.InputMediaVideo: return await self.__Bot.send_video(chat_id = ChatID, video = File)
+
+		raise ValueError(f"Unsupported attachment type {attachment_type}.")
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	@classmethod
+	async def create(cls, bot: AsyncTeleBot, cache_file_path: str | PathLike[str] | None = None, compaction_threshold: int = 1000, deduplication: bool = False, retries: int = 5, executor: Executor | None = None) -> "AsyncTeleCache":
+		"""
+		Создаёт менеджер, считывая данные кэша в пуле потоков.
+
+		:param bot: Асинхронный бот Telegram.
+		:type bot: AsyncTeleBot
+		:param cache_file_path: Путь к файлу JSON для хранения данных. По умолчанию `.telecache.json`.
+		:type cache_file_path: str | PathLike[str] | None
+		:param compaction_threshold: Минимальное количество записей журнала, при котором выполняется уплотнение. По умолчанию 1000.
+		:type compaction_threshold: int
+		:param deduplication: Включает режим дедупликации реальных файлов по хэшу содержимого.
+		:type deduplication: bool
+		:param retries: Количество повторов выгрузки при превышении лимитов Telegram. По умолчанию 5.
+		:type retries: int
+		:param executor: Пул, в котором выполняются блокирующие операции. По умолчанию используется пул цикла событий.
+		:type executor: Executor | None
+		:return: Асинхронный менеджер кэша.
+		:rtype: AsyncTeleCache
+		"""
+
+		Cache = await asyncio.get_running_loop().run_in_executor(executor, functools.partial(TeleCache, None, cache_file_path, compaction_threshold, deduplication))
+
+		return cls(bot, Cache, retries, executor)
+
+	def __init__(self, bot: AsyncTeleBot, cache: TeleCache, retries: int = 5, executor: Executor | None = None):
+		"""
+		Асинхронный менеджер кэша.
+
+		:param bot: Асинхронный бот Telegram.
+		:type bot: AsyncTeleBot
+		:param cache: Синхронный менеджер кэша, хранящий данные. Не должен использоваться для выгрузки одновременно с асинхронным.
+		:type cache: TeleCache
+		:param retries: Количество повторов выгрузки при превышении лимитов Telegram. По умолчанию 5.
+		:type retries: int
+		:param executor: Пул, в котором выполняются блокирующие операции. По умолчанию используется пул цикла событий.
+		:type executor: Executor | None
+		"""
+
+		self.__Bot = bot
+		self.__Cache = cache
+		self.__Retries = retries
+		self.__Executor = executor
+
+		self.__ChatID: int | None = None
+		self.__Lock = Lock()
+		self.__Uploads: dict[tuple[str, str], asyncio.Future] = {}
+
+	async def drop(self):
+		"""Удаляет данные всех кэшированных файлов."""
+
+		await self.run_blocking(self.__Cache.drop)
+
+	async def run_blocking(self, function: Callable[..., ReturnType], *args: Any) -> ReturnType:
+		"""
+		Выполняет блокирующую функцию в пуле потоков под блокировкой синхронного менеджера кэша.
+
+		:param function: Вызываемая функция.
+		:type function: Callable[..., ReturnType]
+		:return: Результат выполнения функции.
+		:rtype: ReturnType
+		"""
+
+		return await asyncio.get_running_loop().run_in_executor(self.__Executor, functools.partial(self.__Call, function, *args))
+
+	async def save(self):
+		"""Сохраняет все данные кэша в основной файл и очищает журнал изменений."""
+
+		await self.run_blocking(self.__Cache.save)
+
+	async def set_chat_id(self, chat_id: int, check_chat_access: bool = True):
+		"""
+		Задаёт ID чата, в который будут выгружаться файлы.
+
+		:param chat_id: ID чата, в который будут выгружаться файлы.
+		:type chat_id: int
+		:param check_chat_access: Включает проверку доступа к чату.
+		:type check_chat_access: bool
+		:raises ApiTelegramException: Доступ к чату отсутствует.
+		"""
+
+		if check_chat_access: await self.__Bot.get_chat(chat_id)
+		self.__ChatID = chat_id
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ РАБОТЫ С РЕАЛЬНЫМИ ФАЙЛАМИ <<<<< #
+	#==========================================================================================#
+
+	async def cache_real_file(self, path: str | PathLike[str], attachment_type: type[types.InputMedia] | None = None, data: dict | None = None) -> RealCachedFile:
+		"""
+		Кэширует реальный файл. Одновременные запросы одного файла ожидают единственной выгрузки.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:param attachment_type: Тип вложения (по умолчанию `types.InputMediaDocument`).
+		:type attachment_type: type[types.InputMedia] | None
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:raises FileNotFoundError: Выбрасывается при отсутствии файла.
+		:return: Данные кэша реального файла.
+		:rtype: RealCachedFile
+		"""
+
+		FilePath = str(path)
+		AttachmentType = attachment_type or types.InputMediaDocument
+
+		return await self.__SingleFlight(("real", FilePath), lambda: self.__CacheRealFile(FilePath, AttachmentType, data))
+
+	async def get_real_cached_file(self, path: str | PathLike[str], autoupload_type: type[types.InputMedia] | None = None) -> RealCachedFile:
+		"""
+		Возвращает данные кэша реального файла.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:param autoupload_type: Если файл отсутствует в кэше, а тип указан, то он автоматически будет выгружен на сервера Telegram.
+		:type autoupload_type: type[types.InputMedia] | None
+		:raises FileNotFoundError: Выбрасывается при отсутствии файла.
+		:raise KeyError: Выбрасывается при отсутствии кэша файла, если автоматическая выгрузка не запрошена.
+		:return: Данные кэша реального файла.
+		:rtype: RealCachedFile
+		"""
+
+		if autoupload_type: return await self.cache_real_file(path, autoupload_type)
+
+		return await self.run_blocking(self.__Cache.get_real_cached_file, path)
+
+	async def has_real_cache(self, path: str | PathLike[str]) -> bool:
+		"""
+		Проверяет наличие реального файла в кэше.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:return: Возвращает `True`, если указанный файл найден в кэше.
+		:rtype: bool
+		"""
+
+		return await self.run_blocking(self.__Cache.has_real_cache, path)
+
+	async def register_real_file(self, path: str | PathLike[str], chat_id: int, file_id: str, message_id: int | None = None, data: dict | None = None, attachment_type: type[types.InputMedia] | None = None) -> RealCachedFile:
+		"""
+		Регистрирует в хранилище данные кэша реального файла.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:param chat_id: ID чата.
+		:type chat_id: int
+		:param file_id: ID файла.
+		:type file_id: str
+		:param message_id: ID сообщения с файлом.
+		:type message_id: int | None
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:param attachment_type: Тип представления файла.
+		:type attachment_type: type[types.InputMedia] | None
+		:return: Данные кэша реального файла.
+		:rtype: RealCachedFile
+		"""
+
+		return await self.run_blocking(self.__Cache.register_real_file, path, chat_id, file_id, message_id, data, attachment_type)
+
+	async def remove_real_cache(self, path: str | PathLike[str]):
+		"""
+		Удаляет из хранилища данные кэша реального файла.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:raise KeyError: Выбрасывается при отсутствии кэша файла по указанному пути.
+		"""
+
+		await self.run_blocking(self.__Cache.remove_real_cache, path)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ РАБОТЫ С ВИРТУАЛЬНЫМИ ФАЙЛАМИ <<<<< #
+	#==========================================================================================#
+
+	async def cache_virtual_file(self, path: str | PathLike[str], identificator: str, attachment_type: type[types.InputMedia] | None = None, data: dict | None = None) -> VirtualCachedFile:
+		"""
+		Кэширует виртуальный файл. Одновременные запросы одного идентификатора ожидают единственной выгрузки.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:param attachment_type: Тип вложения (по умолчанию `types.InputMediaDocument`).
+		:type attachment_type: type[types.InputMedia] | None
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:return: Данные кэша виртуального файла.
+		:rtype: VirtualCachedFile
+		"""
+
+		FilePath = str(path)
+		AttachmentType = attachment_type or types.InputMediaDocument
+
+		return await self.__SingleFlight(("virtual", identificator), lambda: self.__CacheVirtualFile(FilePath, identificator, AttachmentType, data))
+
+	async def get_virtual_cached_file(self, identificator: str) -> VirtualCachedFile:
+		"""
+		Возвращает данные кэша виртуального файла.
+
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:raise KeyError: Выбрасывается при отсутствии кэша файла с указанным идентификатором.
+		:return: Данные кэша виртуального файла.
+		:rtype: VirtualCachedFile
+		"""
+
+		return await self.run_blocking(self.__Cache.get_virtual_cached_file, identificator)
+
+	async def has_virtual_cache(self, identificator: str) -> bool:
+		"""
+		Проверяет наличие виртуального файла в кэше.
+
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:return: Возвращает `True`, если указанный файл найден в кэше.
+		:rtype: bool
+		"""
+
+		return await self.run_blocking(self.__Cache.has_virtual_cache, identificator)
+
+	async def register_virtual_file(self, identificator: str, chat_id: int, file_id: str, message_id: int | None = None, data: dict | None = None, attachment_type: type[types.InputMedia] | None = None) -> VirtualCachedFile:
+		"""
+		Регистрирует в хранилище данные кэша виртуального файла.
+
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:param chat_id: ID чата.
+		:type chat_id: int
+		:param file_id: ID файла.
+		:type file_id: str
+		:param message_id: ID сообщения с файлом.
+		:type message_id: int | None
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:param attachment_type: Тип представления файла.
+		:type attachment_type: type[types.InputMedia] | None
+		:return: Данные кэша виртуального файла.
+		:rtype: VirtualCachedFile
+		"""
+
+		return await self.run_blocking(self.__Cache.register_virtual_file, identificator, chat_id, file_id, message_id, data, attachment_type)
+
+	async def remove_virtual_cache(self, identificator: str):
+		"""
+		Удаляет из хранилища данные кэша виртуального файла.
+
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:raise KeyError: Выбрасывается при отсутствии кэша файла с указанным идентификатором.
+		"""
+
+		await self.run_blocking(self.__Cache.remove_virtual_cache, identificator)
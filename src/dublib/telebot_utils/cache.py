@@ -1,16 +1,32 @@
 import enum
 import functools
+import hashlib
+import logging
 import os
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from os import PathLike
 from pathlib import Path
-from typing import Any, cast
+from threading import Lock
+from typing import Any, Iterable, cast
 
+import orjson
 from telebot import TeleBot, types
+from telebot.apihelper import ApiTelegramException
 
+from ..core import LOGS_HANDLER
 from ..exceptions.telebot_utils import ChatNotSpecified, UnableCacheFile
 from ..functions.filesystem import ReadJSON, WriteJSON
 
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
 #==========================================================================================#
 # >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
 #==========================================================================================#
@@ -33,6 +49,58 @@ class Cache:
 	message_id: int
 	file_type: type[types.InputMedia]
 
+@dataclass(frozen = True)
+class FileContent:
+	"""Сведения о содержимом реального файла."""
+
+	digest: str
+	size: int
+	mtime: int
+
+class RateLimiter:
+	"""
+	Ограничитель частоты запросов, равномерно распределяющий их во времени. Потокобезопасен.
+
+	Лимиты Telegram для одного чата составляют около одного сообщения в секунду, а для групп и каналов – 20 сообщений в минуту.
+	"""
+
+	def __init__(self, rate: float, period: float = 1.0):
+		"""
+		Ограничитель частоты запросов.
+
+		:param rate: Количество запросов за период.
+		:type rate: float
+		:param period: Период в секундах. По умолчанию 1.
+		:type period: float
+		:raise ValueError: Выбрасывается при неположительных количестве запросов или периоде.
+		"""
+
+		if rate <= 0 or period <= 0: raise ValueError("Rate and period must be positive.")
+
+		self.__Interval = period / rate
+		self.__Next = time.monotonic()
+		self.__Lock = Lock()
+
+	def acquire(self):
+		"""Ожидает времени, отведённого для следующего запроса."""
+
+		with self.__Lock:
+			Now = time.monotonic()
+			Slot = max(Now, self.__Next)
+			self.__Next = Slot + self.__Interval
+
+		if Slot > Now: time.sleep(Slot - Now)
+
+	def delay(self, seconds: float):
+		"""
+		Откладывает все последующие запросы, например по требованию сервера.
+
+		:param seconds: Длительность паузы в секундах.
+		:type seconds: float
+		"""
+
+		with self.__Lock: self.__Next = max(self.__Next, time.monotonic() + seconds)
+
 class CachedFile:
 	"""Данные кэшированного файла."""
 
@@ -140,6 +208,12 @@ class RealCachedFile(CachedFile):
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def content(self) -> FileContent | None:
+		"""Сведения о содержимом файла, используемые в режиме дедупликации."""
+
+		return self._Content
+
 	@property
 	def path(self) -> Path:
 		"""Путь к файлу или его виртуальный идентификатор."""
@@ -150,6 +224,29 @@ class RealCachedFile(CachedFile):
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __init__(self, identificator: str | PathLike[str], chat_id: int, file_id: str, message_id: int | None = None, data: dict | None = None, file_type: type[types.InputMedia] | None = None, content: FileContent | None = None):
+		"""
+		Данные кэшированного реального файла.
+
+		:param identificator: Путь к файлу.
+		:type identificator: str | PathLike[str]
+		:param chat_id: ID чата с файлом.
+		:type chat_id: int
+		:param file_id: ID файла 
+		:type file_id: str
+		:param message_id: ID сообщения с файлом.
+		:type message_id: int | None
+		:param data: Словарь дополнительных данных о файле.
+		:type data: dict | None
+		:param file_type: Тип представления файла в Telegram.
+		:type file_type: type[types.InputMedia] | None
+		:param content: Сведения о содержимом файла.
+		:type content: FileContent | None
+		"""
+
+		super().__init__(identificator, chat_id, file_id, message_id, data, file_type)
+		self._Content = content
+
 	def to_dict(self) -> dict:
 		"""
 		Возвращает словарное представление объекта.
@@ -166,6 +263,7 @@ class RealCachedFile(CachedFile):
 		}
 		Data["data"] = self._Data.copy()
 		if self._Type: Data["type"] = FileTypes(self._Type).name.lower()
+		if self._Content: Data["content"] = asdict(self._Content)
 
 		return Data
 	
@@ -202,14 +300,14 @@ class TeleCache:
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ ВЫГРУЗКИ ФАЙЛОВ <<<<< #
 	#==========================================================================================#
 
-	def __Upload_Animation(self, file_path: Path) -> str | None:
+	def __Upload_Animation(self, file_path: Path) -> tuple[str | None, int]:
 		"""
 		Выгружает анимацию.
 
 		:param file_path: Путь к файлу.
 		:type file_path: Path
-		:return: ID файла или `None` в случае неудачи.
-		:rtype: str | None
+		:return: ID файла (или `None` в случае неудачи) и ID сообщения.
+		:rtype: tuple[str | None, int]
 		:raises TypeError: Неверный тип файла для данного типа вложений.
 		"""
 
@@ -224,16 +322,16 @@ class TeleCache:
 		# Выброс исключения при попытке использования полноценного видео в качестве анимации.
 		elif Message.video: raise TypeError("Use InputMediaVideo for this file.")
 
-		return FileID
+		return FileID, Message.id
 
-	def __Upload_Audio(self, file_path: Path) -> str | None:
+	def __Upload_Audio(self, file_path: Path) -> tuple[str | None, int]:
 		"""
 		Выгружает аудио.
 
 		:param file_path: Путь к файлу.
 		:type file_path: Path
-		:return: ID файла или `None` в случае неудачи.
-		:rtype: str | None
+		:return: ID файла (или `None` в случае неудачи) и ID сообщения.
+		:rtype: tuple[str | None, int]
 		"""
 
 		ChatID = cast(int, self.__ChatID)
@@ -243,16 +341,16 @@ class TeleCache:
 		Message = Bot.send_audio(chat_id = ChatID, audio = types.InputFile(file_path))
 		if Message.audio: FileID = Message.audio.file_id
 
-		return FileID
+		return FileID, Message.id
 
-	def __Upload_Document(self, file_path: Path) -> str | None:
+	def __Upload_Document(self, file_path: Path) -> tuple[str | None, int]:
 		"""
 		Выгружает документ.
 
 		:param file_path: Путь к файлу.
 		:type file_path: Path
-		:return: ID файла или `None` в случае неудачи.
-		:rtype: str | None
+		:return: ID файла (или `None` в случае неудачи) и ID сообщения.
+		:rtype: tuple[str | None, int]
 		"""
 
 		ChatID = cast(int, self.__ChatID)
@@ -262,16 +360,16 @@ class TeleCache:
 		Message = Bot.send_document(chat_id = ChatID, document = types.InputFile(file_path))
 		if Message.document: FileID = Message.document.file_id
 
-		return FileID
+		return FileID, Message.id
 
-	def __Upload_Photo(self, file_path: Path) -> str | None:
+	def __Upload_Photo(self, file_path: Path) -> tuple[str | None, int]:
 		"""
 		Выгружает изображение.
 
 		:param file_path: Путь к файлу.
 		:type file_path: Path
-		:return: ID файла или `None` в случае неудачи.
-		:rtype: str | None
+		:return: ID файла (или `None` в случае неудачи) и ID сообщения.
+		:rtype: tuple[str | None, int]
 		"""
 
 		ChatID = cast(int, self.__ChatID)
@@ -281,16 +379,16 @@ class TeleCache:
 		Message = Bot.send_photo(chat_id = ChatID, photo = types.InputFile(file_path))
 		if Message.photo: FileID = Message.photo[-1].file_id
 
-		return FileID
+		return FileID, Message.id
 
-	def __Upload_Video(self, file_path: Path) -> str | None:
+	def __Upload_Video(self, file_path: Path) -> tuple[str | None, int]:
 		"""
 		Выгружает видео.
 
 		:param file_path: Путь к файлу.
 		:type file_path: Path
-		:return: ID файла или `None` в случае неудачи.
-		:rtype: str | None
+		:return: ID файла (или `None` в случае неудачи) и ID сообщения.
+		:rtype: tuple[str | None, int]
 		"""
 
 		ChatID = cast(int, self.__ChatID)
@@ -300,48 +398,186 @@ class TeleCache:
 		Message = Bot.send_video(chat_id = ChatID, video = types.InputFile(file_path))
 		if Message.video: FileID = Message.video.file_id
 
-		return FileID
+		return FileID, Message.id
 
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __Append(self, entries: list[dict]):
+		"""
+		Дописывает записи в журнал изменений одной операцией и при его разрастании выполняет уплотнение.
+
+		:param entries: Последовательность записей журнала.
+		:type entries: list[dict]
+		"""
+
+		if not entries: return
+
+		with open(self.__LogPath, "ab") as FileWriter: FileWriter.write(b"".join(orjson.dumps(Entry) + b"\n" for Entry in entries))
+		self.__LogSize += len(entries)
+
+		# Уплотнение выполняется только при превышении журналом размера кэша, поэтому его стоимость распределяется между записями.
+		if self.__LogSize >= self.__CompactionThreshold and self.__LogSize > len(self.__RealData) + len(self.__VirtualData): self.save()
+
+	def __ApplyEntry(self, entry: dict):
+		"""
+		Применяет запись журнала изменений к данным кэша.
+
+		:param entry: Запись журнала.
+		:type entry: dict
+		"""
+
+		if entry["cache"] == "real":
+			if "remove" in entry: self.__PopRealFile(entry["remove"])
+			else: self.__LinkRealFile(entry["record"]["path"], entry["record"])
+
+		elif "remove" in entry: self.__VirtualData.pop(entry["remove"], None)
+		else: self.__VirtualData[entry["record"]["identificator"]] = entry["record"]
+
+	def __FindRealFile(self, path: str) -> tuple[RealCachedFile | None, FileContent | None]:
+		"""
+		Ищет данные кэша реального файла. В режиме дедупликации проверяет содержимое файла.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:return: Данные кэша или `None` при их отсутствии, а также сведения о содержимом файла, если они были определены.
+		:rtype: tuple[RealCachedFile | None, FileContent | None]
+		"""
+
+		if not self.__Deduplication or not os.path.exists(path): return self.__GetRealFile(path), None
+		Content = self.__GetContent(path)
+
+		return self.__ResolveContent(path, Content), Content
+
+	def __GetContent(self, path: str) -> FileContent:
+		"""
+		Определяет сведения о содержимом файла. Хэш вычисляется потоково и только в случае, если размер или время изменения файла отличаются от кэшированных.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:return: Сведения о содержимом файла.
+		:rtype: FileContent
+		"""
+
+		Stat = os.stat(path)
+		File = self.__GetRealFile(path)
+		Known = File.content if File else None
+		if Known and Known.size == Stat.st_size and Known.mtime == Stat.st_mtime_ns: return Known
+
+		with open(path, "rb") as FileReader: Digest = hashlib.file_digest(FileReader, "sha256").hexdigest()
+
+		return FileContent(Digest, Stat.st_size, Stat.st_mtime_ns)
+
+	def __GetDigest(self, entry: RealCachedFile | dict) -> str | None:
+		"""
+		Возвращает хэш содержимого из данных кэша реального файла, не создавая объект.
+
+		:param entry: Данные кэша или их словарное представление.
+		:type entry: RealCachedFile | dict
+		:return: Хэш содержимого или `None` при отсутствии сведений о содержимом.
+		:rtype: str | None
+		"""
+
+		if type(entry) is dict: return entry["content"]["digest"] if entry.get("content") else None
+		Content = cast(RealCachedFile, entry).content
+
+		return Content.digest if Content else None
+
+	def __GetRealFile(self, path: str) -> RealCachedFile | None:
+		"""
+		Возвращает данные кэша реального файла, при первом обращении создавая объект из словарного представления.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:return: Данные кэша или `None` при их отсутствии.
+		:rtype: RealCachedFile | None
+		"""
+
+		Entry = self.__RealData.get(path)
+
+		if type(Entry) is dict:
+			FileType: str | None = Entry.get("type")
+			Content = FileContent(**Entry["content"]) if Entry.get("content") else None
+			Entry = RealCachedFile(path, Entry["chat_id"], Entry["file_id"], Entry["message_id"], Entry.get("data"), FileTypes[FileType.title()].value if FileType else None, Content)
+			self.__RealData[path] = Entry
+
+		return cast(RealCachedFile | None, Entry)
+
+	def __GetVirtualFile(self, identificator: str) -> VirtualCachedFile:
+		"""
+		Возвращает данные кэша виртуального файла, при первом обращении создавая объект из словарного представления.
+
+		:param identificator: Идентификатор файла.
+		:type identificator: str
+		:raise KeyError: Выбрасывается при отсутствии кэша файла с указанным идентификатором.
+		:return: Данные кэша виртуального файла.
+		:rtype: VirtualCachedFile
+		"""
+
+		Entry = self.__VirtualData[identificator]
+
+		if type(Entry) is dict:
+			FileType: str | None = Entry.get("type")
+			Entry = VirtualCachedFile(identificator, Entry["chat_id"], Entry["file_id"], Entry["message_id"], Entry.get("data"), FileTypes[FileType.title()].value if FileType else None)
+			self.__VirtualData[identificator] = Entry
+
+		return cast(VirtualCachedFile, Entry)
+
+	def __LinkRealFile(self, path: str, entry: RealCachedFile | dict):
+		"""
+		Помещает данные кэша реального файла в хранилище и индекс содержимого без сохранения.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param entry: Данные кэша или их словарное представление.
+		:type entry: RealCachedFile | dict
+		"""
+
+		self.__PopRealFile(path)
+		self.__RealData[path] = entry
+		Digest = self.__GetDigest(entry)
+		if Digest: self.__Digests.setdefault(Digest, set()).add(path)
+
+	def __PopRealFile(self, path: str):
+		"""
+		Удаляет данные кэша реального файла из хранилища и индекса содержимого без сохранения.
+
+		:param path: Путь к файлу.
+		:type path: str
+		"""
+
+		Entry = self.__RealData.pop(path, None)
+		Digest = self.__GetDigest(Entry) if Entry else None
+		if not Digest: return
+		Paths = self.__Digests[Digest]
+		Paths.discard(path)
+		if not Paths: del self.__Digests[Digest]
+
 	def __Read(self):
-		"""Считывает данные кэша."""
-
-		if not os.path.exists(self.__StoragePath): return
-		JSON = ReadJSON(self.__StoragePath)
-
-		Determinations: dict[str, dict] = {
-			"real": {
-				"key": "path",
-				"object": RealCachedFile,
-				"storage": self.__RealData
-			},
-			"virtual": {
-				"key": "identificator",
-				"object": VirtualCachedFile,
-				"storage": self.__VirtualData
-			}
-		}
+		"""Считывает данные кэша и воспроизводит журнал изменений. Объекты данных кэша создаются только при обращении к ним."""
 
-		for CacheType in Determinations.keys():
+		if os.path.exists(self.__StoragePath):
+			JSON = ReadJSON(self.__StoragePath)
+			for Record in JSON["real"]: self.__LinkRealFile(Record["path"], Record)
+			self.__VirtualData.update((Record["identificator"], Record) for Record in JSON["virtual"])
 
-			for Cache in JSON[CacheType]:
-				MainKey: str = Determinations[CacheType]["key"]
-				Object: type[RealCachedFile | VirtualCachedFile] = Determinations[CacheType]["object"]
-				Storage: dict = Determinations[CacheType]["storage"]
+		if not os.path.exists(self.__LogPath): return
+		IsTorn = False
 
-				Identificator = Cache[MainKey]
+		with open(self.__LogPath, "rb") as FileReader:
 
-				for Key in ("data", "type"):
-					if Key not in Cache.keys(): Cache[Key] = None
+			for Line in FileReader:
+				try: Entry = orjson.loads(Line)
+				except orjson.JSONDecodeError:
+					# Неполная запись может остаться в конце журнала после аварийного завершения.
+					IsTorn = True
+					break
 
-				if Cache["type"]:
-					CachedFileType: str = Cache["type"]
-					Cache["type"] = FileTypes[CachedFileType.title()].value
+				self.__ApplyEntry(Entry)
+				self.__LogSize += 1
 
-				Storage[Identificator] = Object(Identificator, Cache["chat_id"], Cache["file_id"], Cache["message_id"], Cache["data"], Cache["type"])
+		if IsTorn or self.__LogSize >= self.__CompactionThreshold: self.save()
 
 	@require_initialization
 	def __UploadFile(self, path: str | PathLike[str], attachment_type: type[types.InputMedia] | None = None) -> Cache:
@@ -361,44 +597,164 @@ class TeleCache:
 		if not attachment_type: attachment_type = types.InputMediaDocument
 		FilePath = Path(path)
 
-		Message: types.Message | None = None
 		FileID: str | None = None
+		MessageID: int | None = None
 		
 		match attachment_type:
-			case types.InputMediaAnimation: FileID = self.__Upload_Animation(FilePath)
-			case types.InputMediaAudio: FileID = self.__Upload_Audio(FilePath)
-			case types.InputMediaDocument: FileID = self.__Upload_Document(FilePath)
-			case types.InputMediaPhoto: FileID = self.__Upload_Photo(FilePath)
-			case types.InputMediaVideo: FileID = self.__Upload_Video(FilePath)
+			case types.InputMediaAnimation: FileID, MessageID = self.__Upload_Animation(FilePath)
+			case types.InputMediaAudio: FileID, MessageID = self.__Upload_Audio(FilePath)
+			case types.InputMediaDocument: FileID, MessageID = self.__Upload_Document(FilePath)
+			case types.InputMediaPhoto: FileID, MessageID = self.__Upload_Photo(FilePath)
+			case types.InputMediaVideo: FileID, MessageID = self.__Upload_Video(FilePath)
 
-		if not FileID or not Message:
+		if not FileID or MessageID is None:
 			raise UnableCacheFile(FilePath)
 
-		return Cache(FileID, Message.id, attachment_type)
+		return Cache(FileID, MessageID, attachment_type)
+
+	def __UploadWithRetries(self, path: str, attachment_type: type[types.InputMedia], limiter: RateLimiter, retries: int) -> Cache:
+		"""
+		Кэширует файл с соблюдением ограничения частоты запросов, повторяя выгрузку при превышении лимитов Telegram.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param attachment_type: Тип вложения.
+		:type attachment_type: type[types.InputMedia]
+		:param limiter: Ограничитель частоты запросов.
+		:type limiter: RateLimiter
+		:param retries: Количество повторов при ответе с кодом 429.
+		:type retries: int
+		:raise ApiTelegramException: Выбрасывается при ошибке Telegram или исчерпании повторов.
+		:return: Данные кэша.
+		:rtype: Cache
+		"""
+
+		for Attempt in range(retries + 1):
+			limiter.acquire()
+
+			try: return self.__UploadFile(path, attachment_type)
+			except ApiTelegramException as ExceptionData:
+				if ExceptionData.error_code != 429 or Attempt == retries: raise
+				Parameters = ExceptionData.result_json.get("parameters") or {}
+				# Пауза распространяется на все потоки, использующие ограничитель.
+				limiter.delay(Parameters.get("retry_after", 1))
+
+		raise UnableCacheFile(Path(path))
+
+	def __ResolveContent(self, path: str, content: FileContent) -> RealCachedFile | None:
+		"""
+		Находит данные кэша файла по его содержимому. Путь к файлу с уже кэшированным содержимым регистрируется как псевдоним, а данные кэша изменённого файла удаляются.
+
+		:param path: Путь к файлу.
+		:type path: str
+		:param content: Сведения о содержимом файла.
+		:type content: FileContent
+		:return: Данные кэша или `None`, если содержимое файла не кэшировано.
+		:rtype: RealCachedFile | None
+		"""
+
+		File = self.__GetRealFile(path)
+		if File and File.content == content: return File
+
+		# Данные, кэшированные без сведений о содержимом, считаются соответствующими текущему файлу.
+		if File and (not File.content or File.content.digest == content.digest): Source: RealCachedFile | None = File
+		else: Source = self.__GetRealFile(next(iter(self.__Digests[content.digest]))) if content.digest in self.__Digests else None
+
+		if not Source:
+
+			if File:
+				self.__PopRealFile(path)
+				self.__Append([{"cache": "real", "remove": path}])
+
+			return None
+
+		File = self.__PutRealFile(path, Source.chat_id, Source.file_id, Source.message_id, Source.data.copy(), Source.file_type, content)
+		self.__Append([{"cache": "real", "record": File.to_dict()}])
+
+		return File
+
+	def __SplitCached(self, paths: Iterable[str | PathLike[str]]) -> tuple[dict[str, RealCachedFile], list[list[tuple[str, FileContent | None]]]]:
+		"""
+		Разделяет пути на кэшированные и требующие выгрузки, исключая повторы. В режиме дедупликации файлы с одинаковым содержимым объединяются в группы, выгружаемые однократно.
+
+		:param paths: Последовательность путей к файлам.
+		:type paths: Iterable[str | PathLike[str]]
+		:return: Словарь данных кэша кэшированных файлов и список групп путей к остальным файлам со сведениями об их содержимом.
+		:rtype: tuple[dict[str, RealCachedFile], list[list[tuple[str, FileContent | None]]]]
+		"""
+
+		Cached: dict[str, RealCachedFile] = {}
+		Groups: dict[str, list[tuple[str, FileContent | None]]] = {}
+
+		for FilePath in dict.fromkeys(map(str, paths)):
+			File, Content = self.__FindRealFile(FilePath)
+			if File: Cached[FilePath] = File
+			else: Groups.setdefault(Content.digest if Content else FilePath, []).append((FilePath, Content))
+
+		return Cached, list(Groups.values())
+
+	def __PutRealFile(self, path: str | PathLike[str], chat_id: int, file_id: str, message_id: int | None = None, data: dict | None = None, attachment_type: type[types.InputMedia] | None = None, content: FileContent | None = None) -> RealCachedFile:
+		"""
+		Помещает данные кэша реального файла в хранилище без сохранения.
+
+		:param path: Путь к файлу.
+		:type path: str | PathLike[str]
+		:param chat_id: ID чата.
+		:type chat_id: int
+		:param file_id: ID файла.
+		:type file_id: str
+		:param message_id: ID сообщения с файлом.
+		:type message_id: int | None
+		:param data: Словарь дополнительных данных.
+		:type data: dict | None
+		:param attachment_type: Тип представления файла.
+		:type attachment_type: type[types.InputMedia] | None
+		:param content: Сведения о содержимом файла.
+		:type content: FileContent | None
+		:return: Данные кэша реального файла.
+		:rtype: RealCachedFile
+		"""
+
+		path = str(path)
+		File = RealCachedFile(path, chat_id, file_id, message_id, data, attachment_type, content)
+		self.__LinkRealFile(path, File)
+
+		return File
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, bot: TeleBot, cache_file_path: str | PathLike[str] | None = None,):
+	def __init__(self, bot: TeleBot | None, cache_file_path: str | PathLike[str] | None = None, compaction_threshold: int = 1000, deduplication: bool = False):
 		"""
 		Менеджер кэша загружаемых в Telegram файлов.
 
-		:param bot: Бот Telegram.
-		:type bot: TeleBot
+		Изменения кэша дописываются в журнал рядом с файлом кэша (_.telecache.json.log_), поэтому стоимость записи не зависит от размера кэша. При разрастании журнала данные уплотняются в основной файл.
+
+		:param bot: Бот Telegram. Может быть задан позднее методом `set_bot()`.
+		:type bot: TeleBot | None
 		:param storage_path: Путь к файлу JSON для хранения данных. По умолчанию `.telecache.json`.
 		:type storage_path: str | PathLike[str] | None
+		:param compaction_threshold: Минимальное количество записей журнала, при котором выполняется уплотнение. Уплотнение также требует превышения журналом количества кэшированных файлов. По умолчанию 1000.
+		:type compaction_threshold: int
+		:param deduplication: Включает режим дедупликации реальных файлов по SHA-256 хэшу содержимого. Файлы с уже кэшированным содержимым регистрируются как псевдонимы без выгрузки, а данные кэша изменённых файлов удаляются. Хэш пересчитывается только при изменении размера или времени изменения файла.
+		:type deduplication: bool
 		:raises IsADirectoryError: По переданному пути к файлу кэша находится директория.
 		"""
 
 		self.__StoragePath = Path(cache_file_path) if cache_file_path else Path(".telecache.json")
 		if self.__StoragePath.is_dir(): raise IsADirectoryError(self.__StoragePath)
+		self.__LogPath = self.__StoragePath.with_name(self.__StoragePath.name + ".log")
+		self.__CompactionThreshold = compaction_threshold
+		self.__LogSize = 0
 
-		self.__Bot: TeleBot = bot
+		self.__Bot: TeleBot | None = bot
 		self.__ChatID: int | None = None
 
-		self.__RealData: dict[str, RealCachedFile] = {}
-		self.__VirtualData: dict[str, VirtualCachedFile] = {}
+		self.__Deduplication = deduplication
+		self.__RealData: dict[str, RealCachedFile | dict] = {}
+		self.__VirtualData: dict[str, VirtualCachedFile | dict] = {}
+		self.__Digests: dict[str, set[str]] = {}
 
 		self.__Read()
 
@@ -407,17 +763,21 @@ class TeleCache:
 
 		self.__RealData = {}
 		self.__VirtualData = {}
+		self.__Digests = {}
 		self.save()
 
 	def save(self):
-		"""Сохраняет данные кэша."""
+		"""Сохраняет все данные кэша в основной файл и очищает журнал изменений."""
 
 		Buffer = {
-			"real": [Cache.to_dict() for Cache in self.__RealData.values()],
-			"virtual": [Cache.to_dict() for Cache in self.__VirtualData.values()]
+			"real": [Entry if isinstance(Entry, dict) else Entry.to_dict() for Entry in self.__RealData.values()],
+			"virtual": [Entry if isinstance(Entry, dict) else Entry.to_dict() for Entry in self.__VirtualData.values()]
 		}
 
-		WriteJSON(self.__StoragePath, Buffer)
+		# Журнал удаляется после записи основного файла, а его повторное воспроизведение не изменяет данных.
+		WriteJSON(self.__StoragePath, Buffer, atomic = True)
+		if os.path.exists(self.__LogPath): os.remove(self.__LogPath)
+		self.__LogSize = 0
 
 	def set_bot(self, bot: TeleBot | str):
 		"""
@@ -468,25 +828,87 @@ class TeleCache:
 		"""
 
 		if not attachment_type: attachment_type = types.InputMediaDocument
+		File, Content = self.__FindRealFile(str(path))
+		if File: return File
 
-		if path not in self.__RealData.keys():
-			Cache = self.__UploadFile(path, attachment_type)
-			self.register_real_file(path, cast(int, self.__ChatID), Cache.file_id, Cache.message_id, data, Cache.file_type)
+		Cache = self.__UploadFile(path, attachment_type)
+		File = self.__PutRealFile(path, cast(int, self.__ChatID), Cache.file_id, Cache.message_id, data, Cache.file_type, Content)
+		self.__Append([{"cache": "real", "record": File.to_dict()}])
+
+		return File
+
+	@require_initialization
+	def cache_many(self, paths: Iterable[str | PathLike[str]], attachment_type: type[types.InputMedia] | None = None, workers: int = 4, rate: float = 1.0, retries: int = 5, batch_size: int = 50) -> dict[str, RealCachedFile]:
+		"""
+		Параллельно кэширует несколько реальных файлов.
+
+		Выгрузки выполняются в пуле потоков с общим ограничением частоты отправки сообщений. В режиме дедупликации файлы с одинаковым содержимым выгружаются однократно. При ответе Telegram с кодом 429 все потоки приостанавливаются на указанное сервером время, а выгрузка повторяется. Данные кэша сохраняются пакетами, поэтому прерванное кэширование теряет не более одного пакета. Файлы, кэшировать которые не удалось, отсутствуют в результате, а причины записываются в лог.
+
+		:param paths: Последовательность путей к файлам.
+		:type paths: Iterable[str | PathLike[str]]
+		:param attachment_type: Тип вложения (по умолчанию `types.InputMediaDocument`).
+		:type attachment_type: type[types.InputMedia] | None
+		:param workers: Количество потоков выгрузки. По умолчанию 4.
+		:type workers: int
+		:param rate: Максимальное количество отправляемых сообщений в секунду. По умолчанию 1, для групп и каналов рекомендуется 0.33.
+		:type rate: float
+		:param retries: Количество повторов выгрузки при превышении лимитов Telegram. По умолчанию 5.
+		:type retries: int
+		:param batch_size: Количество выгруженных файлов, после которого данные кэша сохраняются. По умолчанию 50.
+		:type batch_size: int
+		:raise ValueError: Выбрасывается при неположительных количестве потоков, частоте или размере пакета.
+		:return: Словарь данных кэша файлов, включая кэшированные ранее, по строковым путям.
+		:rtype: dict[str, RealCachedFile]
+		"""
+
+		if workers < 1 or batch_size < 1: raise ValueError("Workers count and batch size must be positive.")
+		if not attachment_type: attachment_type = types.InputMediaDocument
+
+		Limiter = RateLimiter(rate)
+		ChatID = cast(int, self.__ChatID)
+		Result, Uncached = self.__SplitCached(paths)
+
+		if not Uncached: return Result
+		Unsaved: list[dict] = []
 
-		return self.__RealData[str(path)]
+		with ThreadPoolExecutor(min(workers, len(Uncached))) as Executor:
+			Futures = {Executor.submit(self.__UploadWithRetries, Group[0][0], attachment_type, Limiter, retries): Group for Group in Uncached}
+
+			try:
+				for Future in as_completed(Futures):
+					Group = Futures[Future]
+
+					try: Cache = Future.result()
+					except Exception:
+						LOGGER.exception(f"Unable to cache \"{Group[0][0]}\".")
+						continue
+
+					for FilePath, Content in Group:
+						Result[FilePath] = self.__PutRealFile(FilePath, ChatID, Cache.file_id, Cache.message_id, None, Cache.file_type, Content)
+						Unsaved.append({"cache": "real", "record": Result[FilePath].to_dict()})
+
+					if len(Unsaved) >= batch_size:
+						self.__Append(Unsaved)
+						Unsaved = []
+
+			finally:
+				for Future in Futures: Future.cancel()
+				self.__Append(Unsaved)
+
+		return Result
 
 	def clear_real_cache(self):
 		"""Удаляет данные кэшированных файлов, пути к которым более не являются валидными."""
 
-		for FilePath in list(self.__RealData.keys()):
-			if not os.path.exists(FilePath): del self.__RealData[FilePath]
-
-		self.save()
+		Removed = [FilePath for FilePath in self.__RealData.keys() if not os.path.exists(FilePath)]
+		for FilePath in Removed: self.__PopRealFile(FilePath)
+		self.__Append([{"cache": "real", "remove": FilePath} for FilePath in Removed])
 
 	def drop_real_cache(self):
 		"""Удаляет данные всех реальных кэшированных файлов."""
 
 		self.__RealData = {}
+		self.__Digests = {}
 		self.save()
 
 	def get_real_cached_file(self, path: str | PathLike[str], autoupload_type: type[types.InputMedia] | None = None) -> RealCachedFile:
@@ -498,18 +920,21 @@ class TeleCache:
 		:param autoupload_type: Если файл отсутствует в кэше, а тип указан, то он автоматически будет выгружен на сервера Telegram.
 		:type autoupload_type: type[types.InputMedia] | None
 		:raises FileNotFoundError: Выбрасывается при отсутствии файла.
+		:raise KeyError: Выбрасывается при отсутствии кэша файла, если автоматическая выгрузка не запрошена.
 		:return: Данные кэша реального файла.
 		:rtype: RealCachedFile
 		"""
 
 		if not os.path.exists(path): raise FileNotFoundError(path)
-		if autoupload_type: self.cache_real_file(path, autoupload_type)
+		if autoupload_type: return self.cache_real_file(path, autoupload_type)
+		File = self.__FindRealFile(str(path))[0]
+		if not File: raise KeyError(str(path))
 
-		return self.__RealData[str(path)]
+		return File
 	
 	def has_real_cache(self, path: str | PathLike[str]) -> bool:
 		"""
-		Проверяет наличие реального файла в кэше.
+		Проверяет наличие реального файла в кэше. В режиме дедупликации проверяет содержимое файла.
 
 		:param path: Путь к файлу.
 		:type path: str | PathLike[str]
@@ -517,7 +942,7 @@ class TeleCache:
 		:rtype: bool
 		"""
 
-		return path in self.__RealData.keys()
+		return self.__FindRealFile(str(path))[0] is not None
 
 	def register_real_file(self, path: str | PathLike[str], chat_id: int, file_id: str, message_id: int | None = None, data: dict | None = None, attachment_type: type[types.InputMedia] | None = None) -> RealCachedFile:
 		"""
@@ -539,9 +964,9 @@ class TeleCache:
 		:rtype: RealCachedFile
 		"""
 		
-		File = RealCachedFile(path, chat_id, file_id, message_id, data, attachment_type)	
-		self.__RealData[str(path)] = File
-		self.save()
+		Content = self.__GetContent(str(path)) if self.__Deduplication and os.path.exists(path) else None
+		File = self.__PutRealFile(path, chat_id, file_id, message_id, data, attachment_type, Content)
+		self.__Append([{"cache": "real", "record": File.to_dict()}])
 		
 		return File
 
@@ -554,8 +979,9 @@ class TeleCache:
 		:raise KeyError: Выбрасывается при отсутствии кэша файла по указанному пути.
 		"""
 
-		del self.__RealData[str(path)]
-		self.save()
+		if str(path) not in self.__RealData: raise KeyError(str(path))
+		self.__PopRealFile(str(path))
+		self.__Append([{"cache": "real", "remove": str(path)}])
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ РАБОТЫ С ВИРТУАЛЬНЫМИ ФАЙЛАМИ <<<<< #
@@ -582,11 +1008,11 @@ class TeleCache:
 
 		if not attachment_type: attachment_type = types.InputMediaDocument
 
-		if path not in self.__VirtualData.keys():
+		if identificator not in self.__VirtualData.keys():
 			Cache = self.__UploadFile(path, attachment_type)
 			self.register_virtual_file(identificator, self.__ChatID, Cache.file_id, Cache.message_id, data, Cache.file_type)
 
-		return self.__VirtualData[identificator]
+		return self.__GetVirtualFile(identificator)
 
 	def drop_virtual_cache(self):
 		"""Удаляет данные всех виртуальных кэшированных файлов."""
@@ -605,7 +1031,7 @@ class TeleCache:
 		:rtype: VirtualCachedFile
 		"""
 
-		return self.__VirtualData[identificator]
+		return self.__GetVirtualFile(identificator)
 	
 	def has_virtual_cache(self, identificator: str) -> bool:
 		"""
@@ -641,7 +1067,7 @@ class TeleCache:
 		
 		File = VirtualCachedFile(identificator, chat_id, file_id, message_id, data, attachment_type)	
 		self.__VirtualData[identificator] = File
-		self.save()
+		self.__Append([{"cache": "virtual", "record": File.to_dict()}])
 		
 		return File
 
@@ -655,4 +1081,4 @@ class TeleCache:
 		"""
 
 		del self.__VirtualData[identificator]
-		self.save()
\ No newline at end of file
+		self.__Append([{"cache": "virtual", "remove": identificator}])
\ No newline at end of file
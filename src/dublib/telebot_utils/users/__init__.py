@@ -0,0 +1,2061 @@
+import atexit
+import enum
+import functools
+import gzip
+import hashlib
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+from os import PathLike
+from pathlib import Path
+from threading import Lock, RLock, local
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
+from weakref import WeakValueDictionary
+
+import orjson
+from apscheduler.schedulers.background import BackgroundScheduler
+from more_itertools import chunked, divide
+from telebot import types
+
+from ...core import LOGS_HANDLER
+from ...exceptions import telebot_utils as Exceptions
+from ...functions.data import Copy, ToSequence
+from .changes import ChangeFeed as ChangeFeed
+from .changes import ChangeRecord as ChangeRecord
+from .codecs import BaseCodec as BaseCodec
+from .codecs import JSONCodec as JSONCodec
+from .codecs import MsgPackCodec as MsgPackCodec
+from .index import IndexRecord as IndexRecord
+from .index import UsersIndex as UsersIndex
+from .metrics import Histogram as Histogram
+from .metrics import Metrics as Metrics
+from .queue import SavingQueue as SavingQueue
+from .storages import BaseStorage as BaseStorage
+from .storages import JournalStorage as JournalStorage
+from .storages import JSONStorage as JSONStorage
+from .storages import SQLiteStorage as SQLiteStorage
+from .views import Freeze
+from .views import FrozenDict as FrozenDict
+from .views import FrozenList as FrozenList
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def ParseRecords(loader: Callable[[Sequence[int]], dict[int, dict]], users_id: Sequence[int]) -> dict[int, dict]:
+	"""
+	Считывает записи пользователей и разбирает время последней активности. Выполняется в дочерних процессах при параллельной загрузке, поэтому основному процессу передаются уже разобранные записи.
+
+	:param loader: Функция чтения записей хранилища.
+	:type loader: Callable[[Sequence[int]], dict[int, dict]]
+	:param users_id: Последовательность ID пользователей.
+	:type users_id: Sequence[int]
+	:return: Словарь записей, ключами которого являются ID пользователей.
+	:rtype: dict[int, dict]
+	"""
+
+	Records = loader(users_id)
+
+	for Record in Records.values():
+		if Record.get("last_activity"): Record["last_activity"] = IndexRecord.parse_last_activity(Record["last_activity"])
+
+	return Records
+
+#==========================================================================================#
+# >>>>> ОСНОВНЫЕ КЛАССЫ <<<<< #
+#==========================================================================================#
+
+class UserData:
+	"""
+	Объектное представление данных пользователя.
+
+	Изменяющие данные методы, чтение свойств и сохранение выполняются под реентерабельной блокировкой пользователя, поэтому объект может использоваться из нескольких потоков. Для атомарного выполнения последовательности операций следует удерживать блокировку `lock`.
+
+	Для экономии памяти объект не имеет словаря атрибутов, а поля записи хранятся в отдельных слотах. Наборы флагов и прав являются неизменяемыми множествами, общими для всех пользователей с одинаковым набором, а пустые словари свойств и прикреплённых объектов создаются только при первой записи.
+	"""
+
+	__slots__ = ("__Manager", "__ID", "__Lock", "__Username", "__Language", "__IsChatForbidden", "__IsPremium", "__ExpectedType", "__Permissions", "__LastActivity", "__Flags", "__Properties", "__Temp", "__Extra", "__Objects", "__SchemaVersion", "__SuppressSaving", "__DeltaHash", "__Version", "__SavedVersion", "__Size", "__SizeVersion", "__weakref__")
+
+	__Username: str | None
+	__Language: str | None
+	__IsChatForbidden: bool
+	__IsPremium: bool | None
+	__ExpectedType: str | None
+	__Permissions: frozenset[str]
+	__LastActivity: datetime | None
+	__Flags: frozenset[str]
+	__Properties: dict[str, Any] | None
+	__Temp: dict[str, Any] | None
+	__Extra: dict[str, Any] | None
+	__Objects: dict[str, Any] | None
+	__SchemaVersion: int
+
+	#==========================================================================================#
+	# >>>>> ДЕКОРАТОРЫ <<<<< #
+	#==========================================================================================#
+
+	@staticmethod
+	def synchronized(function):
+		"""
+		Декоратор. Выполняет метод под блокировкой пользователя.
+
+		:param function: Метод объекта.
+		"""
+
+		@functools.wraps(function)
+		def Wrapper(self: "UserData", *args, **kwargs):
+			with self.__Lock: return function(self, *args, **kwargs)
+
+		return Wrapper
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def last_activity(self) -> datetime | None:
+		"""Дата и время последней активности пользователя."""
+
+		return self.__LastActivity
+
+	@property
+	def expected_type(self) -> str | None:
+		"""Тип ожидаемого значения."""
+
+		return self.__ExpectedType
+
+	@property
+	def flags(self) -> tuple[str, ...]:
+		"""Набор активированных флагов."""
+
+		return tuple(sorted(self.__Flags))
+
+	@property
+	def id(self) -> int:
+		"""ID пользователя."""
+
+		return self.__ID
+
+	@property
+	def is_chat_forbidden(self) -> bool:
+		"""Состояние: может ли бот контактировать с пользователем."""
+		
+		return self.__IsChatForbidden
+
+	@property
+	def is_premium(self) -> bool | None:
+		"""Состояние: имеет ли пользователь Premium-подписку."""
+
+		return self.__IsPremium
+
+	@property
+	def language(self) -> str | None:
+		"""Код используемого клиентом языка по стандарту ISO 639-1."""
+
+		return self.__Language
+
+	@property
+	def permissions(self) -> tuple[str, ...]:
+		"""Список прав пользователя."""
+
+		return tuple(sorted(self.__Permissions))
+
+	@property
+	def username(self) -> str | None:
+		"""Ник пользователя."""
+
+		return self.__Username
+
+	#==========================================================================================#
+	# >>>>> НЕСЕРИАЛИЗУЕМЫЕ СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def lock(self) -> RLock:
+		"""Реентерабельная блокировка пользователя."""
+
+		return self.__Lock
+
+	@property
+	def is_saving_suppressed(self) -> bool:
+		"""Состояние: подавляется ли сохранение в локальный файл."""
+
+		return self.__SuppressSaving
+
+	@property
+	def objects(self) -> dict[str, Any]:
+		"""Словарь прикреплённых к пользователю объектов."""
+
+		return self.__GetObjects()
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу, в котором хранится запись пользователя."""
+
+		return self.__Manager.storage.get_path(self.__ID)
+
+	@property
+	def is_changed(self) -> bool:
+		"""Состояние: имеются ли несохранённые изменения."""
+
+		return self.__Version != self.__SavedVersion
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __CalculateHash(self) -> str:
+		"""
+		Вычисляет MD5 хэш JSON строки пользователя. Используется только для отладочной проверки отслеживания изменений.
+
+		:return: MD5 хэш.
+		:rtype: str
+		"""
+
+		Data = self.__ToSerializableDict()
+		Bytes = orjson.dumps(Data)
+
+		return hashlib.md5(Bytes).hexdigest()
+
+	def __Change(self):
+		"""Отмечает данные пользователя изменёнными и запускает сохранение."""
+
+		self.__Version += 1
+		self.save()
+
+	def __GetObjects(self) -> dict[str, Any]:
+		"""
+		Возвращает словарь прикреплённых объектов, создавая его при первом обращении.
+
+		:return: Словарь прикреплённых объектов.
+		:rtype: dict[str, Any]
+		"""
+
+		if self.__Objects is None: self.__Objects = {}
+
+		return self.__Objects
+
+	def __GetProperties(self, property_type: Literal["data", "temp"]) -> dict[str, Any]:
+		"""
+		Возвращает словарь свойств, создавая его при первом обращении.
+
+		:param property_type: Тип свойств.
+		:type property_type: Literal["data", "temp"]
+		:return: Словарь свойств.
+		:rtype: dict[str, Any]
+		"""
+
+		if property_type == "temp":
+			if self.__Temp is None: self.__Temp = {}
+			return self.__Temp
+
+		if self.__Properties is None: self.__Properties = {}
+
+		return self.__Properties
+
+	def __Load(self, record: dict) -> bool:
+		"""
+		Заполняет поля пользователя из считанной записи хранилища. Отсутствующие поля принимают значения по умолчанию, а неизвестные сохраняются без изменений. Запись устаревшей версии схемы предварительно обрабатывается миграциями менеджера, а пустая запись нового пользователя сразу получает текущую версию.
+
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		:return: Возвращает `True`, если к записи были применены миграции.
+		:rtype: bool
+		"""
+
+		Record = record.copy()
+		SchemaVersion = Record.pop("schema_version", 0) if Record else self.__Manager.schema_version
+		IsMigrated = SchemaVersion < self.__Manager.schema_version
+
+		if IsMigrated:
+			Record = self.__Manager.migrate_record(Record, SchemaVersion)
+			SchemaVersion = self.__Manager.schema_version
+
+		LastActivity = Record.pop("last_activity", None)
+
+		self.__Username = Record.pop("username", None)
+		self.__Language = Record.pop("language", None)
+		self.__IsChatForbidden = Record.pop("is_chat_forbidden", False)
+		self.__IsPremium = Record.pop("is_premium", None)
+		self.__ExpectedType = Record.pop("expected_type", None)
+		self.__Permissions = self.__Manager.intern_flags(Record.pop("permissions", None) or ())
+		self.__LastActivity = IndexRecord.parse_last_activity(LastActivity) if LastActivity else None
+		self.__Flags = self.__Manager.intern_flags(Record.pop("flags", None) or ())
+		self.__Properties = Record.pop("data", None) or None
+		self.__Temp = Record.pop("temp", None) or None
+		self.__Extra = Record or None
+		self.__SchemaVersion = SchemaVersion
+
+		return IsMigrated
+
+	def __Notify(self, field: str, old: Any, new: Any, key: str | None = None):
+		"""
+		Передаёт запись об изменении в ленту изменений менеджера, если она включена.
+
+		:param field: Изменённое поле.
+		:type field: str
+		:param old: Прежнее значение.
+		:type old: Any
+		:param new: Новое значение.
+		:type new: Any
+		:param key: Ключ свойства.
+		:type key: str | None
+		"""
+
+		Feed = self.__Manager.change_feed
+		if Feed is not None: Feed.emit(self.__ID, field, old, new, key)
+
+	def __SetProperty(self, property_type: Literal["data", "temp"], key: str, value: Any):
+		"""
+		Задаёт свойство пользователя.
+
+		:param property_type: Тип свойства.
+		:type property_type: Literal["data", "temp"]
+		:param key: Ключ, под который помещаются данные.
+		:type key: str
+		:param value: Сохраняемые данные. Для изменяемых типов и представлений создаётся глубокая копия.
+		:type value: Any
+		"""
+
+		Properties = self.__GetProperties(property_type)
+		if type(value) in (dict, list): value = Copy(value)
+		elif isinstance(value, (FrozenDict, FrozenList)): value = value.copy()
+		if key in Properties and Properties[key] == value: return
+		self.__Notify(property_type, Properties.get(key), value, key)
+		Properties[key] = value
+		self.__Change()
+
+	def __ToIndexRecord(self) -> IndexRecord:
+		"""
+		Строит индексную запись пользователя. Множества флагов и прав передаются индексу без копирования.
+
+		:return: Индексная запись.
+		:rtype: IndexRecord
+		"""
+
+		return IndexRecord(self.__ID, self.__LastActivity, self.__IsPremium, self.__IsChatForbidden, self.__Language, self.__Flags, self.__Permissions)
+
+	def __ToSerializableDict(self) -> dict:
+		"""
+		Приводит объект к сериализуемому словарю.
+
+		:return: Сериализуемый словарь.
+		:rtype: dict
+		"""
+
+		Data: dict[str, Any] = {
+			"username": self.__Username,
+			"language": self.__Language,
+			"is_chat_forbidden": self.__IsChatForbidden,
+			"is_premium": self.__IsPremium,
+			"expected_type": self.__ExpectedType,
+			"permissions": sorted(self.__Permissions),
+			"last_activity": self.__LastActivity.strftime("%Y-%m-%d %H:%M") if self.__LastActivity else None,
+			"flags": sorted(self.__Flags),
+			"data": self.__Properties or {},
+			"temp": self.__Temp or {}
+		}
+		if self.__Extra: Data.update(self.__Extra)
+		if self.__SchemaVersion: Data["schema_version"] = self.__SchemaVersion
+
+		return Data
+
+	def __UpdateFlags(self, current: frozenset[str], flags: Sequence[str] | str, is_adding: bool) -> frozenset[str]:
+		"""
+		Вычисляет новый набор флаговых переключателей. Так как наборы разделяются между пользователями, при отсутствии изменений возвращается исходный объект.
+
+		:param current: Текущий набор.
+		:type current: frozenset[str]
+		:param flags: Набор флагов или конкретный флаг.
+		:type flags: Sequence[str] | str
+		:param is_adding: Указывает, добавляются ли флаги или удаляются.
+		:type is_adding: bool
+		:return: Новый набор.
+		:rtype: frozenset[str]
+		"""
+
+		Flags = ToSequence(flags)
+		Result = current.union(Flags) if is_adding else current.difference(Flags)
+
+		return self.__Manager.intern_flags(Result) if Result != current else current
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, manager: "UsersManager", user_id: int, record: dict | None = None):
+		"""
+		Данные пользователя.
+
+		:param manager: Менеджер пользователей.
+		:type manager: UsersManager
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Заранее считанная из хранилища запись пользователя. Если не передана, запись будет считана из хранилища или создана.
+		:type record: dict | None
+		"""
+
+		self.__Manager = manager
+		self.__ID = user_id
+		self.__Lock = RLock()
+
+		self.__Objects = None
+		self.__SuppressSaving = False
+		self.__DeltaHash: str | None = None
+		self.__Version = 0
+		self.__SavedVersion = -1
+		self.__Size = 0
+		self.__SizeVersion = -1
+
+		if record is not None:
+			IsMigrated = self.__Load(record)
+			self.__SavedVersion = self.__Version
+			# Мигрированная запись отмечается изменённой, чтобы менеджер записал её в хранилище.
+			if IsMigrated: self.__Version += 1
+			if self.__Manager.is_hash_verification_enabled: self.__DeltaHash = self.__CalculateHash()
+			self.__Manager.index.update(self.__ToIndexRecord())
+
+		else:
+			self.__Load({})
+			try: self.refresh()
+			except KeyError: self.save()
+
+	def __repr__(self) -> str:
+		"""
+		Репрезентует объект в строковое представление.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return self.__str__()
+
+	def __str__(self) -> str:
+		"""
+		Преобразует объект в строковое представление.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return f"User<{self.__ID}, {self.username}>"
+
+	@synchronized
+	def add_flags(self, flags: Sequence[str] | str):
+		"""
+		Добавляет флаги пользователю.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		Flags = self.__UpdateFlags(self.__Flags, flags, True)
+
+		if Flags is not self.__Flags:
+			self.__Notify("flags", self.__Flags, Flags)
+			self.__Flags = Flags
+			self.__Change()
+
+	@synchronized
+	def add_permissions(self, permissions: Sequence[str] | str):
+		"""
+		Добавляет права пользователю.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		Permissions = self.__UpdateFlags(self.__Permissions, permissions, True)
+
+		if Permissions is not self.__Permissions:
+			self.__Notify("permissions", self.__Permissions, Permissions)
+			self.__Permissions = Permissions
+			self.__Change()
+
+	@synchronized
+	def attach_object(self, key: str, custom_object: Any, force: bool = True):
+		"""
+		Прикрепляет объект к пользователю. При перезапуске объект будет удалён.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:param custom_object: Прикрепляемый объект.
+		:type custom_object: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующий объект.
+		:type force: bool
+		"""
+		
+		Objects = self.__GetObjects()
+		if key not in Objects or force: Objects[key] = custom_object
+
+	def check_flags(self, flags: Sequence[str] | str) -> bool:
+		"""
+		Проверяет, активированы ли для пользователя указанные флаги.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		:return: Возвращает `True`, если все флаги активированы.
+		:rtype: bool
+		"""
+
+		Flags = ToSequence(flags)
+
+		for Flag in Flags:
+			if Flag not in self.__Flags: return False
+
+		return True
+
+	@synchronized
+	def clear_temp_properties(self):
+		"""Очищает временные свойства пользователя."""
+
+		if not self.__Temp: return
+		self.__Notify("temp", self.__Temp, None)
+		self.__Temp = None
+		self.__Change()
+
+	@synchronized
+	def estimate_size(self) -> int:
+		"""
+		Оценивает размер данных пользователя по длине сериализованной записи. Значение кэшируется и пересчитывается только после изменений.
+
+		:return: Оценочный размер в байтах.
+		:rtype: int
+		"""
+
+		if self.__SizeVersion != self.__Version:
+			self.__Size = len(orjson.dumps(self.__ToSerializableDict()))
+			self.__SizeVersion = self.__Version
+
+		return self.__Size
+
+	def get_object(self, key: str) -> Any:
+		"""
+		Возвращает объект, прикреплённый к пользователю.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:raise KeyError: Выбрасывается при отсутствии объекта с переданным ключом.
+		:return: Прикреплённый объект.
+		:rtype: Any
+		"""
+
+		return self.__GetObjects()[key]
+
+	@synchronized
+	def get_property(self, key: str, copy: bool = True, view: bool = False) -> Any:
+		"""
+		Возвращает значение свойства пользователя. При наличии одинакового ключа в постоянных и временных свойствах, приоритет отдаётся временному.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param copy: Указывает, нужно ли создавать копию ссылочных объектов для защиты данных. Не рекомендуется отключать, если свойство будет изменяться. Изменения полученного без копирования объекта не отслеживаются и требуют вызова `mark_as_changed()`.
+		:type copy: bool
+		:param view: Указывает, нужно ли вместо копии вернуть для словарей и списков представление только для чтения (`FrozenDict` или `FrozenList`), не требующее копирования данных. Методы пользователя не изменяют значения свойств на месте, а заменяют их, поэтому полученное представление остаётся согласованным. Изменяемую копию можно получить методом представления `copy()`. Имеет приоритет над параметром `copy`.
+		:type view: bool
+		:raises KeyError: Выбрасывается при отсутствии свойства с переданным ключом.
+		:return: Значение свойства.
+		:rtype: Any
+		"""
+
+		Data = None
+
+		if self.__Temp and key in self.__Temp: Data = self.__Temp[key]
+		else: Data = (self.__Properties or {})[key]
+
+		if view: return Freeze(Data)
+		# Для изменяемых объектов создание копии через сериализацию (быстрее глубокого копирования).
+		if copy and type(Data) in (dict, list): Data = Copy(Data)
+
+		return Data
+
+	def has_permissions(self, permissions: Sequence[str] | str) -> bool:
+		"""
+		Проверяет, имеет ли пользователь все указанные права.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		:return: Возвращает `True`, если пользователь имеет все указанные права.
+		:rtype: bool
+		"""
+
+		Permissions = ToSequence(permissions)
+
+		for Permission in Permissions:
+			if Permission not in self.__Permissions: return False
+
+		return True
+	
+	def has_object(self, key: str) -> bool:
+		"""
+		Проверяет, прикреплён ли к пользователю объект с переданным ключом.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:return: Возвращает `True`, если объект с таким ключом найден.
+		:rtype: bool
+		"""
+
+		return bool(self.__Objects) and key in self.__GetObjects()
+
+	def has_property(self, key: str) -> bool:
+		"""
+		Проверяет, имеется ли у пользователя свойство с указанным ключом.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:return: Возвращает `True`, если свойство с таким ключом найдено.
+		:rtype: bool
+		"""
+
+		if self.__Properties and key in self.__Properties or self.__Temp and key in self.__Temp: return True
+
+		return False 
+
+	@synchronized
+	def mark_as_changed(self):
+		"""Отмечает данные пользователя изменёнными. Необходимо вызвать перед сохранением, если данные изменялись напрямую, например через полученное без копирования свойство."""
+
+		self.__Version += 1
+
+	@synchronized
+	def migrate(self) -> bool:
+		"""
+		Применяет к данным пользователя миграции, зарегистрированные после их загрузки, и сохраняет результат.
+
+		:return: Возвращает `True`, если данные были мигрированы.
+		:rtype: bool
+		"""
+
+		if self.__SchemaVersion >= self.__Manager.schema_version: return False
+		self.__Load(self.__ToSerializableDict())
+		self.__Change()
+
+		return True
+
+	@synchronized
+	def refresh(self):
+		"""
+		Считывает запись пользователя из хранилища и дополняет отсутствующие поля. Запись устаревшей версии схемы мигрируется и сохраняется.
+
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя в хранилище.
+		:raise RefreshingBlocked: Выбрасывается при попытке чтения записи пользователя во время подавления сохранений.
+		"""
+
+		if self.__SuppressSaving: raise Exceptions.RefreshingBlocked()
+		Metrics = self.__Manager.metrics
+		Start = time.perf_counter() if Metrics else 0.0
+		IsMigrated = self.__Load(self.__Manager.storage.load(self.__ID))
+		if Metrics: Metrics.observe("refresh_seconds", time.perf_counter() - Start)
+		self.__Version += 1
+		self.__SavedVersion = self.__Version
+		if self.__Manager.is_hash_verification_enabled: self.__DeltaHash = self.__CalculateHash()
+		self.__Manager.index.update(self.__ToIndexRecord())
+		if IsMigrated: self.__Change()
+
+	@synchronized
+	def remove_object(self, key: str):
+		"""
+		Удаляет прикреплённый объект.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:raise KeyError: Выбрасывается, если объект с указанным ключом не найден.
+		"""
+
+		del self.__GetObjects()[key]
+
+	@synchronized
+	def remove_flags(self, flags: Sequence[str] | str):
+		"""
+		Удаляет флаги.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		Flags = self.__UpdateFlags(self.__Flags, flags, False)
+
+		if Flags is not self.__Flags:
+			self.__Notify("flags", self.__Flags, Flags)
+			self.__Flags = Flags
+			self.__Change()
+
+	@synchronized
+	def remove_permissions(self, permissions: Sequence[str] | str):
+		"""
+		Удаляет права.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		Permissions = self.__UpdateFlags(self.__Permissions, permissions, False)
+
+		if Permissions is not self.__Permissions:
+			self.__Notify("permissions", self.__Permissions, Permissions)
+			self.__Permissions = Permissions
+			self.__Change()
+
+	@synchronized
+	def remove_property(self, key: str):
+		"""
+		Удаляет свойство пользователя. При поиске приоритет отдаётся постоянным свойствам, затем поиск осуществляется среди временных.
+
+		:param key: Ключ свойства.
+		:type key: str
+		"""
+
+		IsChanged = False
+
+		if self.__Properties and key in self.__Properties:
+			self.__Notify("data", self.__Properties.pop(key), None, key)
+			IsChanged = True
+
+		elif self.__Temp and key in self.__Temp:
+			self.__Notify("temp", self.__Temp.pop(key), None, key)
+			IsChanged = True
+
+		if IsChanged: self.__Change()
+
+	@synchronized
+	def reset_expected_type(self):
+		"""Сбрасывает ожидаемый тип к значению `None`."""
+
+		if self.__ExpectedType is None: return
+		self.__Notify("expected_type", self.__ExpectedType, None)
+		self.__ExpectedType = None
+		self.__Change()
+
+	@synchronized
+	def save(self, use_queue: bool = True):
+		"""
+		Записывает данные пользователя в хранилище.
+
+		Если данные с момента прошлого сохранения не изменены, сохранение будет пропущено. Изменения отслеживаются счётчиком версий, поэтому проверка не требует сериализации данных. Внутри контекста `UsersManager.batch()` сохранение откладывается до выхода из него.
+
+		:param use_queue: Указывает, помещать ли задачу в очередь, если доступна, или выполнить сохранение немедленно.
+		:type use_queue: bool
+		"""
+
+		IsVerificationRequired = self.__Manager.is_hash_verification_enabled and self.__DeltaHash and not self.__SuppressSaving
+
+		if IsVerificationRequired and self.__Version == self.__SavedVersion and self.__DeltaHash != self.__CalculateHash():
+			LOGGER.warning(f"{self} has untracked changes. Use mark_as_changed() after direct data modifications.")
+			self.__Version += 1
+
+		if self.__SuppressSaving or self.__Version == self.__SavedVersion:
+			LOGGER.debug(f"{self} data saving skipped.")
+			return
+
+		if self.__Manager.defer_saving(self): return
+		self.__Manager.index.update(self.__ToIndexRecord())
+
+		if self.__Manager.is_saving_queue_enabled and use_queue:
+			self.__Manager.push_to_saving_queue(self)
+			return
+
+		Version = self.__Version
+		self.__Manager.write_record(self.__ID, self.__ToSerializableDict())
+		self.__SavedVersion = Version
+		if self.__Manager.is_hash_verification_enabled: self.__DeltaHash = self.__CalculateHash()
+
+	@synchronized
+	def set_chat_forbidden(self, status: bool):
+		"""
+		Задаёт состояние: может ли бот контактировать с пользователем.
+
+		:param status: Состояние.
+		:type status: bool
+		"""
+
+		if self.__IsChatForbidden == status: return
+		self.__Notify("is_chat_forbidden", self.__IsChatForbidden, status)
+		self.__IsChatForbidden = status
+		self.__Change()
+
+	@synchronized
+	def set_expected_type(self, expected_type: str | enum.Enum | None):
+		"""
+		Задаёт ожидаемый тип данных.
+
+		:param expected_type: Ожидаемый от пользователя тип данных. При указании элемента перечисления берётся его значение.
+		:type expected_type: str | Enum | None
+		"""
+
+		ExpectedType = expected_type.value if isinstance(expected_type, enum.Enum) else expected_type
+		if self.__ExpectedType == ExpectedType: return
+		self.__Notify("expected_type", self.__ExpectedType, ExpectedType)
+		self.__ExpectedType = ExpectedType
+		self.__Change()
+
+	@synchronized
+	def set_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт значение свойства пользователя.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+		
+		if force or not self.__Properties or key not in self.__Properties: self.__SetProperty("data", key, value)
+
+	@synchronized
+	def set_temp_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт временное значение свойства пользователя.
+
+		Временные значения могут служить для поэтапного ввода данных или непродолжительного хранения информации. Как правило их следует очищать методом `clear_temp_properties()`.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+		
+		if force or not self.__Temp or key not in self.__Temp: self.__SetProperty("temp", key, value)
+
+	@synchronized
+	def suppress_saving(self, status: bool, save_on_disabling: bool = True):
+		"""
+		Подавляет сохранение в локальный файл.
+		
+		Следует использовать для оптимизации при множественных изменениях. Во время подавления недоступен вызов метода `refresh()`.
+
+		:param status: Статус подавления.
+		:type status: bool
+		:param save_on_disabling: Указывает, следует ли выполнить обязательное сохранение после отключения подавления. Игнорируется при включении подавления.
+		:type save_on_disabling: bool
+		"""
+
+		self.__SuppressSaving = status
+		if not status and save_on_disabling: self.save()
+
+	@synchronized
+	def update(self, user: types.User, is_chat_forbidden: bool | None = None):
+		"""
+		Обновляет данные пользователя (язык, наличие подписки, ник) из его структуры Telegram.
+
+		:param user: Объект представления пользователя.
+		:type user: telebot.types.User
+		:param is_chat_forbidden: Указывает, заблокировал ли пользователь бота.
+		:type is_chat_forbidden: bool | None
+		:raises IncorrectUserToUpdate: Выбрасывается при передаче несоответствующей по ID структуры пользователя.
+		"""
+
+		if user.id != self.__ID: raise Exceptions.IncorrectUserToUpdate(self.__ID, user.id)
+
+		if is_chat_forbidden is None: is_chat_forbidden = self.__IsChatForbidden
+		Fields = (is_chat_forbidden, bool(user.is_premium), user.language_code, user.username)
+		CurrentFields = (self.__IsChatForbidden, self.__IsPremium, self.__Language, self.__Username)
+		if Fields == CurrentFields: return
+
+		for Field, Old, New in zip(("is_chat_forbidden", "is_premium", "language", "username"), CurrentFields, Fields):
+			if Old != New: self.__Notify(Field, Old, New)
+
+		self.__IsChatForbidden, self.__IsPremium, self.__Language, self.__Username = Fields
+		self.__Change()
+
+	@synchronized
+	def update_acitivity(self) -> datetime:
+		"""
+		Обновляет дату и время последней активности пользователя.
+
+		Так как активность сохраняется с точностью до минуты, повторное обновление в пределах той же минуты не приводит к сохранению.
+
+		:return: Дата и время последней активности пользователя.
+		:rtype: datetime
+		"""
+
+		Now = datetime.now()
+		LastActivity = self.__LastActivity
+		self.__LastActivity = Now
+
+		if not LastActivity or LastActivity.replace(second = 0, microsecond = 0) != Now.replace(second = 0, microsecond = 0):
+			self.__Notify("last_activity", LastActivity, Now)
+			self.__Change()
+
+		return Now
+
+class UsersManager:
+	"""
+	Менеджер пользователей.
+
+	Модель конкурентного доступа: резидентный набор, реестр существующих объектов данных, список выгруженных пользователей и учёт размеров защищены блокировкой менеджера, которая удерживается только на время операций с этими структурами. Чтение из хранилища, сохранение вытесняемых и выгружаемых пользователей выполняются вне её. Данные каждого пользователя защищены его собственной блокировкой (`UserData.lock`), поэтому обработчики в разных потоках работают с разными пользователями параллельно.
+
+	Под блокировкой менеджера блокировки пользователей никогда не захватываются, поэтому обработчик может обращаться к менеджеру, удерживая блокировку пользователя. При необходимости удерживать блокировки нескольких пользователей одновременно их следует захватывать в порядке возрастания ID, как это делает очередь сохранений.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def change_feed(self) -> ChangeFeed | None:
+		"""Лента изменений данных пользователей или `None`, если она отключена."""
+
+		return self.__ChangeFeed
+
+	@property
+	def codec(self) -> BaseCodec:
+		"""Кодек записей пользователей."""
+
+		return self.__Codec
+
+	@property
+	def index(self) -> UsersIndex:
+		"""Вторичный индекс метаданных пользователей, позволяющий выполнять запросы без загрузки данных."""
+
+		return self.__Index
+
+	@property
+	def metrics(self) -> Metrics | None:
+		"""Метрики работы менеджера или `None`, если они отключены."""
+
+		return self.__Metrics
+
+	@property
+	def premium_users(self) -> tuple[UserData, ...]:
+		"""Последовательность пользователей с Premium-подпиской из числа хранящихся в памяти."""
+
+		PremiumUsersID = self.__Index.find(is_premium = True)
+		with self.__Lock: return tuple(User for User in map(self.__Users.get, PremiumUsersID) if User)
+
+	@property
+	def resident_size(self) -> int:
+		"""Оценочный суммарный размер данных хранящихся в памяти пользователей в байтах. Учитывается только при заданном ограничении размера резидентного набора."""
+
+		return self.__ResidentSize
+
+	@property
+	def schema_version(self) -> int:
+		"""Текущая версия схемы записей пользователей, равная наибольшей версии зарегистрированных миграций, или 0."""
+
+		return self.__SchemaVersion
+
+	@property
+	def storage(self) -> BaseStorage:
+		"""Хранилище записей пользователей."""
+
+		return self.__Storage
+
+	@property
+	def storage_directory(self) -> Path:
+		"""Путь к каталогу файлов пользователей."""
+
+		return self.__StorageDirectory
+
+	@property
+	def unloaded_users_id(self) -> tuple[int, ...]:
+		"""Последовательность ID выгруженных из памяти пользователей."""
+
+		with self.__Lock: return tuple(self.__Unloaded)
+
+	@property
+	def users(self) -> tuple[UserData, ...]:
+		"""Последовательность хранящихся в памяти пользователей."""
+
+		with self.__Lock: return tuple(self.__Users.values())
+
+	#==========================================================================================#
+	# >>>>> ЛОГИЧЕСКИЕ ПЕРЕКЛЮЧАТЕЛИ <<<<< #
+	#==========================================================================================#
+
+	@property
+	def is_atomic_writes(self) -> bool:
+		"""Состояние: используется ли атомарная запись."""
+
+		return self.__IsAtomicWrites
+
+	@property
+	def is_hash_verification_enabled(self) -> bool:
+		"""Состояние: проверяется ли отслеживание изменений пользователей сравнением хэшей."""
+
+		return self.__IsHashVerification
+
+	@property
+	def is_lazy_loading_enabled(self) -> bool:
+		"""Состояние: загружаются ли пользователи в память только по запросу."""
+
+		return self.__IsLazyLoading
+
+	@property
+	def is_pretty_saving_enabled(self) -> bool:
+		"""Состояние: форматировать ли локальные файлы отступами."""
+
+		return self.__IsPrettySaving
+	
+	@property
+	def is_saving_queue_enabled(self) -> bool:
+		"""Состояние: используется ли очередь сохранений."""
+
+		return self.__SavingQueue is not None and not self.__SavingQueue.is_closed
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	@contextmanager
+	def __CollectWrites(self) -> Iterator[None]:
+		"""Откладывает выполняемые в текущем потоке записи пользователей и по завершении передаёт их хранилищу одним пакетом."""
+
+		if hasattr(self.__Collector, "records"):
+			yield
+			return
+
+		self.__Collector.records = {}
+
+		try:
+			yield
+			Records = self.__Collector.records
+
+		finally: del self.__Collector.records
+
+		Start = time.perf_counter()
+		self.__Storage.save_many(Records)
+		if self.__Metrics: self.__Metrics.observe("batch_save_seconds", time.perf_counter() - Start)
+
+	def __CreateUsers(self, records: dict[int, dict]) -> list[UserData]:
+		"""
+		Строит объекты данных пользователей по считанным записям. Индексные записи добавляются одним пакетом до разбора записей. Записи, к которым были применены миграции, сохраняются одной пакетной записью.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict]
+		:return: Список данных пользователей.
+		:rtype: list[UserData]
+		"""
+
+		self.__Index.update_many(IndexRecord.from_record(UserID, Record) for UserID, Record in records.items())
+		Users = [UserData(self, UserID, Record) for UserID, Record in records.items()]
+		# Изменёнными после создания могут быть только мигрированные пользователи.
+		MigratedUsers = [User for User in Users if User.is_changed]
+		if MigratedUsers: self.__SaveUsers(MigratedUsers)
+
+		return Users
+
+	def __Evict(self) -> list[UserData]:
+		"""
+		Удаляет из резидентного набора наиболее давно запрошенных пользователей, пока превышены его ограничения. Вызывается под блокировкой менеджера, сохранение вытесненных пользователей выполняется вызывающим после её освобождения.
+
+		:return: Список вытесненных пользователей.
+		:rtype: list[UserData]
+		"""
+
+		Victims = []
+		Attempts = len(self.__Users)
+
+		while len(self.__Users) > 1 and Attempts and self.__IsResidentLimitExceeded():
+			Attempts -= 1
+			UserID, User = next(iter(self.__Users.items()))
+
+			if User.is_saving_suppressed:
+				self.__Users.move_to_end(UserID)
+				continue
+
+			Victims.append(self.__Forget(UserID))
+
+		return Victims
+
+	def __Forget(self, user_id: int) -> UserData:
+		"""
+		Удаляет пользователя из резидентного набора без сохранения.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии пользователя в памяти.
+		:return: Данные удалённого пользователя.
+		:rtype: UserData
+		"""
+
+		User = self.__Users.pop(user_id)
+		self.__ResidentSize -= self.__ResidentSizes.pop(user_id, 0)
+
+		return User
+
+	def __ImportRecords(self, records: dict[int, dict]):
+		"""
+		Записывает импортируемые записи в хранилище одним пакетом и обновляет метаданные. Существующие объекты данных пользователей на время записи блокируются в порядке возрастания ID, а затем перечитываются, поэтому их несохранённые изменения не перезапишут импортированные данные. Вне режима ленивой загрузки новые пользователи добавляются в резидентный набор.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict]
+		"""
+
+		self.__Index.update_many(IndexRecord.from_record(UserID, Record) for UserID, Record in records.items())
+
+		with self.__Lock:
+			Users = sorted((User for User in map(self.__Live.get, records) if User), key = lambda User: User.id)
+
+			for UserID in records.keys() & self.__Unloaded.keys(): self.__Unloaded[UserID] = IndexRecord.from_record(UserID, records[UserID])
+
+		with ExitStack() as Stack:
+			for User in Users: Stack.enter_context(User.lock)
+			self.__Storage.save_many(records)
+
+			for User in Users:
+				try: User.refresh()
+				except Exceptions.RefreshingBlocked: LOGGER.warning(f"{User} saving suppressed. Imported data will be overwritten.")
+
+		if self.__IsLazyLoading: return
+		with self.__Lock: MissingUsersID = [UserID for UserID in records if UserID not in self.__Live and UserID not in self.__Unloaded]
+		for User in self.__LoadUsers(MissingUsersID): self.__Touch(User)
+
+	def __IsResidentLimitExceeded(self) -> bool:
+		"""
+		Проверяет, превышены ли ограничения резидентного набора.
+
+		:return: Возвращает `True`, если превышено ограничение по количеству пользователей или по оценочному размеру.
+		:rtype: bool
+		"""
+
+		if self.__MaxResidentUsers and len(self.__Users) > self.__MaxResidentUsers: return True
+		if self.__MaxResidentSize and self.__ResidentSize > self.__MaxResidentSize: return True
+
+		return False
+
+	def __LoadUsers(self, users_id: Sequence[int]) -> list[UserData]:
+		"""
+		Загружает данные пользователей для списка ID. Для уже существующих объектов данных возвращаются они же. Резидентный набор не изменяется.
+
+		Запись пользователя считывается из хранилища только при отсутствии его объекта данных, а значит и выполняемых им сохранений. Проверка и чтение защищены блокировками загрузки, также захватываемыми при создании новых пользователей.
+
+		:param users_id: Последовательность ID пользователей.
+		:type users_id: Sequence[int]
+		:return: Список данных пользователей.
+		:rtype: list[UserData]
+		"""
+
+		Stripes = sorted({UserID % len(self.__LoadingLocks) for UserID in users_id})
+
+		with ExitStack() as Stack:
+			for Stripe in Stripes: Stack.enter_context(self.__LoadingLocks[Stripe])
+
+			with self.__Lock:
+				Users = [User for User in map(self.__Live.get, users_id) if User]
+				MissingUsersID = [UserID for UserID in users_id if UserID not in self.__Live]
+
+			if self.__Metrics:
+				self.__Metrics.increment("cache_hits_total", len(Users))
+				self.__Metrics.increment("cache_misses_total", len(MissingUsersID))
+
+			LoadedUsers = self.__CreateUsers(self.__Storage.load_many(MissingUsersID)) if MissingUsersID else []
+
+			with self.__Lock: Users += [self.__Live.setdefault(User.id, User) for User in LoadedUsers]
+
+		return Users
+
+	def __ProcessSavingQueue(self, users: tuple[UserData, ...]):
+		"""
+		Сохраняет пакет пользователей из очереди сохранений одной пакетной записью в хранилище.
+
+		Блокировки пользователей удерживаются до завершения пакетной записи, чтобы выполненное в это время прямое сохранение не было перезаписано более старыми данными пакета. Блокировки захватываются в порядке возрастания ID.
+
+		:param users: Последовательность данных пользователей.
+		:type users: tuple[UserData, ...]
+		"""
+
+		with ExitStack() as Stack:
+			for User in sorted(users, key = lambda User: User.id): Stack.enter_context(User.lock)
+
+			try:
+				with self.__CollectWrites():
+					for User in users: User.save(use_queue = False)
+
+			except Exception:
+				# Изменения остаются несохранёнными и будут записаны при повторной попытке очереди.
+				for User in users: User.mark_as_changed()
+				raise
+
+	def __ReadRecords(self, threads: int, processes: bool) -> dict[int, dict]:
+		"""
+		Считывает записи всех пользователей хранилища.
+
+		:param threads: Число потоков или процессов, использующихся для чтения.
+		:type threads: int
+		:param processes: Указывает, нужно ли выполнять чтение и разбор записей в пуле процессов. Игнорируется, если хранилище не поддерживает чтение из дочерних процессов.
+		:type processes: bool
+		:return: Словарь записей, ключами которого являются ID пользователей.
+		:rtype: dict[int, dict]
+		"""
+
+		UsersID = self.__Storage.get_users_id()
+		Loader = self.__Storage.get_loader() if processes else None
+
+		if Loader:
+			# Небольшие пакеты равномерно распределяют работу между процессами.
+			Chunks = tuple(chunked(UsersID, 1000))
+			with ProcessPoolExecutor(max_workers = threads) as Executor: Parts = tuple(Executor.map(functools.partial(ParseRecords, Loader), Chunks))
+
+		else:
+			Segments = tuple(tuple(Element) for Element in divide(threads, UsersID))
+			with ThreadPoolExecutor(max_workers = threads) as Executor: Parts = tuple(Executor.map(self.__Storage.load_many, Segments))
+
+		return {UserID: Record for Records in Parts for UserID, Record in Records.items()}
+
+	def __RecountResidentSize(self):
+		"""Пересчитывает оценочный размер резидентного набора и применяет его ограничения. Не должен вызываться под блокировкой менеджера."""
+
+		Sizes = {User.id: User.estimate_size() for User in self.users} if self.__MaxResidentSize else {}
+
+		with self.__Lock:
+			self.__ResidentSizes.clear()
+			self.__ResidentSizes.update({UserID: Size for UserID, Size in Sizes.items() if UserID in self.__Users})
+			self.__ResidentSize = sum(self.__ResidentSizes.values())
+			Victims = self.__Evict()
+
+		self.__SaveEvicted(Victims)
+
+	def __SaveBatch(self, users: Sequence[UserData], threads: int):
+		"""
+		Сохраняет пользователей пакетными записями в хранилище.
+
+		:param users: Последовательность данных пользователей.
+		:type users: Sequence[UserData]
+		:param threads: Количество потоков, между которыми распределяются пользователи. Каждый поток выполняет собственную пакетную запись.
+		:type threads: int
+		"""
+
+		if threads < 2:
+			self.__SaveUsers(users)
+			return
+
+		Segments = tuple(tuple(Element) for Element in divide(threads, users))
+		with ThreadPoolExecutor(max_workers = threads) as Executor: tuple(Executor.map(self.__SaveUsers, Segments))
+
+	def __SaveEvicted(self, users: Sequence[UserData]):
+		"""
+		Сохраняет вытесненных из резидентного набора пользователей.
+
+		:param users: Последовательность данных пользователей.
+		:type users: Sequence[UserData]
+		"""
+
+		for User in users:
+			User.save(use_queue = False)
+			LOGGER.debug(f"{User} evicted from memory.")
+
+	def __SaveUsers(self, users: Sequence[UserData]):
+		"""
+		Сохраняет пользователей одной пакетной записью в хранилище.
+
+		:param users: Последовательность данных пользователей.
+		:type users: Sequence[UserData]
+		"""
+
+		with self.__CollectWrites():
+			for User in users: User.save(use_queue = False)
+
+	def __Touch(self, user: UserData):
+		"""
+		Помещает пользователя в конец очереди вытеснения резидентного набора и применяет его ограничения. Не должен вызываться под блокировкой менеджера.
+
+		:param user: Данные пользователя.
+		:type user: UserData
+		"""
+
+		Size = user.estimate_size() if self.__MaxResidentSize else 0
+
+		with self.__Lock:
+			self.__Users[user.id] = user
+			self.__Users.move_to_end(user.id)
+			self.__Unloaded.pop(user.id, None)
+
+			if self.__MaxResidentSize:
+				self.__ResidentSize += Size - self.__ResidentSizes.get(user.id, 0)
+				self.__ResidentSizes[user.id] = Size
+
+			Victims = self.__Evict()
+
+		self.__SaveEvicted(Victims)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, storage_directory: str | PathLike[str], threads: int = 1, storage: BaseStorage | None = None, lazy: bool = False, processes: bool = False, migrations: dict[int, Callable[[dict], dict]] | None = None):
+		"""
+		Менеджер пользователей.
+
+		:param storage_directory: Путь к каталог файлов пользователей. Директория создаётся автоматически.
+		:type storage_directory: str | PathLike[str]
+		:param threads: Число потоков, использующихся для операций чтения при инициализации менеджера. По умолчанию 1.
+		:type threads: int
+		:param storage: Хранилище записей пользователей. По умолчанию используется `JSONStorage`, размещающее каждого пользователя в отдельном файле внутри каталога менеджера.
+		:type storage: BaseStorage | None
+		:param lazy: Включает ленивую загрузку: при инициализации пользователи не считываются, а загружаются в память только при запросе через `get_user()` или `auth()`. Массовые операции в этом режиме затрагивают только хранящихся в памяти пользователей. Индекс метаданных восстанавливается из файла и журнала изменений, а при их отсутствии перестраивается чтением всех записей хранилища.
+		:type lazy: bool
+		:param processes: Переключает чтение и разбор записей при инициализации в пул из `threads` процессов. Игнорируется в режиме ленивой загрузки. По умолчанию отключено.
+		:type processes: bool
+		:param migrations: Словарь миграций схемы записей, ключами которого являются версии. Миграции регистрируются до загрузки пользователей, поэтому применяются уже при инициализации. Подробнее в `register_migration()`.
+		:type migrations: dict[int, Callable[[dict], dict]] | None
+		"""
+
+		self.__StorageDirectory = Path(storage_directory)
+		self.__Storage = storage or JSONStorage()
+		self.__Lock = RLock()
+		self.__LoadingLocks = tuple(Lock() for _ in range(64))
+		self.__Index = UsersIndex(self.__StorageDirectory / "users.index")
+
+		self.__Users: OrderedDict[int, UserData] = OrderedDict()
+		self.__Live: WeakValueDictionary[int, UserData] = WeakValueDictionary()
+		self.__FlagSets: dict[frozenset[str], frozenset[str]] = {}
+		self.__Migrations: dict[int, Callable[[dict], dict]] = {}
+		self.__SchemaVersion = 0
+		self.__ResidentSizes: dict[int, int] = {}
+		self.__ResidentSize = 0
+		self.__MaxResidentUsers: int | None = None
+		self.__MaxResidentSize: int | None = None
+
+		self.__IsAtomicWrites = False
+		self.__IsHashVerification = False
+		self.__IsLazyLoading = lazy
+		self.__IsPrettySaving = True
+		self.__Codec: BaseCodec = JSONCodec()
+		self.__SavingQueue: SavingQueue | None = None
+		self.__ChangeFeed: ChangeFeed | None = None
+		self.__Metrics: Metrics | None = None
+		self.__Collector = local()
+
+		self.__Scheduler: BackgroundScheduler | None = None
+		self.__UnloaderTaskID: int | None = None
+		self.__Unloaded: dict[int, IndexRecord | None] = {}
+
+		if not os.path.exists(self.__StorageDirectory): os.makedirs(self.__StorageDirectory)
+		self.__IsClosed = False
+		self.__Storage.bind(self)
+		for Version, Migration in (migrations or {}).items(): self.register_migration(Version, Migration)
+		self.reload_users(threads, processes)
+		atexit.register(self.close)
+
+	def __getitem__(self, user_id: int) -> UserData:
+		"""
+		Возвращает данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии данных для пользователя с указанным ID.
+		:return: Данные пользователя.
+		:rtype: UserData
+		"""
+
+		return self.get_user(user_id)
+
+	def auth(self, user: types.User, update_activity: bool = True) -> UserData:
+		"""
+		Выполняет авторизацию пользователя в системе.
+
+		:param user: Структуры данных пользователя Telegram.
+		:type user: telebot.types.User
+		:param update_activity: Указывает, нужно ли обновить дату и время последней активности пользователя.
+		:type update_activity: bool
+		:raises TypeError: Выбрасывается при передаче неверного типа структуры данных пользователя.
+		:return: Данные пользователя.
+		:rtype: UserData
+		"""
+		
+		if type(user) is not types.User: raise TypeError(f"telebot.types.User object expected, not {type(user)}.")
+
+		Users = self.__LoadUsers((user.id,))
+		IsNew = False
+
+		if not Users:
+
+			with self.__LoadingLocks[user.id % len(self.__LoadingLocks)], self.__Lock:
+				User = self.__Live.get(user.id)
+
+				if not User:
+					# Новый пользователь создаётся под блокировкой, чтобы параллельная авторизация не привела к появлению двух объектов.
+					User = self.__Live[user.id] = UserData(self, user.id, {})
+					IsNew = True
+
+				Users = [User]
+
+		CurrentUser = Users[0]
+		if IsNew: CurrentUser.mark_as_changed()
+		self.__Touch(CurrentUser)
+		CurrentUser.update(user)
+		if CurrentUser.is_chat_forbidden: CurrentUser.set_chat_forbidden(False)
+		if update_activity: CurrentUser.update_acitivity()
+		if IsNew: CurrentUser.save()
+
+		return CurrentUser
+
+	@contextmanager
+	def batch(self, threads: int = 1) -> Iterator[None]:
+		"""
+		Контекст пакетного изменения пользователей.
+
+		Сохранения пользователей, изменённых в текущем потоке внутри контекста, откладываются, а при выходе из него каждый пользователь записывается однократно, и все записи передаются хранилищу одним пакетом. Изменения сохраняются и при выходе из контекста по исключению. Вложенные контексты присоединяются к внешнему. Используется методами массового редактирования.
+
+		:param threads: Количество потоков, между которыми распределяется запись пакета. По умолчанию 1.
+		:type threads: int
+		"""
+
+		if getattr(self.__Collector, "batch", None) is not None:
+			yield
+			return
+
+		Batch: dict[int, UserData] = {}
+		self.__Collector.batch = Batch
+
+		try: yield
+
+		finally:
+			del self.__Collector.batch
+			self.__SaveBatch(tuple(Batch.values()), threads)
+
+	def close(self):
+		"""Завершает работу менеджера: выполняет ожидающие сохранения, записывает индекс и освобождает ресурсы хранилища. Вызывается автоматически при завершении работы интерпретатора, повторный вызов игнорируется."""
+
+		if self.__IsClosed: return
+		self.__IsClosed = True
+		if self.__SavingQueue is not None: self.__SavingQueue.close()
+		self.__Index.save()
+		self.__Index.close()
+		self.__Storage.close()
+		atexit.unregister(self.close)
+
+	def convert_records(self, threads: int = 1) -> int:
+		"""
+		Перезаписывает записи всех пользователей кодеком менеджера. Используется однократно после смены кодека, чтобы не дожидаться замены записей при изменении пользователей.
+
+		Записи перезаписываются из данных пользователей под их блокировками, поэтому преобразование можно выполнять параллельно с обработкой запросов.
+
+		:param threads: Количество потоков, между которыми распределяется запись каждого пакета. По умолчанию 1.
+		:type threads: int
+		:return: Количество перезаписанных записей.
+		:rtype: int
+		"""
+
+		Count = 0
+
+		for Chunk in chunked(self.__Storage.get_users_id(), 1000):
+
+			with self.batch(threads):
+
+				Users = self.__LoadUsers(Chunk)
+
+				for User in Users:
+
+					with User.lock:
+						User.mark_as_changed()
+						User.save()
+
+			Count += len(Users)
+
+		return Count
+
+	def delete_user(self, user_id: int):
+		"""
+		Удаляет данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raises KeyError: Выбрасывается при отсутствии пользователя с переданным ID.
+		"""
+
+		with self.__Lock:
+			if user_id in self.__Users: self.__Forget(user_id)
+			self.__Unloaded.pop(user_id, None)
+			self.__Live.pop(user_id, None)
+
+		self.__Index.remove(user_id)
+		self.__Storage.delete(user_id)
+
+	def defer_saving(self, user: UserData) -> bool:
+		"""
+		Откладывает сохранение пользователя до выхода из контекста `batch()`, если он открыт в текущем потоке. Вызывается при сохранении `UserData`.
+
+		:param user: Данные пользователя.
+		:type user: UserData
+		:return: Возвращает `True`, если сохранение отложено.
+		:rtype: bool
+		"""
+
+		Batch: dict[int, UserData] | None = getattr(self.__Collector, "batch", None)
+		if Batch is None: return False
+		Batch[user.id] = user
+
+		return True
+
+	def flush(self):
+		"""Немедленно выполняет все ожидающие в очереди сохранения и дожидается их завершения."""
+
+		if self.__SavingQueue is not None: self.__SavingQueue.flush()
+
+	def export_snapshot(self, path: str | PathLike[str], threads: int = 1) -> int:
+		"""
+		Выгружает записи всех пользователей в один сжатый GZIP файл снимка, каждая строка которого содержит JSON массив из ID и записи пользователя.
+
+		Записи считываются из хранилища пакетами, поэтому объём занимаемой памяти ограничен, а менеджер продолжает обслуживать запросы. Ожидающие в очереди сохранения предварительно выполняются. Снимок записывается во временный файл, заменяющий указанный после завершения выгрузки.
+
+		:param path: Путь к файлу снимка.
+		:type path: str | PathLike[str]
+		:param threads: Количество потоков, параллельно считывающих пакеты записей. По умолчанию 1.
+		:type threads: int
+		:return: Количество выгруженных записей.
+		:rtype: int
+		"""
+
+		self.flush()
+		Count = 0
+		TemporaryPath = f"{path}.tmp"
+
+		with ThreadPoolExecutor(max_workers = threads) as Executor, gzip.open(TemporaryPath, "wb", compresslevel = 6) as FileWriter:
+
+			for Window in chunked(chunked(self.__Storage.get_users_id(), 1000), threads):
+
+				for Records in Executor.map(self.__Storage.load_many, Window):
+					FileWriter.write(b"".join(orjson.dumps((UserID, Record)) + b"\n" for UserID, Record in Records.items()))
+					Count += len(Records)
+
+		os.replace(TemporaryPath, path)
+
+		return Count
+
+	def get_active_users(self, hours: int = 24) -> tuple[UserData, ...]:
+		"""
+		Возвращает последовательность пользователей, активных за последние N часов. Отбор выполняется по индексу, отсутствующие в памяти пользователи загружаются.
+
+		:param hours: Количество часов для проверки активности. По умолчанию 24.
+		:type hours: int
+		:return: Последовательность данных пользователей.
+		:rtype: tuple[UserData]
+		"""
+
+		UsersID = self.__Index.get_active(datetime.now() - timedelta(hours = hours))
+
+		return tuple(self.get_user(UserID) for UserID in UsersID)
+
+	def get_user(self, user_id: int) -> UserData:
+		"""
+		Возвращает данные пользователя.
+
+		Для каждого пользователя существует не более одного объекта данных: вытесненный из резидентного набора объект остаётся действительным, и пока на него имеются ссылки, повторный запрос возвращает его же без чтения из хранилища.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии данных для пользователя с указанным ID.
+		:return: Данные пользователя.
+		:rtype: UserData
+		"""
+
+		Users = self.__LoadUsers((user_id,))
+		if not Users: raise KeyError(f"User with ID {user_id} not exists.")
+		self.__Touch(Users[0])
+
+		return Users[0]
+
+	def import_snapshot(self, path: str | PathLike[str], threads: int = 1) -> int:
+		"""
+		Загружает записи пользователей из файла снимка, созданного `export_snapshot()`. Записи пользователей из снимка заменяют существующие, остальные записи не изменяются.
+
+		Снимок считывается потоком и записывается в хранилище пакетами, поэтому объём занимаемой памяти ограничен, а менеджер продолжает обслуживать запросы. Загруженные в память пользователи перечитываются из хранилища.
+
+		:param path: Путь к файлу снимка.
+		:type path: str | PathLike[str]
+		:param threads: Количество потоков, параллельно записывающих пакеты записей. По умолчанию 1.
+		:type threads: int
+		:return: Количество загруженных записей.
+		:rtype: int
+		"""
+
+		Count = 0
+
+		with ThreadPoolExecutor(max_workers = threads) as Executor, gzip.open(path, "rb") as FileReader:
+			Lines = (orjson.loads(Line) for Line in FileReader if Line.strip())
+			Chunks = map(dict, chunked(Lines, 1000))
+
+			for Window in chunked(Chunks, threads):
+				tuple(Executor.map(self.__ImportRecords, Window))
+				Count += sum(map(len, Window))
+
+		return Count
+
+	def intern_flags(self, flags: Iterable[str]) -> frozenset[str]:
+		"""
+		Возвращает общий для всех пользователей менеджера экземпляр набора флагов или прав. Одинаковые наборы, а также составляющие их строки хранятся в памяти однократно.
+
+		:param flags: Последовательность флагов.
+		:type flags: Iterable[str]
+		:return: Неизменяемый набор флагов.
+		:rtype: frozenset[str]
+		"""
+
+		Flags = frozenset(flags)
+		FlagSet = self.__FlagSets.get(Flags)
+		if FlagSet is not None: return FlagSet
+		Flags = frozenset(map(sys.intern, Flags))
+
+		# Вставка в словарь атомарна, поэтому при гонке все потоки получат один экземпляр.
+		return self.__FlagSets.setdefault(Flags, Flags)
+
+	def is_user_exists(self, user_id: int) -> bool:
+		"""
+		Проверяет, зарегестрирован ли пользователь в системе.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если данные пользователя обнаружены.
+		:rtype: bool
+		"""
+
+		with self.__Lock:
+			if user_id in self.__Live or user_id in self.__Unloaded: return True
+
+		IsPartial = self.__IsLazyLoading or self.__MaxResidentUsers or self.__MaxResidentSize
+
+		return bool(IsPartial) and self.__Storage.exists(user_id)
+
+	def migrate_record(self, record: dict, version: int) -> dict:
+		"""
+		Последовательно применяет к записи пользователя миграции с версиями больше указанной. Вызывается `UserData` автоматически при загрузке записи.
+
+		:param record: Сериализуемый словарь данных пользователя без ключа версии.
+		:type record: dict
+		:param version: Версия схемы записи.
+		:type version: int
+		:return: Мигрированная запись.
+		:rtype: dict
+		"""
+
+		with self.__Lock: Migrations = sorted(Item for Item in self.__Migrations.items() if Item[0] > version)
+		for _, Migration in Migrations: record = Migration(record)
+
+		return record
+
+	def migrate_users(self) -> int:
+		"""
+		Применяет миграции ко всем пользователям, не дожидаясь загрузки их записей. Находящиеся в памяти пользователи мигрируются на месте, а из хранилища считываются и перезаписываются только записи устаревших версий.
+
+		Менеджер потокобезопасен, поэтому метод можно выполнять в фоновом потоке параллельно с обработкой запросов.
+
+		:return: Количество мигрированных записей.
+		:rtype: int
+		"""
+
+		with self.batch(): Count = sum(User.migrate() for User in self.users)
+		UsersID = self.__Storage.get_users_id()
+
+		for Chunk in chunked(UsersID, 1000):
+			Records = self.__Storage.load_many(Chunk)
+			OutdatedUsersID = [UserID for UserID, Record in Records.items() if Record.get("schema_version", 0) < self.__SchemaVersion]
+			if not OutdatedUsersID: continue
+
+			# Вновь созданные объекты мигрируются при загрузке, а уже существовавшие – явно.
+			with self.batch():
+				for User in self.__LoadUsers(OutdatedUsersID): User.migrate()
+
+			Count += len(OutdatedUsersID)
+
+		return Count
+
+	def push_to_saving_queue(self, user: UserData):
+		"""
+		Добавляет данные пользователя в очередь на сохранение.
+
+		При заполнении очереди с ограниченным размером блокирует вызывающий поток до освобождения места.
+
+		:param user: Данные пользователя.
+		:type user: UserData
+		:raise SavingQueueBlocked: Выбрасывается при отключённой очереди сохранений.
+		"""
+
+		if self.__SavingQueue is None: raise Exceptions.SavingQueueBlocked()
+		self.__SavingQueue.put(user)
+
+	def register_migration(self, version: int, migration: Callable[[dict], dict]):
+		"""
+		Регистрирует миграцию схемы записей пользователей.
+
+		Версия схемы сохраняется в каждой записи. При загрузке записи устаревшей версии к ней по возрастанию версий применяются все недостающие миграции, после чего результат записывается в хранилище. Записи актуальной версии не перезаписываются. Уже загруженные в память пользователи мигрируются вызовом `migrate_users()`.
+
+		:param version: Версия схемы, к которой приводит миграция. Должна быть положительной.
+		:type version: int
+		:param migration: Функция, принимающая сериализуемый словарь данных пользователя предыдущей версии и возвращающая словарь новой версии. Может изменять переданный словарь.
+		:type migration: Callable[[dict], dict]
+		:raise ValueError: Выбрасывается при неположительной или уже зарегистрированной версии.
+		"""
+
+		if version < 1: raise ValueError("Schema version must be positive.")
+
+		with self.__Lock:
+			if version in self.__Migrations: raise ValueError(f"Migration to version {version} already registered.")
+			self.__Migrations[version] = migration
+			self.__SchemaVersion = max(self.__SchemaVersion, version)
+
+	def write_record(self, user_id: int, record: dict):
+		"""
+		Передаёт запись пользователя хранилищу. Вызывается при сохранении `UserData`; во время пакетной обработки очереди сохранений запись откладывается до завершения пакета.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		"""
+
+		Records: dict[int, dict] | None = getattr(self.__Collector, "records", None)
+
+		if Records is not None:
+			Records[user_id] = record
+			return
+
+		Start = time.perf_counter()
+		self.__Storage.save(user_id, record)
+		if self.__Metrics: self.__Metrics.observe("save_seconds", time.perf_counter() - Start)
+
+	def reload_users(self, threads: int = 1, processes: bool = False):
+		"""
+		Загружает данные пользователей из хранилища.
+		
+		Вызывается автоматически при инициализации менеджера. Повторный вызов без реализации механизмов защиты может привести к потере данных. В режиме ленивой загрузки только очищает резидентный набор.
+
+		:param threads: Число потоков, использующихся для операций чтения. По умолчанию 1.
+		:type threads: int
+		:param processes: Переключает чтение и разбор записей в пул из `threads` процессов, что ускоряет загрузку большого количества пользователей, не ограничиваясь GIL. Используется только хранилищами, поддерживающими чтение из дочерних процессов. По умолчанию отключено.
+		:type processes: bool
+		"""
+
+		Start = time.perf_counter()
+
+		with self.__Lock:
+			self.__Users = OrderedDict()
+			self.__Live.clear()
+			self.__Unloaded.clear()
+
+		if self.__IsLazyLoading:
+			self.__Index.clear()
+			if not self.__Index.load(): self.rebuild_index()
+
+		else:
+			self.__Index.clear(persistent = True)
+			Users = self.__CreateUsers(self.__ReadRecords(threads, processes))
+
+			with self.__Lock:
+				for User in Users: self.__Users[User.id] = self.__Live[User.id] = User
+
+		self.__RecountResidentSize()
+		if self.__Metrics: self.__Metrics.observe("reload_seconds", time.perf_counter() - Start)
+
+	def rebuild_index(self):
+		"""Перестраивает индекс метаданных, считывая записи всех пользователей из хранилища без их загрузки в память."""
+
+		UsersID = self.__Storage.get_users_id()
+		Chunks = (self.__Storage.load_many(UsersID[Index:Index + 1000]) for Index in range(0, len(UsersID), 1000))
+		self.__Index.clear()
+		self.__Index.update_many(IndexRecord.from_record(UserID, Record) for Records in Chunks for UserID, Record in Records.items())
+		self.__Index.save()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ ВЫГРУЗКИ ПОЛЬЗОВАТЕЛЕЙ <<<<< #
+	#==========================================================================================#
+
+	def get_unloaded_user(self, user_id: int) -> IndexRecord | None:
+		"""
+		Возвращает заглушку выгруженного пользователя – его индексные метаданные, доступные без загрузки данных.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается, если пользователь не выгружен.
+		:return: Индексная запись или `None`, если пользователь отсутствовал в индексе при выгрузке.
+		:rtype: IndexRecord | None
+		"""
+
+		with self.__Lock: return self.__Unloaded[user_id]
+
+	def restore_unloaded_users(self, limit: int | None = None) -> tuple[int, ...]:
+		"""
+		Заново загружает в память ранее выгруженные данные неактивных пользователей.
+
+		Выгруженные пользователи также загружаются по отдельности при запросе через `get_user()` или `auth()`, поэтому полное восстановление требуется редко. Ограничение позволяет восстанавливать пользователей постепенно, повторяя вызов.
+
+		:param limit: Максимальное количество восстанавливаемых за вызов пользователей в порядке их выгрузки. По умолчанию восстанавливаются все.
+		:type limit: int | None
+		:return: Последовательность ID восстановленных пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		with self.__Lock:
+			UnloadedUsersID = tuple(islice(self.__Unloaded, limit))
+			for UserID in UnloadedUsersID: del self.__Unloaded[UserID]
+
+		Users = self.__LoadUsers(UnloadedUsersID)
+
+		with self.__Lock:
+			for User in Users: self.__Users.setdefault(User.id, User)
+
+		self.__RecountResidentSize()
+
+		return tuple(User.id for User in Users)
+
+	def start_unloader(self, interval: int, days: int):
+		"""
+		Запускает фоновую задачу по периодической выгрузке неактивных пользователей из памяти.
+
+		:param interval: Интервал в часах для срабатывания выгрузки.
+		:type interval: int
+		:param days: Количество дней отсутствия активности.
+		:type days: int
+		"""
+
+		if not self.__Scheduler:
+			self.__Scheduler = BackgroundScheduler()
+			self.__Scheduler.start()
+
+		self.__UnloaderTaskID = self.__Scheduler.add_job(self.unload_users, args = (days,), trigger = "interval", hours = interval).id
+
+	def stop_unloader(self):
+		"""Останавливает фоновую задачу по периодической выгрузке неактивных пользователей из памяти."""
+
+		if not self.__Scheduler: return 
+		self.__Scheduler.remove_job(self.__UnloaderTaskID)
+		self.__Scheduler = None
+
+	def unload_users(self, days: int) -> tuple[int, ...]:
+		"""
+		Выгружает из оперативной памяти данные пользователей, чья последняя активность выходит за указанное значение.
+
+		Вместо данных выгруженного пользователя хранится заглушка с его индексными метаданными (`get_unloaded_user()`), а при запросе через `get_user()` или `auth()` пользователь прозрачно загружается.
+
+		:param days: Количество дней отсутствия активности. Минимум 1.
+		:type days: int
+		:return: Последовательность ID пользователей, для которых были выгружены данные.
+		:rtype: tuple[int]
+		:raise ValueError: Выбрасывается при неверной спецификации количества дней.
+		"""
+
+		if days < 1: raise ValueError("Days must be more than 1.")
+
+		with self.__Lock:
+			# Выборка ограничена резидентным набором и не превышает меньшего из его размера и количества неактивных пользователей.
+			InactiveUsersID = self.__Index.get_inactive(datetime.now() - timedelta(days = days), self.__Users.keys())
+			InactiveUsers = tuple(self.__Forget(UserID) for UserID in InactiveUsersID)
+			CurrentUnloadedUsersID = tuple(User.id for User in InactiveUsers)
+			self.__Unloaded.update({UserID: self.__Index.get(UserID) if UserID in self.__Index else None for UserID in CurrentUnloadedUsersID})
+
+		for User in InactiveUsers:
+
+			if User.objects:
+				ObjectsCount = len(User.objects)
+				LOGGER.debug(f"While unloading {User} unnatached {ObjectsCount} objects.")
+
+			if User.is_saving_suppressed: LOGGER.warning(f"For unloaded {User} saving suppressed. Data may be loss.")
+
+			User.save(use_queue = False)
+
+		return CurrentUnloadedUsersID
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ НАСТРОЙКИ <<<<< #
+	#==========================================================================================#
+
+	def enable_atomic_writing(self, status: bool):
+		"""
+		Переключает режим атомарной записи файлов, увеличивает время сохранения JSON за счёт гарантии сохранности. Учитывается хранилищем `JSONStorage`. Более дешёвую защиту от повреждения записей при сбоях обеспечивает хранилище `JournalStorage`.
+
+		:param status: Состояние использования атомарной записи.
+		:type status: bool
+		"""
+
+		self.__IsAtomicWrites = status
+
+	def enable_change_feed(self, status: bool, max_size: int = 10000):
+		"""
+		Переключает ленту изменений данных пользователей. Каждое изменение поля пользователя, кроме считывания записи из хранилища, регистрируется в ленте и передаётся её подписчикам. При повторном включении создаётся новая лента.
+
+		:param status: Состояние ленты.
+		:type status: bool
+		:param max_size: Максимальное количество хранящихся в буфере ленты записей. По умолчанию 10 000.
+		:type max_size: int
+		"""
+
+		self.__ChangeFeed = ChangeFeed(max_size) if status else None
+
+	def enable_hash_verification(self, status: bool):
+		"""
+		Переключает отладочную проверку отслеживания изменений. При включении после каждого чтения и сохранения вычисляется хэш данных пользователя, а при пропуске сохранения он сравнивается с текущим, что позволяет обнаружить и сохранить изменения, внесённые в обход методов пользователя.
+
+		Значительно замедляет работу и не рекомендуется для использования вне отладки.
+
+		:param status: Состояние проверки.
+		:type status: bool
+		"""
+
+		self.__IsHashVerification = status
+
+	def enable_metrics(self, status: bool, buckets: Sequence[float] | None = None):
+		"""
+		Переключает сбор метрик работы менеджера. В отключённом состоянии измерения не выполняются.
+
+		Собираются гистограммы длительностей одиночных (_save_seconds_) и пакетных (_batch_save_seconds_) записей в хранилище, чтения записей пользователей (_refresh_seconds_) и загрузки менеджера (_reload_seconds_), счётчики запросов пользователей, обслуженных из памяти (_cache_hits_total_) и из хранилища (_cache_misses_total_), а также показатели размера очереди сохранений, резидентного набора, всех существующих объектов данных и выгруженных пользователей. При повторном включении создаются новые метрики.
+
+		:param status: Состояние сбора метрик.
+		:type status: bool
+		:param buckets: Возрастающая последовательность верхних границ интервалов гистограмм в секундах. По умолчанию от 0,5 мс до 10 с.
+		:type buckets: Sequence[float] | None
+		"""
+
+		if not status:
+			self.__Metrics = None
+			return
+
+		CurrentMetrics = Metrics(buckets) if buckets else Metrics()
+		CurrentMetrics.register_gauge("saving_queue_size", lambda: len(self.__SavingQueue) if self.__SavingQueue else 0)
+		CurrentMetrics.register_gauge("resident_users", lambda: len(self.__Users))
+		CurrentMetrics.register_gauge("live_users", lambda: len(self.__Live))
+		CurrentMetrics.register_gauge("unloaded_users", lambda: len(self.__Unloaded))
+		self.__Metrics = CurrentMetrics
+
+	def enable_pretty_saving(self, status: bool):
+		"""
+		Переключает форматирование локальных файлов с использованием отступов. Отключение может значительно ускорить операции записи. Учитывается хранилищем `JSONStorage`.
+
+		:param status: Состояние форматирования.
+		:type status: bool
+		"""
+
+		self.__IsPrettySaving = status
+
+	def set_codec(self, codec: BaseCodec):
+		"""
+		Задаёт кодек записей пользователей. Записи в прежнем формате продолжают считываться и заменяются при следующем сохранении пользователя или вызове `convert_records()`.
+
+		Компактный JSON (`JSONCodec` с отключённым форматированием) и двоичный `MsgPackCodec` значительно уменьшают объём записей и время сохранения по сравнению с форматированным JSON.
+
+		:param codec: Кодек записей.
+		:type codec: BaseCodec
+		"""
+
+		self.__Codec = codec
+
+	def set_resident_limit(self, users: int | None = None, size: int | None = None):
+		"""
+		Задаёт ограничения резидентного набора. При превышении любого из них наиболее давно запрошенные пользователи сохраняются и выгружаются из памяти.
+
+		Предназначено в первую очередь для режима ленивой загрузки, в котором выгруженные пользователи прозрачно загружаются при следующем запросе.
+
+		:param users: Максимальное количество хранящихся в памяти пользователей или `None` для снятия ограничения.
+		:type users: int | None
+		:param size: Максимальный оценочный размер данных хранящихся в памяти пользователей в байтах или `None` для снятия ограничения.
+		:type size: int | None
+		:raise ValueError: Выбрасывается при неположительном значении ограничения.
+		"""
+
+		if users is not None and users < 1: raise ValueError("Users limit must be positive.")
+		if size is not None and size < 1: raise ValueError("Size limit must be positive.")
+
+		with self.__Lock:
+			self.__MaxResidentUsers = users
+			self.__MaxResidentSize = size
+
+		self.__RecountResidentSize()
+
+	def enable_saving_queue(self, status: bool, workers: int = 1, delay: float = 0.0, max_size: int | None = None):
+		"""
+		Переключает использование очереди сохранений. При отключении все ожидающие задачи выполняются.
+
+		Очередь объединяет повторные сохранения одного пользователя: все его изменения в пределах задержки будут записаны однократно. Пакеты пользователей передаются хранилищу одной записью, а при ошибке записи сохранение повторяется с нарастающей задержкой.
+
+		:param status: Состояние использования очереди.
+		:type status: bool
+		:param workers: Количество потоков обработки очереди. По умолчанию 1.
+		:type workers: int
+		:param delay: Задержка в секундах между первым изменением пользователя и его сохранением. По умолчанию 0.
+		:type delay: float
+		:param max_size: Максимальное количество ожидающих сохранения пользователей, при достижении которого изменения блокируются до освобождения места. По умолчанию не ограничено.
+		:type max_size: int | None
+		"""
+
+		if self.__SavingQueue is not None:
+			self.__SavingQueue.close()
+			self.__SavingQueue = None
+
+		if status: self.__SavingQueue = SavingQueue(self.__ProcessSavingQueue, workers, delay, max_size)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ МАССОВОГО РЕДАКТИРОВАНИЯ ПОЛЬЗОВАТЕЛЕЙ <<<<< #
+	#==========================================================================================#
+
+	def add_flags(self, flags: Sequence[str] | str):
+		"""
+		Добавляет флаги для всех пользователей.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		with self.batch():
+			for User in self.users: User.add_flags(flags)
+
+	def clear_temp_properties(self):
+		"""Очищает временные свойства всех пользователей."""
+
+		with self.batch():
+			for User in self.users: User.clear_temp_properties()
+
+	def remove_flags(self, flags: Sequence[str] | str):
+		"""
+		Удаляет флаги у всех пользователей.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		with self.batch():
+			for User in self.users: User.remove_flags(flags)
+
+	def remove_permissions(self, permissions: list[str] | str):
+		"""
+		Удаляет права у всех пользователей.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		with self.batch():
+			for User in self.users: User.remove_permissions(permissions)
+
+	def remove_property(self, key: str):
+		"""
+		Удаляет свойство у всех пользователей.
+
+		:param key: Ключ свойства.
+		:type key: str
+		"""
+
+		with self.batch():
+			for User in self.users: User.remove_property(key)
+
+	def set_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт свойство для всех пользователей.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+
+		with self.batch():
+			for User in self.users: User.set_property(key, value, force)
\ No newline at end of file
@@ -0,0 +1,792 @@
+import asyncio
+import enum
+import functools
+from concurrent.futures import Executor
+from datetime import datetime
+from os import PathLike
+from typing import Any, Callable, Sequence, TypeVar
+
+from telebot import types
+
+from . import BaseStorage, UserData, UsersIndex, UsersManager
+
+ReturnType = TypeVar("ReturnType")
+
+#==========================================================================================#
+# >>>>> ОСНОВНЫЕ КЛАССЫ <<<<< #
+#==========================================================================================#
+
+class AsyncUserData:
+	"""
+	Асинхронное представление данных пользователя.
+
+	Методы, которые могут ожидать блокировку пользователя или выполнять запись в хранилище, являются сопрограммами и выполняются в пуле потоков менеджера. Свойства и проверки флагов читают данные в памяти и остаются синхронными.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def last_activity(self) -> datetime | None:
+		"""Дата и время последней активности пользователя."""
+
+		return self.__User.last_activity
+
+	@property
+	def expected_type(self) -> str | None:
+		"""Тип ожидаемого значения."""
+
+		return self.__User.expected_type
+
+	@property
+	def flags(self) -> tuple[str, ...]:
+		"""Набор активированных флагов."""
+
+		return self.__User.flags
+
+	@property
+	def id(self) -> int:
+		"""ID пользователя."""
+
+		return self.__User.id
+
+	@property
+	def is_chat_forbidden(self) -> bool:
+		"""Состояние: может ли бот контактировать с пользователем."""
+
+		return self.__User.is_chat_forbidden
+
+	@property
+	def is_premium(self) -> bool | None:
+		"""Состояние: имеет ли пользователь Premium-подписку."""
+
+		return self.__User.is_premium
+
+	@property
+	def language(self) -> str | None:
+		"""Код используемого клиентом языка по стандарту ISO 639-1."""
+
+		return self.__User.language
+
+	@property
+	def permissions(self) -> tuple[str, ...]:
+		"""Список прав пользователя."""
+
+		return self.__User.permissions
+
+	@property
+	def username(self) -> str | None:
+		"""Ник пользователя."""
+
+		return self.__User.username
+
+	#==========================================================================================#
+	# >>>>> НЕСЕРИАЛИЗУЕМЫЕ СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def is_changed(self) -> bool:
+		"""Состояние: имеются ли несохранённые изменения."""
+
+		return self.__User.is_changed
+
+	@property
+	def is_saving_suppressed(self) -> bool:
+		"""Состояние: подавляется ли сохранение в локальный файл."""
+
+		return self.__User.is_saving_suppressed
+
+	@property
+	def user(self) -> UserData:
+		"""Синхронный объект данных пользователя."""
+
+		return self.__User
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, manager: "AsyncUsersManager", user: UserData):
+		"""
+		Асинхронное представление данных пользователя.
+
+		:param manager: Асинхронный менеджер пользователей.
+		:type manager: AsyncUsersManager
+		:param user: Данные пользователя.
+		:type user: UserData
+		"""
+
+		self.__Manager = manager
+		self.__User = user
+
+	def __eq__(self, other: object) -> bool:
+		"""
+		Сравнивает представления по объекту данных пользователя.
+
+		:param other: Сравниваемый объект.
+		:type other: object
+		:return: Возвращает `True`, если оба представления относятся к одному объекту данных.
+		:rtype: bool
+		"""
+
+		if not isinstance(other, AsyncUserData): return NotImplemented
+
+		return self.__User is other.user
+
+	def __hash__(self) -> int:
+		"""
+		Возвращает хэш по ID пользователя.
+
+		:return: Хэш.
+		:rtype: int
+		"""
+
+		return hash(self.__User.id)
+
+	def __repr__(self) -> str:
+		"""
+		Возвращает строковое представление объекта.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return f"<Async{self.__User!r}>"
+
+	def __str__(self) -> str:
+		"""
+		Возвращает строковое представление пользователя.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return str(self.__User)
+
+	async def add_flags(self, flags: Sequence[str] | str):
+		"""
+		Добавляет флаги.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		await self.__Manager.run_blocking(self.__User.add_flags, flags)
+
+	async def add_permissions(self, permissions: Sequence[str] | str):
+		"""
+		Добавляет права.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		await self.__Manager.run_blocking(self.__User.add_permissions, permissions)
+
+	async def attach_object(self, key: str, custom_object: Any, force: bool = True):
+		"""
+		Прикрепляет объект к пользователю. При перезапуске объект будет удалён.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:param custom_object: Прикрепляемый объект.
+		:type custom_object: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующий объект.
+		:type force: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.attach_object, key, custom_object, force)
+
+	def check_flags(self, flags: Sequence[str] | str) -> bool:
+		"""
+		Проверяет, активированы ли для пользователя указанные флаги.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		:return: Возвращает `True`, если все флаги активированы.
+		:rtype: bool
+		"""
+
+		return self.__User.check_flags(flags)
+
+	async def clear_temp_properties(self):
+		"""Очищает временные свойства пользователя."""
+
+		await self.__Manager.run_blocking(self.__User.clear_temp_properties)
+
+	def get_object(self, key: str) -> Any:
+		"""
+		Возвращает объект, прикреплённый к пользователю.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:raise KeyError: Выбрасывается при отсутствии объекта с переданным ключом.
+		:return: Прикреплённый объект.
+		:rtype: Any
+		"""
+
+		return self.__User.get_object(key)
+
+	async def get_property(self, key: str, copy: bool = True, view: bool = False) -> Any:
+		"""
+		Возвращает значение свойства пользователя. При наличии одинакового ключа в постоянных и временных свойствах, приоритет отдаётся временному.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param copy: Указывает, нужно ли создавать копию ссылочных объектов для защиты данных.
+		:type copy: bool
+		:param view: Указывает, нужно ли вместо копии вернуть для словарей и списков представление только для чтения.
+		:type view: bool
+		:raises KeyError: Выбрасывается при отсутствии свойства с переданным ключом.
+		:return: Значение свойства.
+		:rtype: Any
+		"""
+
+		return await self.__Manager.run_blocking(self.__User.get_property, key, copy, view)
+
+	def has_permissions(self, permissions: Sequence[str] | str) -> bool:
+		"""
+		Проверяет, имеет ли пользователь все указанные права.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		:return: Возвращает `True`, если пользователь имеет все указанные права.
+		:rtype: bool
+		"""
+
+		return self.__User.has_permissions(permissions)
+
+	def has_object(self, key: str) -> bool:
+		"""
+		Проверяет, прикреплён ли к пользователю объект с переданным ключом.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:return: Возвращает `True`, если объект с таким ключом найден.
+		:rtype: bool
+		"""
+
+		return self.__User.has_object(key)
+
+	def has_property(self, key: str) -> bool:
+		"""
+		Проверяет, имеется ли у пользователя свойство с указанным ключом.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:return: Возвращает `True`, если свойство с таким ключом найдено.
+		:rtype: bool
+		"""
+
+		return self.__User.has_property(key)
+
+	async def mark_as_changed(self):
+		"""Отмечает данные пользователя изменёнными."""
+
+		await self.__Manager.run_blocking(self.__User.mark_as_changed)
+
+	async def migrate(self) -> bool:
+		"""
+		Применяет к данным пользователя миграции, зарегистрированные после их загрузки, и сохраняет результат.
+
+		:return: Возвращает `True`, если данные были мигрированы.
+		:rtype: bool
+		"""
+
+		return await self.__Manager.run_blocking(self.__User.migrate)
+
+	async def refresh(self):
+		"""
+		Считывает запись пользователя из хранилища и дополняет отсутствующие поля.
+
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя в хранилище.
+		:raise RefreshingBlocked: Выбрасывается при попытке чтения записи пользователя во время подавления сохранений.
+		"""
+
+		await self.__Manager.run_blocking(self.__User.refresh)
+
+	async def remove_object(self, key: str):
+		"""
+		Удаляет прикреплённый объект.
+
+		:param key: Ключ объекта.
+		:type key: str
+		:raise KeyError: Выбрасывается, если объект с указанным ключом не найден.
+		"""
+
+		await self.__Manager.run_blocking(self.__User.remove_object, key)
+
+	async def remove_flags(self, flags: Sequence[str] | str):
+		"""
+		Удаляет флаги.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		await self.__Manager.run_blocking(self.__User.remove_flags, flags)
+
+	async def remove_permissions(self, permissions: Sequence[str] | str):
+		"""
+		Удаляет права.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		await self.__Manager.run_blocking(self.__User.remove_permissions, permissions)
+
+	async def remove_property(self, key: str):
+		"""
+		Удаляет свойство пользователя. При поиске приоритет отдаётся постоянным свойствам, затем поиск осуществляется среди временных.
+
+		:param key: Ключ свойства.
+		:type key: str
+		"""
+
+		await self.__Manager.run_blocking(self.__User.remove_property, key)
+
+	async def reset_expected_type(self):
+		"""Сбрасывает ожидаемый тип к значению `None`."""
+
+		await self.__Manager.run_blocking(self.__User.reset_expected_type)
+
+	async def save(self, use_queue: bool = True):
+		"""
+		Записывает данные пользователя в хранилище.
+
+		:param use_queue: Указывает, помещать ли задачу в очередь, если доступна, или выполнить сохранение немедленно.
+		:type use_queue: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.save, use_queue)
+
+	async def set_chat_forbidden(self, status: bool):
+		"""
+		Задаёт состояние: может ли бот контактировать с пользователем.
+
+		:param status: Состояние.
+		:type status: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.set_chat_forbidden, status)
+
+	async def set_expected_type(self, expected_type: str | enum.Enum | None):
+		"""
+		Задаёт ожидаемый тип данных.
+
+		:param expected_type: Ожидаемый от пользователя тип данных. При указании элемента перечисления берётся его значение.
+		:type expected_type: str | Enum | None
+		"""
+
+		await self.__Manager.run_blocking(self.__User.set_expected_type, expected_type)
+
+	async def set_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт значение свойства пользователя.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.set_property, key, value, force)
+
+	async def set_temp_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт временное значение свойства пользователя.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.set_temp_property, key, value, force)
+
+	async def suppress_saving(self, status: bool, save_on_disabling: bool = True):
+		"""
+		Подавляет сохранение в хранилище.
+
+		:param status: Статус подавления.
+		:type status: bool
+		:param save_on_disabling: Указывает, следует ли выполнить обязательное сохранение после отключения подавления.
+		:type save_on_disabling: bool
+		"""
+
+		await self.__Manager.run_blocking(self.__User.suppress_saving, status, save_on_disabling)
+
+	async def update(self, user: types.User, is_chat_forbidden: bool | None = None):
+		"""
+		Обновляет данные пользователя (язык, наличие подписки, ник) из его структуры Telegram.
+
+		:param user: Объект представления пользователя.
+		:type user: telebot.types.User
+		:param is_chat_forbidden: Указывает, заблокировал ли пользователь бота.
+		:type is_chat_forbidden: bool | None
+		:raises IncorrectUserToUpdate: Выбрасывается при передаче несоответствующей по ID структуры пользователя.
+		"""
+
+		await self.__Manager.run_blocking(self.__User.update, user, is_chat_forbidden)
+
+	async def update_acitivity(self) -> datetime:
+		"""
+		Обновляет дату и время последней активности пользователя.
+
+		:return: Дата и время последней активности пользователя.
+		:rtype: datetime
+		"""
+
+		return await self.__Manager.run_blocking(self.__User.update_acitivity)
+
+class AsyncUsersManager:
+	"""
+	Асинхронный менеджер пользователей для `telebot.async_telebot`.
+
+	Является обёрткой над `UsersManager`: все операции, выполняющие чтение или запись хранилища, выполняются в пуле потоков и не блокируют цикл событий. Формат хранения полностью совпадает с синхронным менеджером, поэтому оба менеджера могут работать с одним каталогом поочерёдно.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def index(self) -> UsersIndex:
+		"""Индекс метаданных пользователей."""
+
+		return self.__Manager.index
+
+	@property
+	def manager(self) -> UsersManager:
+		"""Синхронный менеджер пользователей."""
+
+		return self.__Manager
+
+	@property
+	def premium_users(self) -> tuple[AsyncUserData, ...]:
+		"""Последовательность хранящихся в памяти пользователей с Telegram Premium."""
+
+		return self.__Wrap(self.__Manager.premium_users)
+
+	@property
+	def storage(self) -> BaseStorage:
+		"""Хранилище записей пользователей."""
+
+		return self.__Manager.storage
+
+	@property
+	def users(self) -> tuple[AsyncUserData, ...]:
+		"""Последовательность хранящихся в памяти пользователей."""
+
+		return self.__Wrap(self.__Manager.users)
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Wrap(self, users: Sequence[UserData]) -> tuple[AsyncUserData, ...]:
+		"""
+		Создаёт асинхронные представления пользователей.
+
+		:param users: Последовательность данных пользователей.
+		:type users: Sequence[UserData]
+		:return: Последовательность асинхронных представлений.
+		:rtype: tuple[AsyncUserData, ...]
+		"""
+
+		return tuple(AsyncUserData(self, User) for User in users)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	@classmethod
+	async def create(cls, storage_directory: str | PathLike[str], threads: int = 1, storage: BaseStorage | None = None, lazy: bool = False, processes: bool = False, migrations: dict[int, Callable[[dict], dict]] | None = None, executor: Executor | None = None) -> "AsyncUsersManager":
+		"""
+		Создаёт менеджер, выполняя первичную загрузку пользователей в пуле потоков.
+
+		:param storage_directory: Путь к каталогу файлов пользователей.
+		:type storage_directory: str | PathLike[str]
+		:param threads: Число потоков, использующихся для операций чтения при инициализации менеджера. По умолчанию 1.
+		:type threads: int
+		:param storage: Хранилище записей пользователей. По умолчанию `JSONStorage`.
+		:type storage: BaseStorage | None
+		:param lazy: Включает ленивую загрузку пользователей.
+		:type lazy: bool
+		:param processes: Переключает чтение и разбор записей в пул из `threads` процессов.
+		:type processes: bool
+		:param migrations: Словарь миграций схемы записей, ключами которого являются версии.
+		:type migrations: dict[int, Callable[[dict], dict]] | None
+		:param executor: Пул, в котором выполняются блокирующие операции. По умолчанию используется пул цикла событий.
+		:type executor: Executor | None
+		:return: Асинхронный менеджер пользователей.
+		:rtype: AsyncUsersManager
+		"""
+
+		Manager = await asyncio.get_running_loop().run_in_executor(executor, functools.partial(UsersManager, storage_directory, threads, storage, lazy, processes, migrations))
+
+		return cls(Manager, executor)
+
+	def __init__(self, manager: UsersManager, executor: Executor | None = None):
+		"""
+		Асинхронный менеджер пользователей.
+
+		:param manager: Синхронный менеджер пользователей.
+		:type manager: UsersManager
+		:param executor: Пул, в котором выполняются блокирующие операции. По умолчанию используется пул цикла событий.
+		:type executor: Executor | None
+		"""
+
+		self.__Manager = manager
+		self.__Executor = executor
+
+	async def __aenter__(self) -> "AsyncUsersManager":
+		"""
+		Возвращает менеджер для использования в асинхронном контекстном менеджере.
+
+		:return: Асинхронный менеджер пользователей.
+		:rtype: AsyncUsersManager
+		"""
+
+		return self
+
+	async def __aexit__(self, *_):
+		"""Завершает работу менеджера при выходе из контекста."""
+
+		await self.close()
+
+	async def auth(self, user: types.User, update_activity: bool = True) -> AsyncUserData:
+		"""
+		Выполняет авторизацию пользователя в системе.
+
+		:param user: Структуры данных пользователя Telegram.
+		:type user: telebot.types.User
+		:param update_activity: Указывает, нужно ли обновить дату и время последней активности пользователя.
+		:type update_activity: bool
+		:raises TypeError: Выбрасывается при передаче неверного типа структуры данных пользователя.
+		:return: Данные пользователя.
+		:rtype: AsyncUserData
+		"""
+
+		return AsyncUserData(self, await self.run_blocking(self.__Manager.auth, user, update_activity))
+
+	async def close(self):
+		"""Завершает работу менеджера: выполняет ожидающие сохранения, записывает индекс и освобождает ресурсы хранилища."""
+
+		await self.run_blocking(self.__Manager.close)
+
+	async def delete_user(self, user_id: int):
+		"""
+		Удаляет данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		"""
+
+		await self.run_blocking(self.__Manager.delete_user, user_id)
+
+	async def export_snapshot(self, path: str | PathLike[str], threads: int = 1) -> int:
+		"""
+		Выгружает записи всех пользователей в один сжатый файл снимка.
+
+		:param path: Путь к файлу снимка.
+		:type path: str | PathLike[str]
+		:param threads: Количество потоков, параллельно считывающих пакеты записей. По умолчанию 1.
+		:type threads: int
+		:return: Количество выгруженных записей.
+		:rtype: int
+		"""
+
+		return await self.run_blocking(self.__Manager.export_snapshot, path, threads)
+
+	async def flush(self):
+		"""Немедленно выполняет все ожидающие в очереди сохранения и дожидается их завершения."""
+
+		await self.run_blocking(self.__Manager.flush)
+
+	async def get_active_users(self, hours: int = 24) -> tuple[AsyncUserData, ...]:
+		"""
+		Возвращает последовательность пользователей, активных за последние N часов.
+
+		:param hours: Количество часов для проверки активности. По умолчанию 24.
+		:type hours: int
+		:return: Последовательность данных пользователей.
+		:rtype: tuple[AsyncUserData, ...]
+		"""
+
+		return self.__Wrap(await self.run_blocking(self.__Manager.get_active_users, hours))
+
+	async def get_user(self, user_id: int) -> AsyncUserData:
+		"""
+		Возвращает данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии данных для пользователя с указанным ID.
+		:return: Данные пользователя.
+		:rtype: AsyncUserData
+		"""
+
+		return AsyncUserData(self, await self.run_blocking(self.__Manager.get_user, user_id))
+
+	async def import_snapshot(self, path: str | PathLike[str], threads: int = 1) -> int:
+		"""
+		Загружает записи пользователей из файла снимка.
+
+		:param path: Путь к файлу снимка.
+		:type path: str | PathLike[str]
+		:param threads: Количество потоков, параллельно записывающих пакеты записей. По умолчанию 1.
+		:type threads: int
+		:return: Количество загруженных записей.
+		:rtype: int
+		"""
+
+		return await self.run_blocking(self.__Manager.import_snapshot, path, threads)
+
+	async def is_user_exists(self, user_id: int) -> bool:
+		"""
+		Проверяет, зарегестрирован ли пользователь в системе.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если данные пользователя обнаружены.
+		:rtype: bool
+		"""
+
+		return await self.run_blocking(self.__Manager.is_user_exists, user_id)
+
+	async def migrate_users(self) -> int:
+		"""
+		Применяет миграции ко всем пользователям, не дожидаясь загрузки их записей.
+
+		:return: Количество мигрированных записей.
+		:rtype: int
+		"""
+
+		return await self.run_blocking(self.__Manager.migrate_users)
+
+	async def rebuild_index(self):
+		"""Перестраивает индекс метаданных, считывая записи всех пользователей из хранилища."""
+
+		await self.run_blocking(self.__Manager.rebuild_index)
+
+	async def reload_users(self, threads: int = 1, processes: bool = False):
+		"""
+		Загружает данные пользователей из хранилища.
+
+		:param threads: Число потоков, использующихся для операций чтения. По умолчанию 1.
+		:type threads: int
+		:param processes: Переключает чтение и разбор записей в пул из `threads` процессов.
+		:type processes: bool
+		"""
+
+		await self.run_blocking(self.__Manager.reload_users, threads, processes)
+
+	async def run_blocking(self, function: Callable[..., ReturnType], *args: Any, **kwargs: Any) -> ReturnType:
+		"""
+		Выполняет блокирующую функцию в пуле потоков менеджера.
+
+		:param function: Вызываемая функция.
+		:type function: Callable[..., ReturnType]
+		:return: Результат выполнения функции.
+		:rtype: ReturnType
+		"""
+
+		return await asyncio.get_running_loop().run_in_executor(self.__Executor, functools.partial(function, *args, **kwargs))
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ ВЫГРУЗКИ ПОЛЬЗОВАТЕЛЕЙ <<<<< #
+	#==========================================================================================#
+
+	async def restore_unloaded_users(self, limit: int | None = None) -> tuple[int, ...]:
+		"""
+		Заново загружает в память ранее выгруженные данные неактивных пользователей.
+
+		:param limit: Максимальное количество восстанавливаемых за вызов пользователей. По умолчанию восстанавливаются все.
+		:type limit: int | None
+		:return: Последовательность ID восстановленных пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		return await self.run_blocking(self.__Manager.restore_unloaded_users, limit)
+
+	async def unload_users(self, days: int) -> tuple[int, ...]:
+		"""
+		Выгружает из оперативной памяти данные пользователей, чья последняя активность выходит за указанное значение.
+
+		:param days: Количество дней отсутствия активности. Минимум 1.
+		:type days: int
+		:return: Последовательность ID пользователей, для которых были выгружены данные.
+		:rtype: tuple[int, ...]
+		"""
+
+		return await self.run_blocking(self.__Manager.unload_users, days)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ МАССОВОГО РЕДАКТИРОВАНИЯ ПОЛЬЗОВАТЕЛЕЙ <<<<< #
+	#==========================================================================================#
+
+	async def add_flags(self, flags: Sequence[str] | str):
+		"""
+		Добавляет флаги для всех пользователей.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		await self.run_blocking(self.__Manager.add_flags, flags)
+
+	async def clear_temp_properties(self):
+		"""Очищает временные свойства всех пользователей."""
+
+		await self.run_blocking(self.__Manager.clear_temp_properties)
+
+	async def remove_flags(self, flags: Sequence[str] | str):
+		"""
+		Удаляет флаги у всех пользователей.
+
+		:param flags: Один или несколько флагов.
+		:type flags: Sequence[str] | str
+		"""
+
+		await self.run_blocking(self.__Manager.remove_flags, flags)
+
+	async def remove_permissions(self, permissions: Sequence[str] | str):
+		"""
+		Удаляет права у всех пользователей.
+
+		:param permissions: Одно или несколько прав.
+		:type permissions: Sequence[str] | str
+		"""
+
+		await self.run_blocking(self.__Manager.remove_permissions, permissions)
+
+	async def remove_property(self, key: str):
+		"""
+		Удаляет свойство у всех пользователей.
+
+		:param key: Ключ свойства.
+		:type key: str
+		"""
+
+		await self.run_blocking(self.__Manager.remove_property, key)
+
+	async def set_property(self, key: str, value: Any, force: bool = True):
+		"""
+		Задаёт свойство для всех пользователей.
+
+		:param key: Ключ свойства.
+		:type key: str
+		:param value: Значение свойства.
+		:type value: Any
+		:param force: Указывает, нужно ли перезаписывать уже существующее свойство.
+		:type force: bool
+		"""
+
+		await self.run_blocking(self.__Manager.set_property, key, value, force)
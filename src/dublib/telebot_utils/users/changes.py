@@ -0,0 +1,163 @@
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+from typing import Any, Callable
+
+from ...core import LOGS_HANDLER
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+@dataclass(frozen = True)
+class ChangeRecord:
+	"""
+	Запись об изменении данных пользователя.
+
+	Для свойств пользователя поле имеет значение _data_ или _temp_, а ключ свойства передаётся отдельно. Удалённое значение обозначается `None`. Переданные значения являются объектами данных пользователя и не должны изменяться.
+	"""
+
+	sequence: int
+	user_id: int
+	field: str
+	key: str | None
+	old: Any
+	new: Any
+	timestamp: datetime
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class ChangeFeed:
+	"""
+	Лента изменений данных пользователей.
+
+	Записи об изменениях помещаются в ограниченный буфер, из которого их можно получить по порядковому номеру, и передаются подписчикам. Подписчики вызываются синхронно в потоке, изменившем данные, под блокировкой пользователя, поэтому должны выполняться быстро.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def last_sequence(self) -> int:
+		"""Порядковый номер последней записи или 0, если изменений не было."""
+
+		return self.__Sequence
+
+	@property
+	def max_size(self) -> int:
+		"""Максимальное количество хранящихся в буфере записей."""
+
+		return self.__MaxSize
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, max_size: int = 10000):
+		"""
+		Лента изменений данных пользователей.
+
+		:param max_size: Максимальное количество хранящихся в буфере записей. При переполнении вытесняются наиболее старые. Значение 0 отключает буфер, оставляя только подписчиков. По умолчанию 10 000.
+		:type max_size: int
+		:raise ValueError: Выбрасывается при отрицательном размере буфера.
+		"""
+
+		if max_size < 0: raise ValueError("Buffer size can't be negative.")
+
+		self.__MaxSize = max_size
+		self.__Buffer: deque[ChangeRecord] = deque(maxlen = max_size)
+		self.__Subscribers: tuple[Callable[[ChangeRecord], None], ...] = ()
+		self.__Sequence = 0
+		self.__Lock = Lock()
+
+	def __len__(self) -> int:
+		"""
+		Возвращает количество хранящихся в буфере записей.
+
+		:return: Количество записей.
+		:rtype: int
+		"""
+
+		return len(self.__Buffer)
+
+	def emit(self, user_id: int, field: str, old: Any, new: Any, key: str | None = None):
+		"""
+		Регистрирует изменение данных пользователя. Вызывается `UserData` автоматически.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param field: Изменённое поле.
+		:type field: str
+		:param old: Прежнее значение.
+		:type old: Any
+		:param new: Новое значение.
+		:type new: Any
+		:param key: Ключ свойства для полей _data_ и _temp_.
+		:type key: str | None
+		"""
+
+		with self.__Lock:
+			self.__Sequence += 1
+			Record = ChangeRecord(self.__Sequence, user_id, field, key, old, new, datetime.now())
+			self.__Buffer.append(Record)
+			Subscribers = self.__Subscribers
+
+		for Subscriber in Subscribers:
+			try: Subscriber(Record)
+			except Exception: LOGGER.exception(f"Change feed subscriber {Subscriber} failed.")
+
+	def get_changes(self, since: int = 0) -> tuple[ChangeRecord, ...]:
+		"""
+		Возвращает хранящиеся в буфере записи с порядковым номером больше указанного.
+
+		Если между переданным номером и первой возвращённой записью есть разрыв, часть изменений была вытеснена из буфера.
+
+		:param since: Порядковый номер последней обработанной записи. По умолчанию возвращаются все записи буфера.
+		:type since: int
+		:return: Последовательность записей в порядке поступления.
+		:rtype: tuple[ChangeRecord, ...]
+		"""
+
+		with self.__Lock:
+			Count = min(self.__Sequence - since, len(self.__Buffer))
+
+			# Обход с конца буфера затрагивает только возвращаемые записи.
+			return tuple(islice(reversed(self.__Buffer), Count))[::-1] if Count > 0 else ()
+
+	def subscribe(self, callback: Callable[[ChangeRecord], None]):
+		"""
+		Добавляет подписчика на изменения. Исключения подписчика записываются в лог и не прерывают изменение данных.
+
+		:param callback: Функция, принимающая запись об изменении.
+		:type callback: Callable[[ChangeRecord], None]
+		"""
+
+		with self.__Lock: self.__Subscribers += (callback,)
+
+	def unsubscribe(self, callback: Callable[[ChangeRecord], None]):
+		"""
+		Удаляет подписчика на изменения.
+
+		:param callback: Функция, переданная при подписке.
+		:type callback: Callable[[ChangeRecord], None]
+		:raise ValueError: Выбрасывается, если функция не подписана.
+		"""
+
+		with self.__Lock:
+			Subscribers = list(self.__Subscribers)
+			Subscribers.remove(callback)
+			self.__Subscribers = tuple(Subscribers)
@@ -0,0 +1,143 @@
+import json
+from abc import ABC, abstractmethod
+
+import orjson
+
+try:
+	import msgpack
+except ImportError:
+	msgpack = None
+
+#==========================================================================================#
+# >>>>> ФУНКЦИИ ДЕКОДИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+def DecodeRecord(data: bytes) -> dict:
+	"""
+	Декодирует запись пользователя, определяя формат по первому байту: объект JSON начинается с фигурной скобки или пробельного символа, а словарь MessagePack – с байта заголовка словаря.
+
+	:param data: Закодированная запись.
+	:type data: bytes
+	:return: Сериализуемый словарь данных пользователя.
+	:rtype: dict
+	:raise ValueError: Выбрасывается при невозможности декодировать запись.
+	"""
+
+	if not data or data[0] in b"{ \t\r\n": return orjson.loads(data)
+	if msgpack is None: raise ValueError("Record is not JSON. Install msgpack to read binary records.")
+
+	return msgpack.unpackb(data, strict_map_key = False)
+
+#==========================================================================================#
+# >>>>> БАЗОВЫЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class BaseCodec(ABC):
+	"""
+	Базовый кодек записей пользователей.
+
+	Кодек определяет только формат записи. Хранилища считывают записи функцией `DecodeRecord()`, поэтому смена кодека не требует преобразования уже сохранённых записей.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	@abstractmethod
+	def extension(self) -> str:
+		"""Расширение файлов записей без точки."""
+
+		pass
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def decode(self, data: bytes) -> dict:
+		"""
+		Декодирует запись пользователя в любом поддерживаемом формате.
+
+		:param data: Закодированная запись.
+		:type data: bytes
+		:return: Сериализуемый словарь данных пользователя.
+		:rtype: dict
+		"""
+
+		return DecodeRecord(data)
+
+	@abstractmethod
+	def encode(self, record: dict, pretty: bool = False) -> bytes:
+		"""
+		Кодирует запись пользователя.
+
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		:param pretty: Включает форматирование с использованием отступов, если формат его поддерживает.
+		:type pretty: bool
+		:return: Закодированная запись.
+		:rtype: bytes
+		"""
+
+		pass
+
+#==========================================================================================#
+# >>>>> РЕАЛИЗАЦИИ КОДЕКОВ <<<<< #
+#==========================================================================================#
+
+class JSONCodec(BaseCodec):
+	"""Кодек JSON. Компактные записи сериализуются [orjson](https://github.com/ijl/orjson). Используется по умолчанию."""
+
+	@property
+	def extension(self) -> str:
+		"""Расширение файлов записей без точки."""
+
+		return "json"
+
+	def encode(self, record: dict, pretty: bool = False) -> bytes:
+		"""
+		Кодирует запись пользователя в JSON.
+
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		:param pretty: Включает форматирование с использованием символов новых строк и табуляции.
+		:type pretty: bool
+		:return: Закодированная запись.
+		:rtype: bytes
+		"""
+
+		if pretty: return json.dumps(record, ensure_ascii = False, indent = "\t", separators = (",", ": ")).encode()
+
+		return orjson.dumps(record)
+
+class MsgPackCodec(BaseCodec):
+	"""Двоичный кодек [MessagePack](https://msgpack.org). Требует установки библиотеки _msgpack_."""
+
+	@property
+	def extension(self) -> str:
+		"""Расширение файлов записей без точки."""
+
+		return "msgpack"
+
+	def __init__(self):
+		"""
+		Двоичный кодек MessagePack.
+
+		:raise ImportError: Выбрасывается при отсутствии библиотеки _msgpack_.
+		"""
+
+		if msgpack is None: raise ImportError("MessagePack codec requires msgpack library.")
+
+	def encode(self, record: dict, pretty: bool = False) -> bytes:
+		"""
+		Кодирует запись пользователя в MessagePack.
+
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		:param pretty: Игнорируется.
+		:type pretty: bool
+		:return: Закодированная запись.
+		:rtype: bytes
+		"""
+
+		return msgpack.packb(record)
@@ -0,0 +1,553 @@
+import os
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from datetime import datetime
+from os import PathLike
+from pathlib import Path
+from threading import RLock
+from typing import BinaryIO, Collection, Iterable, Iterator, Sequence
+
+import dateparser
+import orjson
+
+from ...functions.data import ToSequence
+from ...functions.filesystem import AtomicWrite
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+@dataclass(frozen = True)
+class IndexRecord:
+	"""Индексируемые метаданные пользователя."""
+
+	id: int
+	last_activity: datetime | None
+	is_premium: bool | None
+	is_chat_forbidden: bool
+	language: str | None
+	flags: frozenset[str]
+	permissions: frozenset[str]
+
+	@staticmethod
+	def parse_last_activity(value: str | datetime) -> datetime | None:
+		"""
+		Преобразует строковое представление последней активности в объект даты и времени без часового пояса.
+
+		Формат ISO 8601, в том числе используемый менеджером при сохранении `%Y-%m-%d %H:%M`, разбирается напрямую, а для прочих форматов используется значительно более медленная библиотека [dateparser](https://github.com/scrapinghub/dateparser). Уже разобранные значения возвращаются без изменений.
+
+		:param value: Строковое представление даты и времени.
+		:type value: str | datetime
+		:return: Дата и время или `None`, если строку не удалось разобрать.
+		:rtype: datetime | None
+		"""
+
+		if isinstance(value, datetime): return value.replace(tzinfo = None)
+
+		try: Date = datetime.fromisoformat(value)
+		except ValueError: Date = dateparser.parse(value)
+
+		return Date.replace(tzinfo = None) if Date else None
+
+	@classmethod
+	def from_record(cls, user_id: int, record: dict) -> "IndexRecord":
+		"""
+		Строит индексную запись по сериализуемому словарю данных пользователя из хранилища.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		:return: Индексная запись.
+		:rtype: IndexRecord
+		"""
+
+		LastActivity = cls.parse_last_activity(record["last_activity"]) if record.get("last_activity") else None
+
+		return cls(
+			user_id,
+			LastActivity,
+			record.get("is_premium"),
+			bool(record.get("is_chat_forbidden")),
+			record.get("language"),
+			frozenset(record.get("flags") or ()),
+			frozenset(record.get("permissions") or ())
+		)
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class UsersIndex:
+	"""
+	Вторичный индекс метаданных пользователей.
+
+	Позволяет выполнять запросы по времени последней активности и членству во флагах и правах без загрузки полных данных пользователей. Поддерживается менеджером инкрементально при сохранении пользователей.
+
+	Пользователи распределены по часовым интервалам последней активности, поэтому обновление активности выполняется за постоянное время, а выборка неактивных пользователей затрагивает только устаревшие интервалы.
+
+	После считывания или записи файла индекса каждое изменение дописывается в журнал рядом с ним, поэтому после аварийного завершения процесса индекс восстанавливается из файла и журнала без перестроения. При разрастании журнала его записи переносятся в файл индекса.
+	"""
+
+	COMPACTION_THRESHOLD = 10000
+	"""Минимальное количество записей журнала, при превышении которого индекс записывается в файл."""
+
+	BUCKET_SIZE = 3600
+	"""Длительность интервала активности в секундах."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def journal_path(self) -> Path:
+		"""Путь к журналу изменений индекса."""
+
+		return self.__JournalPath
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу индекса."""
+
+		return self.__Path
+
+	@property
+	def users_id(self) -> tuple[int, ...]:
+		"""Последовательность ID всех проиндексированных пользователей."""
+
+		with self.__Lock:
+			return tuple(self.__Records.keys())
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Discard(self, user_id: int):
+		"""
+		Удаляет индексную запись пользователя из всех структур.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		"""
+
+		Record = self.__Records.get(user_id)
+		if Record: self.__Unlink(Record)
+
+	def __GetTimestamp(self, user_id: int) -> float:
+		"""
+		Возвращает временную метку последней активности проиндексированного пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Временная метка или минус бесконечность, если активность отсутствует.
+		:rtype: float
+		"""
+
+		LastActivity = self.__Records[user_id].last_activity
+
+		return LastActivity.timestamp() if LastActivity else float("-inf")
+
+	def __IterateBuckets(self, start: float | None, end: float | None) -> Iterator[tuple[bool, set[int]]]:
+		"""
+		Перебирает интервалы активности, пересекающиеся с отрезком времени, в порядке возрастания.
+
+		:param start: Начало отрезка в виде временной метки. Без ограничения, если не указано.
+		:type start: float | None
+		:param end: Конец отрезка в виде временной метки. Без ограничения, если не указан.
+		:type end: float | None
+		:return: Пары из признака частичного пересечения интервала с отрезком и множества ID пользователей интервала.
+		:rtype: Iterator[tuple[bool, set[int]]]
+		"""
+
+		StartBucket = int(start // self.BUCKET_SIZE) if start is not None else None
+		EndBucket = int(end // self.BUCKET_SIZE) if end is not None else None
+		First = bisect_left(self.__Buckets, StartBucket) if StartBucket is not None else 0
+		Last = bisect_right(self.__Buckets, EndBucket) if EndBucket is not None else len(self.__Buckets)
+
+		for Bucket in self.__Buckets[First:Last]: yield Bucket in (StartBucket, EndBucket), self.__Activity[Bucket]
+
+	def __Link(self, record: IndexRecord):
+		"""
+		Добавляет индексную запись во все структуры.
+
+		:param record: Индексная запись.
+		:type record: IndexRecord
+		"""
+
+		self.__Records[record.id] = record
+
+		if record.last_activity:
+			Bucket = int(record.last_activity.timestamp() // self.BUCKET_SIZE)
+
+			if Bucket not in self.__Activity:
+				self.__Activity[Bucket] = set()
+				insort(self.__Buckets, Bucket)
+
+			self.__Activity[Bucket].add(record.id)
+
+		else: self.__Inactive.add(record.id)
+
+		for Flag in record.flags: self.__Flags.setdefault(Flag, set()).add(record.id)
+		for Permission in record.permissions: self.__Permissions.setdefault(Permission, set()).add(record.id)
+		if record.is_premium: self.__Premium.add(record.id)
+		if record.is_chat_forbidden: self.__ChatForbidden.add(record.id)
+
+	def __Unlink(self, record: IndexRecord):
+		"""
+		Удаляет индексную запись из всех структур.
+
+		:param record: Индексная запись.
+		:type record: IndexRecord
+		"""
+
+		del self.__Records[record.id]
+
+		if record.last_activity:
+			Bucket = int(record.last_activity.timestamp() // self.BUCKET_SIZE)
+			self.__Activity[Bucket].discard(record.id)
+
+			if not self.__Activity[Bucket]:
+				del self.__Activity[Bucket]
+				del self.__Buckets[bisect_left(self.__Buckets, Bucket)]
+
+		else: self.__Inactive.discard(record.id)
+
+		for Flag in record.flags: self.__Flags[Flag].discard(record.id)
+		for Permission in record.permissions: self.__Permissions[Permission].discard(record.id)
+		self.__Premium.discard(record.id)
+		self.__ChatForbidden.discard(record.id)
+
+	def __ToRow(self, record: IndexRecord) -> tuple:
+		"""
+		Приводит индексную запись к сериализуемой строке файла индекса.
+
+		:param record: Индексная запись.
+		:type record: IndexRecord
+		:return: Строка файла индекса.
+		:rtype: tuple
+		"""
+
+		return (
+			record.id,
+			record.last_activity.timestamp() if record.last_activity else None,
+			record.is_premium,
+			record.is_chat_forbidden,
+			record.language,
+			tuple(record.flags),
+			tuple(record.permissions)
+		)
+
+	def __FromRow(self, row: Sequence) -> IndexRecord:
+		"""
+		Строит индексную запись по строке файла индекса.
+
+		:param row: Строка файла индекса.
+		:type row: Sequence
+		:return: Индексная запись.
+		:rtype: IndexRecord
+		"""
+
+		UserID, Timestamp, IsPremium, IsChatForbidden, Language, Flags, Permissions = row
+		LastActivity = datetime.fromtimestamp(Timestamp) if Timestamp is not None else None
+
+		return IndexRecord(UserID, LastActivity, IsPremium, IsChatForbidden, Language, frozenset(Flags), frozenset(Permissions))
+
+	def __WriteJournal(self, rows: Iterable[Sequence]):
+		"""
+		Дописывает строки в журнал изменений, если он открыт. Удаление пользователя записывается строкой из одного ID. При разрастании журнала индекс записывается в файл.
+
+		:param rows: Последовательность строк журнала.
+		:type rows: Iterable[Sequence]
+		"""
+
+		if not self.__Journal: return
+		Lines = [orjson.dumps(Row) + b"\n" for Row in rows]
+		self.__Journal.write(b"".join(Lines))
+		self.__Journal.flush()
+		self.__JournalSize += len(Lines)
+
+		if self.__JournalSize > max(self.COMPACTION_THRESHOLD, len(self.__Records)): self.save()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, path: str | PathLike[str]):
+		"""
+		Вторичный индекс метаданных пользователей.
+
+		:param path: Путь к файлу индекса.
+		:type path: str | PathLike[str]
+		"""
+
+		self.__Path = Path(path)
+		self.__JournalPath = self.__Path.with_name(self.__Path.name + ".journal")
+		self.__Lock = RLock()
+		self.__Journal: BinaryIO | None = None
+		self.__JournalSize = 0
+
+		self.__Records: dict[int, IndexRecord] = {}
+		self.__Activity: dict[int, set[int]] = {}
+		self.__Buckets: list[int] = []
+		self.__Inactive: set[int] = set()
+		self.__Flags: dict[str, set[int]] = {}
+		self.__Permissions: dict[str, set[int]] = {}
+		self.__Premium: set[int] = set()
+		self.__ChatForbidden: set[int] = set()
+
+	def __contains__(self, user_id: int) -> bool:
+		"""
+		Проверяет наличие индексной записи пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если пользователь проиндексирован.
+		:rtype: bool
+		"""
+
+		return user_id in self.__Records
+
+	def __len__(self) -> int:
+		"""
+		Возвращает количество проиндексированных пользователей.
+
+		:return: Количество пользователей.
+		:rtype: int
+		"""
+
+		return len(self.__Records)
+
+	def clear(self, persistent: bool = False):
+		"""
+		Очищает индекс и прекращает ведение журнала изменений до следующего считывания или записи файла индекса.
+
+		:param persistent: Указывает, нужно ли также удалить файл индекса и журнал.
+		:type persistent: bool
+		"""
+
+		with self.__Lock:
+			self.close()
+			self.__Records = {}
+			self.__Activity = {}
+			self.__Buckets = []
+			self.__Inactive = set()
+			self.__Flags = {}
+			self.__Permissions = {}
+			self.__Premium = set()
+			self.__ChatForbidden = set()
+
+			if persistent:
+				if self.__Path.exists(): os.remove(self.__Path)
+				if self.__JournalPath.exists(): os.remove(self.__JournalPath)
+
+	def close(self):
+		"""Закрывает журнал изменений. Файл индекса не записывается."""
+
+		with self.__Lock:
+			if self.__Journal: self.__Journal.close()
+			self.__Journal = None
+			self.__JournalSize = 0
+
+	def find(self, flags: Sequence[str] | str | None = None, permissions: Sequence[str] | str | None = None, is_premium: bool | None = None, is_chat_forbidden: bool | None = None, language: str | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID пользователей, удовлетворяющих всем переданным условиям. Неуказанные условия не проверяются.
+
+		:param flags: Флаги, которые должны быть активированы у пользователя.
+		:type flags: Sequence[str] | str | None
+		:param permissions: Права, которыми должен обладать пользователь.
+		:type permissions: Sequence[str] | str | None
+		:param is_premium: Состояние Premium-подписки.
+		:type is_premium: bool | None
+		:param is_chat_forbidden: Состояние запрета контакта с пользователем.
+		:type is_chat_forbidden: bool | None
+		:param language: Код языка по стандарту ISO 639-1.
+		:type language: str | None
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		with self.__Lock:
+			Candidates: list[set[int]] = []
+
+			if flags is not None: Candidates += [self.__Flags.get(Flag, set()) for Flag in ToSequence(flags)]
+			if permissions is not None: Candidates += [self.__Permissions.get(Permission, set()) for Permission in ToSequence(permissions)]
+			if is_premium: Candidates.append(self.__Premium)
+			if is_chat_forbidden: Candidates.append(self.__ChatForbidden)
+
+			Candidates.sort(key = len)
+			Result = set(Candidates[0]) if Candidates else set(self.__Records.keys())
+			for Candidate in Candidates[1:]: Result &= Candidate
+
+			if is_premium is False: Result -= self.__Premium
+			if is_chat_forbidden is False: Result -= self.__ChatForbidden
+			if language is not None: Result = {UserID for UserID in Result if self.__Records[UserID].language == language}
+
+			return tuple(Result)
+
+	def get(self, user_id: int) -> IndexRecord:
+		"""
+		Возвращает индексную запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии пользователя в индексе.
+		:return: Индексная запись.
+		:rtype: IndexRecord
+		"""
+
+		return self.__Records[user_id]
+
+	def get_active(self, start: datetime, end: datetime | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID пользователей, последняя активность которых попадает в указанный интервал.
+
+		:param start: Начало интервала включительно.
+		:type start: datetime
+		:param end: Конец интервала включительно. По умолчанию не ограничен.
+		:type end: datetime | None
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		Start = start.timestamp()
+		End = end.timestamp() if end else None
+		Stop = End if End is not None else float("inf")
+		Active: list[int] = []
+
+		with self.__Lock:
+
+			for IsPartial, UsersID in self.__IterateBuckets(Start, End):
+
+				if not IsPartial: Active += UsersID
+				else: Active += [UserID for UserID in UsersID if Start <= self.__GetTimestamp(UserID) <= Stop]
+
+			return tuple(Active)
+
+	def get_inactive(self, before: datetime, among: Collection[int] | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID пользователей, последняя активность которых была раньше указанного момента или отсутствует.
+
+		Затрагиваются только устаревшие интервалы активности. Если передано ограничивающее множество меньшего размера, чем количество неактивных пользователей, вместо интервалов проверяются его элементы, поэтому сложность выборки не превышает меньшего из размеров.
+
+		:param before: Момент времени, до которого активность считается устаревшей.
+		:type before: datetime
+		:param among: Множество ID пользователей, которым ограничивается выборка. По умолчанию не ограничена.
+		:type among: Collection[int] | None
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		Before = before.timestamp()
+
+		with self.__Lock:
+			Buckets = tuple(self.__IterateBuckets(None, Before))
+
+			if among is not None and len(among) < len(self.__Inactive) + sum(len(UsersID) for _, UsersID in Buckets):
+				return tuple(UserID for UserID in among if UserID in self.__Records and self.__GetTimestamp(UserID) < Before)
+
+			Inactive = list(self.__Inactive)
+
+			for IsPartial, UsersID in Buckets:
+				if not IsPartial: Inactive += UsersID
+				else: Inactive += [UserID for UserID in UsersID if self.__GetTimestamp(UserID) < Before]
+
+			if among is not None: Inactive = [UserID for UserID in Inactive if UserID in among]
+
+			return tuple(Inactive)
+
+	def load(self) -> bool:
+		"""
+		Считывает индекс из файла, применяет к нему журнал изменений и начинает ведение нового журнала.
+
+		:return: Возвращает `True`, если индекс был считан.
+		:rtype: bool
+		"""
+
+		if not self.__Path.exists(): return False
+		with open(self.__Path, "rb") as FileReader: Rows = {Row[0]: Row for Row in orjson.loads(FileReader.read())}
+		JournalSize = 0
+		IsDamaged = False
+
+		if self.__JournalPath.exists():
+
+			with open(self.__JournalPath, "rb") as FileReader:
+
+				for Line in FileReader:
+					# Последняя строка может быть записана не полностью при аварийном завершении.
+					try: Row = orjson.loads(Line)
+
+					except orjson.JSONDecodeError:
+						IsDamaged = True
+						break
+
+					if len(Row) == 1: Rows.pop(Row[0], None)
+					else: Rows[Row[0]] = Row
+					JournalSize += 1
+
+		with self.__Lock:
+			self.clear()
+			self.update_many(self.__FromRow(Row) for Row in Rows.values())
+
+			# Повреждённый хвост журнала отбрасывается перезаписью индекса, иначе журнал дополняется.
+			if IsDamaged: self.save()
+
+			else:
+				self.__Journal = open(self.__JournalPath, "ab")
+				self.__JournalSize = JournalSize
+
+		return True
+
+	def remove(self, user_id: int):
+		"""
+		Удаляет пользователя из индекса. Отсутствие пользователя игнорируется.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		"""
+
+		with self.__Lock:
+			if user_id not in self.__Records: return
+			self.__Discard(user_id)
+			self.__WriteJournal(((user_id,),))
+
+	def save(self):
+		"""Атомарно записывает индекс в файл, очищает журнал изменений и начинает его ведение."""
+
+		with self.__Lock:
+			Rows = [self.__ToRow(Record) for Record in self.__Records.values()]
+			AtomicWrite(self.__Path, orjson.dumps(Rows))
+			if self.__Journal: self.__Journal.close()
+			self.__Journal = open(self.__JournalPath, "wb")
+			self.__JournalSize = 0
+
+	def update(self, record: IndexRecord):
+		"""
+		Добавляет или обновляет индексную запись пользователя.
+
+		:param record: Индексная запись.
+		:type record: IndexRecord
+		"""
+
+		with self.__Lock:
+			if self.__Records.get(record.id) == record: return
+			self.__Discard(record.id)
+			self.__Link(record)
+			self.__WriteJournal((self.__ToRow(record),))
+
+	def update_many(self, records: Iterable[IndexRecord]):
+		"""
+		Добавляет или обновляет индексные записи нескольких пользователей. Изменения записываются в журнал одной операцией, поэтому метод следует использовать для массового заполнения индекса.
+
+		:param records: Последовательность индексных записей.
+		:type records: Iterable[IndexRecord]
+		"""
+
+		with self.__Lock:
+			Changed = {Record.id: Record for Record in records if self.__Records.get(Record.id) != Record}
+			if not Changed: return
+
+			for Record in Changed.values():
+				self.__Discard(Record.id)
+				self.__Link(Record)
+
+			self.__WriteJournal(self.__ToRow(Record) for Record in Changed.values())
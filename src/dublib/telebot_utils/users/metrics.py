@@ -0,0 +1,269 @@
+import logging
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Sequence
+
+from ...core import LOGS_HANDLER
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
+#==========================================================================================#
+# >>>>> КОНСТАНТЫ <<<<< #
+#==========================================================================================#
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class Histogram:
+	"""Гистограмма длительностей с фиксированными границами интервалов."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def bounds(self) -> tuple[float, ...]:
+		"""Верхние границы интервалов в секундах."""
+
+		return self.__Bounds
+
+	@property
+	def count(self) -> int:
+		"""Количество наблюдений."""
+
+		return self.__Count
+
+	@property
+	def sum(self) -> float:
+		"""Сумма наблюдений в секундах."""
+
+		return self.__Sum
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+		"""
+		Гистограмма длительностей.
+
+		:param bounds: Возрастающая последовательность верхних границ интервалов в секундах.
+		:type bounds: Sequence[float]
+		"""
+
+		self.__Bounds = tuple(bounds)
+		self.__Buckets = [0] * (len(self.__Bounds) + 1)
+		self.__Count = 0
+		self.__Sum = 0.0
+
+	def get_cumulative_counts(self) -> tuple[int, ...]:
+		"""
+		Возвращает накопленные количества наблюдений для каждой границы, включая последнюю бесконечную.
+
+		:return: Последовательность количеств.
+		:rtype: tuple[int, ...]
+		"""
+
+		Counts = []
+		Total = 0
+
+		for Count in self.__Buckets:
+			Total += Count
+			Counts.append(Total)
+
+		return tuple(Counts)
+
+	def observe(self, value: float):
+		"""
+		Регистрирует наблюдение. Не является потокобезопасным и вызывается под блокировкой `Metrics`.
+
+		:param value: Длительность в секундах.
+		:type value: float
+		"""
+
+		self.__Buckets[bisect_left(self.__Bounds, value)] += 1
+		self.__Count += 1
+		self.__Sum += value
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Metrics:
+	"""
+	Метрики работы менеджера пользователей: счётчики, гистограммы длительностей и вычисляемые при чтении показатели.
+
+	Значения передаются подписчикам синхронно в момент регистрации, а также могут быть выгружены в текстовом формате Prometheus.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def counters(self) -> dict[str, int]:
+		"""Копия словаря счётчиков."""
+
+		with self.__Lock: return self.__Counters.copy()
+
+	@property
+	def gauges(self) -> dict[str, float]:
+		"""Текущие значения вычисляемых показателей."""
+
+		return {Name: Function() for Name, Function in self.__Gauges.items()}
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Notify(self, subscriber: Callable[[str, float], None], name: str, value: float):
+		"""
+		Передаёт значение метрики подписчику, записывая его исключения в лог.
+
+		:param subscriber: Подписчик.
+		:type subscriber: Callable[[str, float], None]
+		:param name: Название метрики.
+		:type name: str
+		:param value: Значение.
+		:type value: float
+		"""
+
+		try: subscriber(name, value)
+		except Exception: LOGGER.exception(f"Metrics subscriber {subscriber} failed.")
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+		"""
+		Метрики работы менеджера пользователей.
+
+		:param buckets: Возрастающая последовательность верхних границ интервалов гистограмм в секундах.
+		:type buckets: Sequence[float]
+		"""
+
+		self.__BucketsBounds = tuple(buckets)
+		self.__Counters: dict[str, int] = {}
+		self.__Histograms: dict[str, Histogram] = {}
+		self.__Gauges: dict[str, Callable[[], float]] = {}
+		self.__Subscribers: tuple[Callable[[str, float], None], ...] = ()
+		self.__Lock = Lock()
+
+	def get_histogram(self, name: str) -> Histogram | None:
+		"""
+		Возвращает гистограмму.
+
+		:param name: Название гистограммы.
+		:type name: str
+		:return: Гистограмма или `None`, если наблюдений не было.
+		:rtype: Histogram | None
+		"""
+
+		return self.__Histograms.get(name)
+
+	def increment(self, name: str, value: int = 1):
+		"""
+		Увеличивает счётчик.
+
+		:param name: Название счётчика.
+		:type name: str
+		:param value: Прибавляемое значение. По умолчанию 1.
+		:type value: int
+		"""
+
+		with self.__Lock:
+			self.__Counters[name] = self.__Counters.get(name, 0) + value
+			Subscribers = self.__Subscribers
+
+		for Subscriber in Subscribers: self.__Notify(Subscriber, name, value)
+
+	def observe(self, name: str, value: float):
+		"""
+		Регистрирует длительность в гистограмме.
+
+		:param name: Название гистограммы.
+		:type name: str
+		:param value: Длительность в секундах.
+		:type value: float
+		"""
+
+		with self.__Lock:
+			if name not in self.__Histograms: self.__Histograms[name] = Histogram(self.__BucketsBounds)
+			self.__Histograms[name].observe(value)
+			Subscribers = self.__Subscribers
+
+		for Subscriber in Subscribers: self.__Notify(Subscriber, name, value)
+
+	def register_gauge(self, name: str, function: Callable[[], float]):
+		"""
+		Регистрирует показатель, значение которого вычисляется при чтении.
+
+		:param name: Название показателя.
+		:type name: str
+		:param function: Функция, возвращающая текущее значение.
+		:type function: Callable[[], float]
+		"""
+
+		self.__Gauges[name] = function
+
+	def subscribe(self, callback: Callable[[str, float], None]):
+		"""
+		Добавляет подписчика, получающего название метрики и значение при каждом увеличении счётчика или наблюдении. Исключения подписчика записываются в лог.
+
+		:param callback: Функция, принимающая название метрики и значение.
+		:type callback: Callable[[str, float], None]
+		"""
+
+		with self.__Lock: self.__Subscribers += (callback,)
+
+	def to_prometheus(self, prefix: str = "dublib_users") -> str:
+		"""
+		Выгружает метрики в текстовом формате Prometheus.
+
+		:param prefix: Префикс названий метрик.
+		:type prefix: str
+		:return: Текст для ответа конечной точке сбора метрик.
+		:rtype: str
+		"""
+
+		Lines = []
+
+		with self.__Lock:
+
+			for Name, Value in sorted(self.__Counters.items()):
+				Lines += [f"# TYPE {prefix}_{Name} counter", f"{prefix}_{Name} {Value}"]
+
+			for Name, Data in sorted(self.__Histograms.items()):
+				Lines.append(f"# TYPE {prefix}_{Name} histogram")
+				Bounds = [repr(Bound) for Bound in Data.bounds] + ["+Inf"]
+				Lines += [f"{prefix}_{Name}_bucket{{le=\"{Bound}\"}} {Count}" for Bound, Count in zip(Bounds, Data.get_cumulative_counts())]
+				Lines += [f"{prefix}_{Name}_sum {Data.sum}", f"{prefix}_{Name}_count {Data.count}"]
+
+		for Name, Gauge in sorted(self.gauges.items()):
+			Lines += [f"# TYPE {prefix}_{Name} gauge", f"{prefix}_{Name} {Gauge}"]
+
+		return "\n".join(Lines) + "\n"
+
+	def unsubscribe(self, callback: Callable[[str, float], None]):
+		"""
+		Удаляет подписчика.
+
+		:param callback: Функция, переданная при подписке.
+		:type callback: Callable[[str, float], None]
+		:raise ValueError: Выбрасывается, если функция не подписана.
+		"""
+
+		with self.__Lock:
+			Subscribers = list(self.__Subscribers)
+			Subscribers.remove(callback)
+			self.__Subscribers = tuple(Subscribers)
@@ -0,0 +1,306 @@
+import atexit
+import logging
+import time
+from collections import OrderedDict
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Callable
+
+from ...core import LOGS_HANDLER
+from ...exceptions import telebot_utils as Exceptions
+
+if TYPE_CHECKING:
+	from . import UserData
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class SavingQueue:
+	"""
+	Очередь отложенного сохранения пользователей.
+
+	Хранит упорядоченное множество пользователей без повторов, поэтому серия изменений одного пользователя в пределах задержки приводит к одной записи. Очередь удерживает ссылки на объекты данных, поэтому изменения вытесненных из памяти пользователей также будут сохранены. Задачи обрабатываются пулом потоков пакетами, а пакеты, сохранить которые не удалось, повторно обрабатываются с нарастающей задержкой.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def delay(self) -> float:
+		"""Задержка в секундах между первым помещением пользователя в очередь и его сохранением."""
+
+		return self.__Delay
+
+	@property
+	def is_closed(self) -> bool:
+		"""Состояние: закрыта ли очередь."""
+
+		return self.__IsClosed
+
+	@property
+	def max_size(self) -> int | None:
+		"""Максимальное количество ожидающих задач, при достижении которого добавление блокируется."""
+
+		return self.__MaxSize
+
+	@property
+	def workers(self) -> int:
+		"""Количество потоков обработки."""
+
+		return len(self.__Workers)
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Complete(self, batch: tuple["UserData", ...], is_failed: bool):
+		"""
+		Завершает обработку пакета. Пользователи неудачно обработанного пакета возвращаются в очередь повторных попыток, если их количество не исчерпано.
+
+		:param batch: Пакет пользователей.
+		:type batch: tuple[UserData, ...]
+		:param is_failed: Указывает, завершилась ли обработка пакета ошибкой.
+		:type is_failed: bool
+		"""
+
+		with self.__Condition:
+			Now = time.monotonic()
+
+			for User in batch:
+				Sequence = self.__Active.pop(User.id)
+
+				if not is_failed:
+					self.__Attempts.pop(User.id, None)
+					continue
+
+				Attempt = self.__Attempts.get(User.id, 0) + 1
+
+				if Attempt > self.__Retries:
+					self.__Attempts.pop(User.id, None)
+					LOGGER.error(f"Saving of {User} failed {Attempt} times. Changes will be saved only after next modification.")
+					continue
+
+				self.__Attempts[User.id] = Attempt
+				# Поступившая во время обработки задача того же пользователя уже включит все изменения.
+				if User.id not in self.__Tasks: self.__Delayed[User.id] = (User, Now + self.__RetryDelay * 2 ** (Attempt - 1), Sequence)
+
+			self.__Condition.notify_all()
+
+	def __IsPending(self, sequence: int) -> bool:
+		"""
+		Проверяет, остались ли необработанные задачи, добавленные не позднее задачи с указанным порядковым номером.
+
+		:param sequence: Порядковый номер задачи.
+		:type sequence: int
+		:return: Возвращает `True`, если такие задачи остались.
+		:rtype: bool
+		"""
+
+		if self.__Tasks and next(iter(self.__Tasks.values()))[2] <= sequence: return True
+		if any(Task[2] <= sequence for Task in self.__Delayed.values()): return True
+
+		return any(Sequence <= sequence for Sequence in self.__Active.values())
+
+	def __Select(self, is_urgent: bool) -> tuple[list[tuple[OrderedDict, int]], float | None]:
+		"""
+		Отбирает пакет готовых к сохранению задач. Повторные попытки выдерживают задержку даже при срочной обработке.
+
+		:param is_urgent: Указывает, нужно ли отбирать задачи без учёта задержки.
+		:type is_urgent: bool
+		:return: Пакет в виде пар из содержащего задачу словаря и ID пользователя, а также время в секундах до готовности ближайшей задачи или `None`, если ожидать нечего.
+		:rtype: tuple[list[tuple[OrderedDict, int]], float | None]
+		"""
+
+		Now = time.monotonic()
+		Deadlines: list[float] = []
+		Batch: list[tuple[OrderedDict, int]] = []
+
+		for UserID, (_, Deadline, _) in self.__Delayed.items():
+			if len(Batch) == self.__BatchSize: break
+			if UserID in self.__Active: continue
+
+			if Deadline > Now: Deadlines.append(Deadline)
+			else: Batch.append((self.__Delayed, UserID))
+
+		for UserID, (_, Deadline, _) in self.__Tasks.items():
+			if len(Batch) == self.__BatchSize: break
+
+			if Deadline > Now and not is_urgent:
+				Deadlines.append(Deadline)
+				break
+
+			# Пользователь, сохраняемый другим потоком, остаётся в очереди до завершения записи.
+			if UserID not in self.__Active: Batch.append((self.__Tasks, UserID))
+
+		return Batch, min(Deadlines) - Now if Deadlines else None
+
+	def __Take(self) -> tuple["UserData", ...] | None:
+		"""
+		Ожидает готовые к сохранению задачи и извлекает пакет из них.
+
+		:return: Последовательность пользователей или `None`, если очередь закрыта и все задачи выполнены.
+		:rtype: tuple[UserData, ...] | None
+		"""
+
+		with self.__Condition:
+
+			while True:
+				if not self.__Tasks and not self.__Delayed and not self.__Active and self.__IsClosed: return None
+				Batch, Timeout = self.__Select(bool(self.__Flushers) or self.__IsClosed)
+
+				if Batch:
+					Users = []
+
+					for Container, UserID in Batch:
+						User, _, Sequence = Container.pop(UserID)
+						self.__Active[UserID] = Sequence
+						Users.append(User)
+
+					self.__Condition.notify_all()
+
+					return tuple(Users)
+
+				self.__Condition.wait(Timeout)
+
+	def __Work(self):
+		"""Цикл потока обработки."""
+
+		while True:
+			Batch = self.__Take()
+			if Batch is None: break
+			IsFailed = False
+
+			try: self.__Processor(Batch)
+
+			except Exception:
+				LOGGER.exception("Saving queue batch processing failed.")
+				IsFailed = True
+
+			self.__Complete(Batch, IsFailed)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, processor: Callable[[tuple["UserData", ...]], None], workers: int = 1, delay: float = 0.0, max_size: int | None = None, batch_size: int = 100, retries: int = 3, retry_delay: float = 0.5):
+		"""
+		Очередь отложенного сохранения пользователей.
+
+		:param processor: Функция, выполняющая сохранение пакета пользователей.
+		:type processor: Callable[[tuple[UserData, ...]], None]
+		:param workers: Количество потоков обработки. По умолчанию 1.
+		:type workers: int
+		:param delay: Задержка в секундах между первым помещением пользователя в очередь и его сохранением. Все изменения за это время объединяются в одну запись. По умолчанию 0.
+		:type delay: float
+		:param max_size: Максимальное количество ожидающих задач. При достижении добавление новых пользователей блокируется до освобождения места. По умолчанию не ограничено.
+		:type max_size: int | None
+		:param batch_size: Максимальное количество пользователей, передаваемых обработчику за один вызов. По умолчанию 100.
+		:type batch_size: int
+		:param retries: Количество повторных попыток сохранения пользователя после ошибки обработки. По умолчанию 3.
+		:type retries: int
+		:param retry_delay: Задержка в секундах перед первой повторной попыткой, удваиваемая для каждой следующей. По умолчанию 0.5.
+		:type retry_delay: float
+		:raise ValueError: Выбрасывается при неверных параметрах очереди.
+		"""
+
+		if workers < 1: raise ValueError("Workers count must be positive.")
+		if delay < 0: raise ValueError("Delay can't be negative.")
+		if max_size is not None and max_size < 1: raise ValueError("Queue size must be positive.")
+		if batch_size < 1: raise ValueError("Batch size must be positive.")
+		if retries < 0 or retry_delay < 0: raise ValueError("Retries parameters can't be negative.")
+
+		self.__Processor = processor
+		self.__Delay = delay
+		self.__MaxSize = max_size
+		self.__BatchSize = batch_size
+		self.__Retries = retries
+		self.__RetryDelay = retry_delay
+
+		self.__Tasks: OrderedDict[int, tuple["UserData", float, int]] = OrderedDict()
+		self.__Delayed: OrderedDict[int, tuple["UserData", float, int]] = OrderedDict()
+		self.__Attempts: dict[int, int] = {}
+		self.__Active: dict[int, int] = {}
+		self.__Sequence = 0
+		self.__Condition = Condition()
+		self.__Flushers = 0
+		self.__IsClosed = False
+
+		self.__Workers = tuple(Thread(target = self.__Work, name = f"Users manager saving queue #{Index}.", daemon = True) for Index in range(workers))
+		for Worker in self.__Workers: Worker.start()
+		atexit.register(self.close)
+
+	def __contains__(self, user_id: int) -> bool:
+		"""
+		Проверяет, ожидает ли пользователь сохранения.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если пользователь находится в очереди.
+		:rtype: bool
+		"""
+
+		return user_id in self.__Tasks or user_id in self.__Delayed
+
+	def __len__(self) -> int:
+		"""
+		Возвращает количество ожидающих сохранения пользователей.
+
+		:return: Количество задач.
+		:rtype: int
+		"""
+
+		return len(self.__Tasks) + len(self.__Delayed)
+
+	def close(self):
+		"""Выполняет все ожидающие сохранения и останавливает потоки обработки. Повторный вызов игнорируется."""
+
+		with self.__Condition:
+			if self.__IsClosed: return
+			self.__IsClosed = True
+			self.__Condition.notify_all()
+
+		for Worker in self.__Workers: Worker.join()
+		atexit.unregister(self.close)
+
+	def flush(self):
+		"""Немедленно выполняет все сохранения, ожидающие на момент вызова, без учёта задержки и дожидается их завершения. Поступающие во время ожидания задачи не продлевают его."""
+
+		with self.__Condition:
+			Sequence = self.__Sequence
+			self.__Flushers += 1
+			self.__Condition.notify_all()
+
+			try:
+				while self.__IsPending(Sequence): self.__Condition.wait()
+
+			finally: self.__Flushers -= 1
+
+	def put(self, user: "UserData"):
+		"""
+		Помещает пользователя в очередь. Если пользователь уже ожидает сохранения, в том числе повторного, вызов игнорируется.
+
+		При достижении максимального размера очереди блокирует вызывающий поток до освобождения места. Сохраняемые в данный момент пользователи помещаются в очередь без ожидания, так как поток обработки может ожидать освобождения их блокировок.
+
+		:param user: Данные пользователя.
+		:type user: UserData
+		:raise SavingQueueBlocked: Выбрасывается при попытке добавления в закрытую очередь.
+		"""
+
+		with self.__Condition:
+			while self.__MaxSize and len(self.__Tasks) >= self.__MaxSize and user.id not in self.__Tasks and user.id not in self.__Active and not self.__IsClosed: self.__Condition.wait()
+			if self.__IsClosed: raise Exceptions.SavingQueueBlocked()
+			# Ожидающая повторная попытка сохранит и новые изменения.
+			if user.id in self.__Tasks or user.id in self.__Delayed: return
+
+			self.__Sequence += 1
+			self.__Tasks[user.id] = (user, time.monotonic() + self.__Delay, self.__Sequence)
+			self.__Condition.notify_all()
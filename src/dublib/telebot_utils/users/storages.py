@@ -0,0 +1,1115 @@
+import functools
+import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from os import PathLike
+from pathlib import Path
+from threading import Condition, RLock, Thread
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Sequence
+
+import orjson
+
+from ...core import LOGS_HANDLER
+from ...functions.data import Copy
+from ...functions.filesystem import AtomicWrite
+from .codecs import DecodeRecord
+
+if TYPE_CHECKING:
+	from . import UsersManager
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ СИСТЕМЫ ЛОГГИРОВАНИЯ <<<<< #
+#==========================================================================================#
+
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(LOGS_HANDLER)
+LOGGER.setLevel(logging.INFO)
+
+#==========================================================================================#
+# >>>>> КОНСТАНТЫ <<<<< #
+#==========================================================================================#
+
+RECORD_EXTENSIONS = ("json", "msgpack")
+SHARD_NAMES = frozenset(f"{Index:02x}" for Index in range(256))
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def GetShardDirectory(directory: Path, user_id: int, depth: int) -> Path:
+	"""
+	Возвращает каталог сегмента, в котором размещается файл пользователя. Каждый уровень вложенности именуется шестнадцатеричным значением очередного младшего байта ID, поэтому последовательно выдаваемые ID распределяются по сегментам равномерно.
+
+	:param directory: Путь к корневому каталогу файлов пользователей.
+	:type directory: Path
+	:param user_id: ID пользователя.
+	:type user_id: int
+	:param depth: Глубина вложенности сегментов. При значении 0 возвращается корневой каталог.
+	:type depth: int
+	:return: Путь к каталогу сегмента.
+	:rtype: Path
+	"""
+
+	for Level in range(depth): directory /= f"{user_id >> 8 * Level & 0xFF:02x}"
+
+	return directory
+
+#==========================================================================================#
+# >>>>> ФУНКЦИИ ЧТЕНИЯ В ДОЧЕРНИХ ПРОЦЕССАХ <<<<< #
+#==========================================================================================#
+
+def ReadFileRecord(directory: Path, user_id: int, extensions: Sequence[str]) -> dict:
+	"""
+	Считывает файл пользователя из каталога `JSONStorage`, перебирая расширения по порядку. Формат записи определяется по содержимому.
+
+	:param directory: Путь к каталогу, содержащему файл пользователя.
+	:type directory: Path
+	:param user_id: ID пользователя.
+	:type user_id: int
+	:param extensions: Последовательность расширений файлов записей.
+	:type extensions: Sequence[str]
+	:raise FileNotFoundError: Выбрасывается при отсутствии файла пользователя.
+	:return: Сериализуемый словарь данных пользователя.
+	:rtype: dict
+	"""
+
+	for Extension in extensions:
+		try:
+			with open(directory / f"{user_id}.{Extension}", "rb") as FileReader: return DecodeRecord(FileReader.read())
+
+		except FileNotFoundError: pass
+
+	raise FileNotFoundError(directory / str(user_id))
+
+def ReadFileRecords(directory: Path, shard_depth: int, extensions: Sequence[str], users_id: Sequence[int]) -> dict[int, dict]:
+	"""
+	Считывает файлы пользователей из каталога `JSONStorage`. Отсутствующие файлы пропускаются.
+
+	:param directory: Путь к корневому каталогу файлов пользователей.
+	:type directory: Path
+	:param shard_depth: Глубина вложенности сегментов.
+	:type shard_depth: int
+	:param extensions: Последовательность расширений файлов записей.
+	:type extensions: Sequence[str]
+	:param users_id: Последовательность ID пользователей.
+	:type users_id: Sequence[int]
+	:return: Словарь записей, ключами которого являются ID пользователей.
+	:rtype: dict[int, dict]
+	"""
+
+	Records = {}
+
+	for UserID in users_id:
+		try: Records[UserID] = ReadFileRecord(GetShardDirectory(directory, UserID, shard_depth), UserID, extensions)
+		except FileNotFoundError: pass
+
+	return Records
+
+def ReadSQLiteRecords(path: Path, users_id: Sequence[int]) -> dict[int, dict]:
+	"""
+	Считывает записи пользователей из базы данных `SQLiteStorage` через отдельное подключение только для чтения. Отсутствующие записи пропускаются.
+
+	:param path: Путь к файлу базы данных.
+	:type path: Path
+	:param users_id: Последовательность ID пользователей.
+	:type users_id: Sequence[int]
+	:return: Словарь записей, ключами которого являются ID пользователей.
+	:rtype: dict[int, dict]
+	"""
+
+	Records = {}
+	Connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri = True)
+
+	try:
+
+		for Index in range(0, len(users_id), 500):
+			Chunk = tuple(users_id[Index:Index + 500])
+			Placeholders = ", ".join("?" * len(Chunk))
+			for UserID, Record in Connection.execute(f"SELECT id, record FROM users WHERE id IN ({Placeholders})", Chunk): Records[UserID] = DecodeRecord(Record)
+
+	finally: Connection.close()
+
+	return Records
+
+#==========================================================================================#
+# >>>>> БАЗОВЫЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class BaseStorage(ABC):
+	"""Базовое хранилище записей пользователей."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def manager(self) -> "UsersManager":
+		"""Менеджер пользователей, к которому привязано хранилище."""
+
+		if not self._Manager: raise RuntimeError("Storage not binded to users manager.")
+
+		return self._Manager
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self):
+		"""Базовое хранилище записей пользователей."""
+
+		self._Manager: "UsersManager | None" = None
+
+	def bind(self, manager: "UsersManager"):
+		"""
+		Привязывает хранилище к менеджеру пользователей. Вызывается менеджером автоматически при инициализации.
+
+		:param manager: Менеджер пользователей.
+		:type manager: UsersManager
+		"""
+
+		self._Manager = manager
+
+	def close(self):
+		"""Освобождает ресурсы хранилища."""
+
+		pass
+
+	@abstractmethod
+	def delete(self, user_id: int):
+		"""
+		Удаляет запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		"""
+
+		pass
+
+	@abstractmethod
+	def exists(self, user_id: int) -> bool:
+		"""
+		Проверяет наличие записи пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если запись найдена.
+		:rtype: bool
+		"""
+
+		pass
+
+	def get_loader(self) -> Callable[[Sequence[int]], dict[int, dict]] | None:
+		"""
+		Возвращает сериализуемую функцию чтения записей для выполнения в дочернем процессе. Принимает последовательность ID пользователей и возвращает словарь записей аналогично `load_many()`.
+
+		Функция не должна ссылаться на менеджер и открытые ресурсы хранилища. Хранилища, не поддерживающие чтение из других процессов, возвращают `None`.
+
+		:return: Функция чтения записей или `None`.
+		:rtype: Callable[[Sequence[int]], dict[int, dict]] | None
+		"""
+
+		return None
+
+	@abstractmethod
+	def get_path(self, user_id: int) -> Path:
+		"""
+		Возвращает путь к файлу, в котором хранится запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Путь к файлу.
+		:rtype: Path
+		"""
+
+		pass
+
+	@abstractmethod
+	def get_users_id(self) -> tuple[int, ...]:
+		"""
+		Возвращает последовательность ID всех пользователей, имеющих запись в хранилище.
+
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		pass
+
+	@abstractmethod
+	def load(self, user_id: int) -> dict:
+		"""
+		Считывает запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		:return: Сериализуемый словарь данных пользователя.
+		:rtype: dict
+		"""
+
+		pass
+
+	def load_many(self, users_id: Iterable[int]) -> dict[int, dict]:
+		"""
+		Считывает записи нескольких пользователей. Отсутствующие записи пропускаются.
+
+		:param users_id: Последовательность ID пользователей.
+		:type users_id: Iterable[int]
+		:return: Словарь записей, ключами которого являются ID пользователей.
+		:rtype: dict[int, dict]
+		"""
+
+		Records = {}
+
+		for UserID in users_id:
+			try: Records[UserID] = self.load(UserID)
+			except KeyError: pass
+
+		return Records
+
+	@abstractmethod
+	def save(self, user_id: int, record: dict):
+		"""
+		Записывает данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		"""
+
+		pass
+
+	def save_many(self, records: dict[int, dict]):
+		"""
+		Записывает данные нескольких пользователей. Хранилища, поддерживающие транзакции, выполняют запись за одну фиксацию.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict]
+		"""
+
+		for UserID, Record in records.items(): self.save(UserID, Record)
+
+#==========================================================================================#
+# >>>>> ХРАНИЛИЩА <<<<< #
+#==========================================================================================#
+
+class JSONStorage(BaseStorage):
+	"""
+	Хранилище, размещающее запись каждого пользователя в отдельном файле. Используется по умолчанию.
+
+	Формат и расширение файлов определяются кодеком менеджера. Файлы в формате прежнего кодека прозрачно считываются и заменяются при следующей записи пользователя.
+
+	Для большого количества пользователей файлы можно распределить по вложенным каталогам-сегментам вида _ab/cd/<ID>.json_, чтобы ни один каталог не содержал сотни тысяч записей.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def directory(self) -> Path:
+		"""Путь к каталогу файлов пользователей."""
+
+		return self.__Directory
+
+	@property
+	def shard_depth(self) -> int:
+		"""Глубина вложенности каталогов-сегментов. Значение 0 соответствует размещению всех файлов в одном каталоге."""
+
+		return self.__ShardDepth
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetExtensions(self) -> tuple[str, ...]:
+		"""
+		Возвращает расширения файлов записей в порядке поиска: сначала расширение кодека менеджера, затем остальные.
+
+		:return: Последовательность расширений.
+		:rtype: tuple[str, ...]
+		"""
+
+		Extension = self.manager.codec.extension
+
+		return (Extension,) + tuple(Element for Element in RECORD_EXTENSIONS if Element != Extension)
+
+	def __GetShardsDirectories(self) -> list[str]:
+		"""
+		Возвращает пути к каталогам-сегментам нижнего уровня. Посторонние каталоги пропускаются.
+
+		:return: Список путей к каталогам.
+		:rtype: list[str]
+		"""
+
+		Directories = [str(self.__Directory)]
+
+		for _ in range(self.__ShardDepth):
+			Directories = [os.path.join(Directory, Name) for Directory in Directories for Name in os.listdir(Directory) if Name in SHARD_NAMES]
+
+		return Directories
+
+	def __MoveToShards(self):
+		"""Переносит файлы пользователей из корневого каталога в каталоги-сегменты. Перенос каждого файла атомарен, поэтому прерванная миграция продолжается при следующем запуске."""
+
+		Count = 0
+
+		for File in os.listdir(self.__Directory):
+			Name, _, Extension = File.rpartition(".")
+			if Extension not in RECORD_EXTENSIONS or not Name.lstrip("-").isdigit(): continue
+			Directory = GetShardDirectory(self.__Directory, int(Name), self.__ShardDepth)
+			os.makedirs(Directory, exist_ok = True)
+			os.replace(self.__Directory / File, Directory / File)
+			Count += 1
+
+		if Count: LOGGER.info(f"{Count} user files moved to sharded layout.")
+
+	def __Write(self, path: Path, content: bytes):
+		"""
+		Записывает файл пользователя с учётом настройки атомарности менеджера, создавая каталог сегмента при его отсутствии.
+
+		:param path: Путь к файлу.
+		:type path: Path
+		:param content: Закодированная запись.
+		:type content: bytes
+		"""
+
+		for IsRetry in (False, True):
+
+			try:
+				if self.manager.is_atomic_writes: AtomicWrite(path, content)
+				else:
+					with open(path, "wb") as FileWriter: FileWriter.write(content)
+
+				return
+
+			except FileNotFoundError:
+				if IsRetry or not self.__ShardDepth: raise
+				os.makedirs(path.parent, exist_ok = True)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, directory: str | PathLike[str] | None = None, shard_depth: int = 0):
+		"""
+		Хранилище, размещающее запись каждого пользователя в отдельном файле.
+
+		:param directory: Путь к каталогу файлов пользователей. По умолчанию используется каталог менеджера.
+		:type directory: str | PathLike[str] | None
+		:param shard_depth: Глубина вложенности каталогов-сегментов, каждый уровень которой делит файлы на 256 каталогов. При ненулевом значении файлы, размещённые в корневом каталоге, автоматически переносятся в сегменты во время привязки к менеджеру. По умолчанию 0 (все файлы в одном каталоге).
+		:type shard_depth: int
+		:raise ValueError: Выбрасывается при отрицательной глубине вложенности.
+		"""
+
+		if shard_depth < 0: raise ValueError("Shard depth can't be negative.")
+
+		super().__init__()
+		self.__Directory = Path(directory) if directory else Path()
+		self.__IsDirectorySpecified = bool(directory)
+		self.__ShardDepth = shard_depth
+
+	def bind(self, manager: "UsersManager"):
+		"""
+		Привязывает хранилище к менеджеру пользователей. Вызывается менеджером автоматически при инициализации.
+
+		:param manager: Менеджер пользователей.
+		:type manager: UsersManager
+		"""
+
+		super().bind(manager)
+		if not self.__IsDirectorySpecified: self.__Directory = manager.storage_directory
+		os.makedirs(self.__Directory, exist_ok = True)
+		if self.__ShardDepth: self.__MoveToShards()
+
+	def delete(self, user_id: int):
+		"""
+		Удаляет файлы пользователя во всех форматах.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии файла пользователя.
+		"""
+
+		IsDeleted = False
+		Directory = GetShardDirectory(self.__Directory, user_id, self.__ShardDepth)
+
+		for Extension in RECORD_EXTENSIONS:
+			try:
+				os.remove(Directory / f"{user_id}.{Extension}")
+				IsDeleted = True
+
+			except FileNotFoundError: pass
+
+		if not IsDeleted: raise KeyError(user_id)
+
+	def exists(self, user_id: int) -> bool:
+		"""
+		Проверяет наличие файла пользователя в любом формате.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если файл найден.
+		:rtype: bool
+		"""
+
+		Directory = GetShardDirectory(self.__Directory, user_id, self.__ShardDepth)
+
+		return any(os.path.exists(Directory / f"{user_id}.{Extension}") for Extension in self.__GetExtensions())
+
+	def get_path(self, user_id: int) -> Path:
+		"""
+		Возвращает путь к файлу пользователя в формате кодека менеджера.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Путь к файлу.
+		:rtype: Path
+		"""
+
+		return GetShardDirectory(self.__Directory, user_id, self.__ShardDepth) / f"{user_id}.{self.manager.codec.extension}"
+
+	def get_loader(self) -> Callable[[Sequence[int]], dict[int, dict]]:
+		"""
+		Возвращает сериализуемую функцию чтения файлов пользователей для выполнения в дочернем процессе.
+
+		:return: Функция чтения записей.
+		:rtype: Callable[[Sequence[int]], dict[int, dict]]
+		"""
+
+		return functools.partial(ReadFileRecords, self.__Directory, self.__ShardDepth, self.__GetExtensions())
+
+	def get_users_id(self) -> tuple[int, ...]:
+		"""
+		Возвращает последовательность ID всех пользователей, имеющих файл в каталоге или его сегментах.
+
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		Files = (File for Directory in self.__GetShardsDirectories() for File in os.listdir(Directory))
+		UsersID = {int(Name) for Name, _, Extension in (File.rpartition(".") for File in Files) if Extension in RECORD_EXTENSIONS}
+
+		return tuple(UsersID)
+
+	def load(self, user_id: int) -> dict:
+		"""
+		Считывает файл пользователя. Формат записи определяется по содержимому.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии файла пользователя.
+		:return: Сериализуемый словарь данных пользователя.
+		:rtype: dict
+		"""
+
+		try: return ReadFileRecord(GetShardDirectory(self.__Directory, user_id, self.__ShardDepth), user_id, self.__GetExtensions())
+		except FileNotFoundError: raise KeyError(user_id)
+
+	def save(self, user_id: int, record: dict):
+		"""
+		Записывает файл пользователя кодеком менеджера с учётом настроек форматирования и атомарности. Файл пользователя в формате другого кодека удаляется.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		"""
+
+		Codec = self.manager.codec
+		Content = Codec.encode(record, pretty = self.manager.is_pretty_saving_enabled)
+		Directory = GetShardDirectory(self.__Directory, user_id, self.__ShardDepth)
+		self.__Write(Directory / f"{user_id}.{Codec.extension}", Content)
+
+		for Extension in RECORD_EXTENSIONS:
+			if Extension == Codec.extension: continue
+
+			try: os.remove(Directory / f"{user_id}.{Extension}")
+			except FileNotFoundError: pass
+
+class SQLiteStorage(BaseStorage):
+	"""
+	Хранилище, размещающее записи всех пользователей в одном файле базы данных SQLite.
+
+	Записи кодируются кодеком менеджера без форматирования, а при чтении их формат определяется по содержимому. База данных работает в режиме WAL, поэтому фиксация транзакции не требует сброса кэша записи на диск при каждом сохранении, а пакетная запись выполняется одной транзакцией.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу базы данных."""
+
+		return self.__Path
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Connect(self) -> sqlite3.Connection:
+		"""
+		Возвращает открытое подключение к базе данных.
+
+		:raise RuntimeError: Выбрасывается при отсутствии подключения.
+		:return: Подключение к базе данных.
+		:rtype: sqlite3.Connection
+		"""
+
+		if not self.__Connection: raise RuntimeError("Database connection closed.")
+
+		return self.__Connection
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, path: str | PathLike[str] | None = None):
+		"""
+		Хранилище, размещающее записи всех пользователей в одном файле базы данных SQLite.
+
+		:param path: Путь к файлу базы данных. По умолчанию _users.sqlite_ в каталоге менеджера.
+		:type path: str | PathLike[str] | None
+		"""
+
+		super().__init__()
+		self.__Path = Path(path) if path else Path("users.sqlite")
+		self.__IsPathSpecified = bool(path)
+		self.__Connection: sqlite3.Connection | None = None
+		self.__Lock = RLock()
+
+	def bind(self, manager: "UsersManager"):
+		"""
+		Привязывает хранилище к менеджеру пользователей. Вызывается менеджером автоматически при инициализации.
+
+		:param manager: Менеджер пользователей.
+		:type manager: UsersManager
+		"""
+
+		super().bind(manager)
+		if not self.__IsPathSpecified: self.__Path = manager.storage_directory / "users.sqlite"
+		os.makedirs(self.__Path.parent, exist_ok = True)
+
+		with self.__Lock:
+			self.__Connection = sqlite3.connect(self.__Path, check_same_thread = False, isolation_level = None)
+			self.__Connection.execute("PRAGMA journal_mode = WAL")
+			self.__Connection.execute("PRAGMA synchronous = NORMAL")
+			self.__Connection.execute("CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, record BLOB NOT NULL)")
+
+	def close(self):
+		"""Закрывает подключение к базе данных."""
+
+		with self.__Lock:
+			if not self.__Connection: return
+			self.__Connection.close()
+			self.__Connection = None
+
+	def delete(self, user_id: int):
+		"""
+		Удаляет запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		"""
+
+		with self.__Lock:
+			Cursor = self.__Connect().execute("DELETE FROM users WHERE id = ?", (user_id,))
+			if not Cursor.rowcount: raise KeyError(user_id)
+
+	def exists(self, user_id: int) -> bool:
+		"""
+		Проверяет наличие записи пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если запись найдена.
+		:rtype: bool
+		"""
+
+		with self.__Lock:
+			return self.__Connect().execute("SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone() is not None
+
+	def get_path(self, user_id: int) -> Path:
+		"""
+		Возвращает путь к файлу базы данных, общему для всех пользователей.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Путь к файлу.
+		:rtype: Path
+		"""
+
+		return self.__Path
+
+	def get_loader(self) -> Callable[[Sequence[int]], dict[int, dict]]:
+		"""
+		Возвращает сериализуемую функцию чтения записей для выполнения в дочернем процессе. Благодаря режиму WAL чтение не блокирует запись основным процессом.
+
+		:return: Функция чтения записей.
+		:rtype: Callable[[Sequence[int]], dict[int, dict]]
+		"""
+
+		return functools.partial(ReadSQLiteRecords, self.__Path)
+
+	def get_users_id(self) -> tuple[int, ...]:
+		"""
+		Возвращает последовательность ID всех пользователей, имеющих запись в базе данных.
+
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		with self.__Lock:
+			return tuple(Row[0] for Row in self.__Connect().execute("SELECT id FROM users"))
+
+	def load(self, user_id: int) -> dict:
+		"""
+		Считывает запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		:return: Сериализуемый словарь данных пользователя.
+		:rtype: dict
+		"""
+
+		with self.__Lock:
+			Row = self.__Connect().execute("SELECT record FROM users WHERE id = ?", (user_id,)).fetchone()
+
+		if not Row: raise KeyError(user_id)
+
+		return DecodeRecord(Row[0])
+
+	def load_many(self, users_id: Iterable[int]) -> dict[int, dict]:
+		"""
+		Считывает записи нескольких пользователей одним запросом на каждые 500 ID. Отсутствующие записи пропускаются.
+
+		:param users_id: Последовательность ID пользователей.
+		:type users_id: Iterable[int]
+		:return: Словарь записей, ключами которого являются ID пользователей.
+		:rtype: dict[int, dict]
+		"""
+
+		UsersID = tuple(users_id)
+		Records = {}
+
+		for Index in range(0, len(UsersID), 500):
+			Chunk = UsersID[Index:Index + 500]
+			Placeholders = ", ".join("?" * len(Chunk))
+
+			with self.__Lock:
+				Rows = self.__Connect().execute(f"SELECT id, record FROM users WHERE id IN ({Placeholders})", Chunk).fetchall()
+
+			for UserID, Record in Rows: Records[UserID] = DecodeRecord(Record)
+
+		return Records
+
+	def save(self, user_id: int, record: dict):
+		"""
+		Записывает данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		"""
+
+		self.save_many({user_id: record})
+
+	def save_many(self, records: dict[int, dict]):
+		"""
+		Записывает данные нескольких пользователей в одной транзакции.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict]
+		"""
+
+		if not records: return
+		Codec = self.manager.codec
+		Rows = tuple((UserID, Codec.encode(Record)) for UserID, Record in records.items())
+
+		with self.__Lock:
+			Connection = self.__Connect()
+			Connection.execute("BEGIN")
+
+			try:
+				Connection.executemany("INSERT INTO users (id, record) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET record = excluded.record", Rows)
+				Connection.execute("COMMIT")
+
+			except BaseException:
+				Connection.execute("ROLLBACK")
+				raise
+
+class JournalStorage(BaseStorage):
+	"""
+	Хранилище, защищающее записи другого хранилища от повреждения при сбоях журналом упреждающей записи.
+
+	Сохраняемые записи дописываются в журнал и сразу становятся доступны для чтения, а сброс журнала на диск выполняется фоновым потоком одной операцией для всех записей, поступивших за интервал фиксации. При разрастании журнала записи переносятся в основное хранилище, после чего журнал очищается. Перенос не требует атомарной записи: до его завершения записи остаются в журнале, и при следующем запуске журнал воспроизводится повторно.
+
+	Записи, поступившие после последней фиксации, могут быть утеряны только при сбое операционной системы, но не при аварийном завершении процесса.
+	"""
+
+	__Journal: BinaryIO | None
+	__Records: int
+	__Unsynced: int
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к журналу."""
+
+		return self.__Path
+
+	@property
+	def storage(self) -> BaseStorage:
+		"""Основное хранилище."""
+
+		return self.__Storage
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Append(self, records: dict[int, dict | None]):
+		"""
+		Дописывает записи в журнал. Значение `None` обозначает удаление записи.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict | None]
+		"""
+
+		Lines = b"".join(orjson.dumps((UserID, Record)) + b"\n" for UserID, Record in records.items())
+
+		with self.__Condition:
+			Journal = self.__OpenJournal()
+			Journal.write(Lines)
+			Journal.flush()
+			self.__Pending.update(records)
+			self.__Records += len(records)
+			self.__Unsynced += len(records)
+			self.__Condition.notify_all()
+
+	def __Commit(self):
+		"""Цикл потока фиксации: сбрасывает журнал на диск по истечении интервала или накоплении пакета записей и запускает перенос записей в основное хранилище."""
+
+		IsClosed = False
+
+		while not IsClosed:
+
+			with self.__Condition:
+				self.__Condition.wait_for(lambda: self.__IsClosed or self.__Unsynced > 0)
+				self.__Condition.wait_for(lambda: self.__IsClosed or self.__Unsynced >= self.__CommitSize or self.__Records >= self.__CompactionThreshold, self.__CommitInterval)
+				IsClosed = self.__IsClosed
+				IsCompactionRequired = self.__Records >= self.__CompactionThreshold
+				self.__Unsynced = 0
+
+			try:
+
+				# Сброс выполняется без блокировки записи, чтобы не задерживать дописывание новых записей. Блокировка переноса не позволяет закрыть журнал во время сброса.
+				with self.__CompactionLock: os.fsync(self.__OpenJournal().fileno())
+
+				if IsCompactionRequired and not IsClosed: self.compact()
+
+			except OSError: LOGGER.exception("Journal commit failed.")
+
+	def __OpenJournal(self) -> BinaryIO:
+		"""
+		Возвращает открытый журнал.
+
+		:raise RuntimeError: Выбрасывается, если хранилище не привязано к менеджеру или закрыто.
+		:return: Файл журнала.
+		:rtype: BinaryIO
+		"""
+
+		if not self.__Journal: raise RuntimeError("Journal closed.")
+
+		return self.__Journal
+
+	def __Replay(self, path: Path) -> int:
+		"""
+		Считывает записи журнала в набор ожидающих переноса. Чтение прекращается на первой повреждённой строке, которая могла быть записана не полностью.
+
+		:param path: Путь к журналу.
+		:type path: Path
+		:return: Количество считанных записей.
+		:rtype: int
+		"""
+
+		if not path.exists(): return 0
+		Count = 0
+
+		with open(path, "rb") as FileReader:
+
+			for Line in FileReader:
+				if not Line.endswith(b"\n"): break
+
+				try: UserID, Record = orjson.loads(Line)
+				except (orjson.JSONDecodeError, ValueError): break
+
+				self.__Pending[UserID] = Record
+				Count += 1
+
+		return Count
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, storage: BaseStorage | None = None, path: str | PathLike[str] | None = None, commit_interval: float = 0.05, commit_size: int = 100, compaction_threshold: int = 10000):
+		"""
+		Хранилище, защищающее записи другого хранилища от повреждения при сбоях журналом упреждающей записи.
+
+		:param storage: Основное хранилище. По умолчанию `JSONStorage`.
+		:type storage: BaseStorage | None
+		:param path: Путь к журналу. По умолчанию _users.journal_ в каталоге менеджера.
+		:type path: str | PathLike[str] | None
+		:param commit_interval: Максимальное время в секундах между поступлением записи и сбросом журнала на диск. По умолчанию 0.05.
+		:type commit_interval: float
+		:param commit_size: Количество записей, при накоплении которого журнал сбрасывается на диск досрочно. По умолчанию 100.
+		:type commit_size: int
+		:param compaction_threshold: Количество записей журнала, при достижении которого они переносятся в основное хранилище. По умолчанию 10 000.
+		:type compaction_threshold: int
+		:raise ValueError: Выбрасывается при неверных параметрах журнала.
+		"""
+
+		if commit_interval < 0: raise ValueError("Commit interval can't be negative.")
+		if commit_size < 1 or compaction_threshold < 1: raise ValueError("Commit size and compaction threshold must be positive.")
+
+		super().__init__()
+		self.__Storage = storage or JSONStorage()
+		self.__Path = Path(path) if path else Path("users.journal")
+		self.__IsPathSpecified = bool(path)
+		self.__CommitInterval = commit_interval
+		self.__CommitSize = commit_size
+		self.__CompactionThreshold = compaction_threshold
+
+		self.__Pending: dict[int, dict | None] = {}
+		self.__Journal = None
+		self.__Records = 0
+		self.__Unsynced = 0
+		self.__Condition = Condition(RLock())
+		self.__CompactionLock = RLock()
+		self.__Worker: Thread | None = None
+		self.__IsClosed = False
+
+	def bind(self, manager: "UsersManager"):
+		"""
+		Привязывает хранилище к менеджеру пользователей, воспроизводит журнал, оставшийся после аварийного завершения, и переносит его записи в основное хранилище.
+
+		:param manager: Менеджер пользователей.
+		:type manager: UsersManager
+		"""
+
+		super().bind(manager)
+		self.__Storage.bind(manager)
+		if not self.__IsPathSpecified: self.__Path = manager.storage_directory / "users.journal"
+		os.makedirs(self.__Path.parent, exist_ok = True)
+
+		with self.__Condition:
+			Count = self.__Replay(self.__Path.with_suffix(".compacting")) + self.__Replay(self.__Path)
+			self.__Journal = open(self.__Path, "ab")
+			self.__Records = Count
+
+		self.__Worker = Thread(target = self.__Commit, name = "Users journal commit.", daemon = True)
+		self.__Worker.start()
+		if Count: self.compact()
+
+	def close(self):
+		"""Сбрасывает журнал на диск, переносит его записи в основное хранилище и закрывает его. Повторный вызов игнорируется."""
+
+		with self.__Condition:
+			if self.__IsClosed or not self.__Journal: return
+			self.__IsClosed = True
+			self.__Condition.notify_all()
+
+		if self.__Worker: self.__Worker.join()
+		self.compact()
+
+		with self.__Condition:
+			self.__OpenJournal().close()
+			self.__Journal = None
+
+		self.__Storage.close()
+
+	def compact(self):
+		"""
+		Переносит записи журнала в основное хранилище и очищает журнал.
+
+		Журнал переименовывается, а новые записи во время переноса дописываются в новый журнал. Переименованный журнал удаляется только после сброса записей основного хранилища на диск.
+		"""
+
+		CompactingPath = self.__Path.with_suffix(".compacting")
+
+		with self.__CompactionLock:
+
+			with self.__Condition:
+				if not self.__Pending: return
+				Records = self.__Pending.copy()
+				Journal = self.__OpenJournal()
+				Journal.flush()
+				os.fsync(Journal.fileno())
+
+				if CompactingPath.exists():
+					# Предыдущий перенос не завершился: записи обоих журналов ещё не перенесены.
+					with open(CompactingPath, "ab") as FileWriter: FileWriter.write(self.__Path.read_bytes())
+					Journal.close()
+					os.remove(self.__Path)
+
+				else:
+					Journal.close()
+					os.replace(self.__Path, CompactingPath)
+
+				self.__Journal = open(self.__Path, "ab")
+				self.__Records = 0
+				self.__Unsynced = 0
+
+			self.__Storage.save_many({UserID: Record for UserID, Record in Records.items() if Record is not None})
+
+			for UserID, Record in Records.items():
+
+				if Record is None:
+					try: self.__Storage.delete(UserID)
+					except KeyError: pass
+
+			if hasattr(os, "sync"): os.sync()
+			os.remove(CompactingPath)
+
+			with self.__Condition:
+
+				for UserID, Record in Records.items():
+					# Запись, изменённая во время переноса, остаётся в новом журнале.
+					if UserID in self.__Pending and self.__Pending[UserID] is Record: del self.__Pending[UserID]
+
+	def delete(self, user_id: int):
+		"""
+		Удаляет запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		"""
+
+		if not self.exists(user_id): raise KeyError(user_id)
+		self.__Append({user_id: None})
+
+	def exists(self, user_id: int) -> bool:
+		"""
+		Проверяет наличие записи пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Возвращает `True`, если запись найдена.
+		:rtype: bool
+		"""
+
+		with self.__Condition:
+			if user_id in self.__Pending: return self.__Pending[user_id] is not None
+
+		return self.__Storage.exists(user_id)
+
+	def get_loader(self) -> Callable[[Sequence[int]], dict[int, dict]] | None:
+		"""
+		Возвращает функцию чтения записей основного хранилища, если в журнале нет не перенесённых записей.
+
+		:return: Функция чтения записей или `None`.
+		:rtype: Callable[[Sequence[int]], dict[int, dict]] | None
+		"""
+
+		with self.__Condition:
+			if self.__Pending: return None
+
+		return self.__Storage.get_loader()
+
+	def get_path(self, user_id: int) -> Path:
+		"""
+		Возвращает путь к файлу основного хранилища, в котором хранится запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:return: Путь к файлу.
+		:rtype: Path
+		"""
+
+		return self.__Storage.get_path(user_id)
+
+	def get_users_id(self) -> tuple[int, ...]:
+		"""
+		Возвращает последовательность ID всех пользователей с учётом не перенесённых записей журнала.
+
+		:return: Последовательность ID пользователей.
+		:rtype: tuple[int, ...]
+		"""
+
+		with self.__Condition: Pending = self.__Pending.copy()
+		UsersID = set(self.__Storage.get_users_id())
+		UsersID.update(UserID for UserID, Record in Pending.items() if Record is not None)
+		UsersID.difference_update(UserID for UserID, Record in Pending.items() if Record is None)
+
+		return tuple(UsersID)
+
+	def load(self, user_id: int) -> dict:
+		"""
+		Считывает запись пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raise KeyError: Выбрасывается при отсутствии записи пользователя.
+		:return: Сериализуемый словарь данных пользователя.
+		:rtype: dict
+		"""
+
+		with self.__Condition:
+
+			if user_id in self.__Pending:
+				Record = self.__Pending[user_id]
+				if Record is None: raise KeyError(user_id)
+
+				return Copy(Record)
+
+		return self.__Storage.load(user_id)
+
+	def load_many(self, users_id: Iterable[int]) -> dict[int, dict]:
+		"""
+		Считывает записи нескольких пользователей. Отсутствующие записи пропускаются.
+
+		:param users_id: Последовательность ID пользователей.
+		:type users_id: Iterable[int]
+		:return: Словарь записей, ключами которого являются ID пользователей.
+		:rtype: dict[int, dict]
+		"""
+
+		UsersID = tuple(users_id)
+		with self.__Condition: Pending = {UserID: self.__Pending[UserID] for UserID in UsersID if UserID in self.__Pending}
+		Records = self.__Storage.load_many(UserID for UserID in UsersID if UserID not in Pending)
+		Records.update({UserID: Copy(Record) for UserID, Record in Pending.items() if Record is not None})
+
+		return Records
+
+	def save(self, user_id: int, record: dict):
+		"""
+		Дописывает запись пользователя в журнал.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param record: Сериализуемый словарь данных пользователя.
+		:type record: dict
+		"""
+
+		self.__Append({user_id: record})
+
+	def save_many(self, records: dict[int, dict]):
+		"""
+		Дописывает записи нескольких пользователей в журнал одной операцией.
+
+		:param records: Словарь записей, ключами которого являются ID пользователей.
+		:type records: dict[int, dict]
+		"""
+
+		if records: self.__Append(dict(records))
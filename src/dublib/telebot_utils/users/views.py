@@ -0,0 +1,198 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator, overload
+
+from ...functions.data import Copy
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def Freeze(value: Any) -> Any:
+	"""
+	Оборачивает словарь или список в представление только для чтения. Остальные объекты возвращаются без изменений.
+
+	:param value: Значение.
+	:type value: Any
+	:return: Представление или исходное значение.
+	:rtype: Any
+	"""
+
+	ValueType = type(value)
+	if ValueType is dict: return FrozenDict(value)
+	if ValueType is list: return FrozenList(value)
+
+	return value
+
+#==========================================================================================#
+# >>>>> ПРЕДСТАВЛЕНИЯ <<<<< #
+#==========================================================================================#
+
+class FrozenDict(Mapping):
+	"""
+	Представление словаря только для чтения.
+
+	Не копирует данные: вложенные словари и списки оборачиваются в представления при обращении к ним. Для получения изменяемой глубокой копии используется метод `copy()`.
+	"""
+
+	__slots__ = ("__Data",)
+
+	def __init__(self, data: dict):
+		"""
+		Представление словаря только для чтения.
+
+		:param data: Словарь.
+		:type data: dict
+		"""
+
+		self.__Data = data
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Проверяет наличие ключа.
+
+		:param key: Ключ.
+		:type key: object
+		:return: Возвращает `True`, если ключ присутствует.
+		:rtype: bool
+		"""
+
+		return key in self.__Data
+
+	def __getitem__(self, key: Any) -> Any:
+		"""
+		Возвращает значение по ключу.
+
+		:param key: Ключ.
+		:type key: Any
+		:raise KeyError: Выбрасывается при отсутствии ключа.
+		:return: Значение или его представление.
+		:rtype: Any
+		"""
+
+		return Freeze(self.__Data[key])
+
+	def __iter__(self) -> Iterator:
+		"""
+		Возвращает итератор ключей.
+
+		:return: Итератор ключей.
+		:rtype: Iterator
+		"""
+
+		return iter(self.__Data)
+
+	def __len__(self) -> int:
+		"""
+		Возвращает количество ключей.
+
+		:return: Количество ключей.
+		:rtype: int
+		"""
+
+		return len(self.__Data)
+
+	def __repr__(self) -> str:
+		"""
+		Возвращает строковое представление словаря.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return f"FrozenDict({self.__Data!r})"
+
+	def copy(self) -> dict:
+		"""
+		Возвращает изменяемую глубокую копию словаря.
+
+		:return: Копия словаря.
+		:rtype: dict
+		"""
+
+		return Copy(self.__Data)
+
+class FrozenList(Sequence):
+	"""
+	Представление списка только для чтения.
+
+	Не копирует данные: вложенные словари и списки оборачиваются в представления при обращении к ним. Для получения изменяемой глубокой копии используется метод `copy()`.
+	"""
+
+	__slots__ = ("__Data",)
+
+	def __init__(self, data: list):
+		"""
+		Представление списка только для чтения.
+
+		:param data: Список.
+		:type data: list
+		"""
+
+		self.__Data = data
+
+	def __eq__(self, other: object) -> bool:
+		"""
+		Сравнивает элементы с другой последовательностью.
+
+		:param other: Сравниваемый объект.
+		:type other: object
+		:return: Возвращает `True`, если последовательности равны.
+		:rtype: bool
+		"""
+
+		if isinstance(other, FrozenList): return self.__Data == other.__Data
+		if isinstance(other, list): return self.__Data == other
+
+		return NotImplemented
+
+	__hash__ = None # type: ignore[assignment]
+
+	@overload
+	def __getitem__(self, index: int) -> Any: ...
+	@overload
+	def __getitem__(self, index: slice) -> "FrozenList": ...
+
+	def __getitem__(self, index: int | slice) -> Any:
+		"""
+		Возвращает элемент по индексу или представление среза.
+
+		:param index: Индекс или срез.
+		:type index: int | slice
+		:raise IndexError: Выбрасывается при выходе индекса за границы списка.
+		:return: Элемент или его представление.
+		:rtype: Any
+		"""
+
+		if type(index) is slice: return FrozenList(self.__Data[index])
+
+		return Freeze(self.__Data[index])
+
+	def __len__(self) -> int:
+		"""
+		Возвращает количество элементов.
+
+		:return: Количество элементов.
+		:rtype: int
+		"""
+
+		return len(self.__Data)
+
+	def __repr__(self) -> str:
+		"""
+		Возвращает строковое представление списка.
+
+		:return: Строковое представление.
+		:rtype: str
+		"""
+
+		return f"FrozenList({self.__Data!r})"
+
+	def copy(self) -> list:
+		"""
+		Возвращает изменяемую глубокую копию списка.
+
+		:return: Копия списка.
+		:rtype: list
+		"""
+
+		return Copy(self.__Data)
@@ -0,0 +1,161 @@
+import asyncio
+from threading import Lock
+from types import SimpleNamespace
+
+import orjson
+from telebot import asyncio_helper, types
+from telebot.apihelper import ApiTelegramException
+
+from dublib.telebot_utils.async_cache import AsyncTeleCache
+from dublib.telebot_utils.cache import TeleCache
+
+class FakeBot:
+
+	def __init__(self, limited: int = 0):
+		self.limited = limited
+		self.uploads = 0
+		self.__Lock = Lock()
+
+	def send_document(self, chat_id: int, document):
+
+		with self.__Lock:
+
+			if self.limited:
+				self.limited -= 1
+				raise ApiTelegramException("sendDocument", None, {"error_code": 429, "description": "Too Many Requests", "parameters": {"retry_after": 0}})
+
+			self.uploads += 1
+			MessageID = self.uploads
+
+		return SimpleNamespace(id = MessageID, document = SimpleNamespace(file_id = f"file-{MessageID}"))
+
+def test_cache_many(tmp_path):
+	Paths = []
+
+	for Index in range(5):
+		FilePath = tmp_path / f"{Index}.txt"
+		FilePath.write_text(str(Index))
+		Paths.append(FilePath)
+
+	Bot = FakeBot(limited = 2)
+	Cache = TeleCache(Bot, tmp_path / "cache.json") # type: ignore[arg-type]
+	Cache.set_chat_id(1, check_chat_access = False)
+	Result = Cache.cache_many(Paths + Paths[:1], workers = 3, rate = 1000, batch_size = 2)
+
+	assert Bot.uploads == 5
+	assert len(Result) == 5
+	assert Cache.has_real_cache(Paths[0])
+	assert {File.file_id for File in Result.values()} == {f"file-{Index}" for Index in range(1, 6)}
+	assert len((tmp_path / "cache.json.log").read_bytes().splitlines()) == 5
+	assert TeleCache(Bot, tmp_path / "cache.json").has_real_cache(Paths[4]) # type: ignore[arg-type]
+
+	Cache.cache_many(Paths, rate = 1000)
+	assert Bot.uploads == 5
+	assert Cache.cache_real_file(Paths[1]).file_id == Result[str(Paths[1])].file_id
+
+def test_cache_log(tmp_path):
+	CachePath = tmp_path / "cache.json"
+	LogPath = tmp_path / "cache.json.log"
+	Cache = TeleCache(FakeBot(), CachePath, compaction_threshold = 10) # type: ignore[arg-type]
+
+	for Index in range(3): Cache.register_real_file(tmp_path / f"{Index}.txt", 1, f"file-{Index}")
+	Cache.register_virtual_file("logo", 1, "file-logo")
+	Cache.remove_real_cache(tmp_path / "0.txt")
+	assert not CachePath.exists()
+	assert len(LogPath.read_bytes().splitlines()) == 5
+
+	Cache = TeleCache(FakeBot(), CachePath, compaction_threshold = 4) # type: ignore[arg-type]
+	assert not LogPath.exists()
+	assert len(orjson.loads(CachePath.read_bytes())["real"]) == 2
+	assert Cache.has_real_cache(tmp_path / "1.txt")
+	assert not Cache.has_real_cache(tmp_path / "0.txt")
+	assert Cache.get_virtual_cached_file("logo").file_id == "file-logo"
+
+	Cache.remove_virtual_cache("logo")
+	with open(LogPath, "ab") as FileWriter: FileWriter.write(b"{\"cache\": \"real\", \"rec")
+
+	Cache = TeleCache(FakeBot(), CachePath) # type: ignore[arg-type]
+	assert not Cache.has_virtual_cache("logo")
+	assert not LogPath.exists()
+
+def test_deduplication(tmp_path):
+	First, Second, Third = tmp_path / "first.txt", tmp_path / "second.txt", tmp_path / "third.txt"
+	First.write_text("same")
+	Second.write_text("same")
+	Third.write_text("other")
+
+	Bot = FakeBot()
+	Cache = TeleCache(Bot, tmp_path / "cache.json", deduplication = True) # type: ignore[arg-type]
+	Cache.set_chat_id(1, check_chat_access = False)
+	Result = Cache.cache_many([First, Second, Third], rate = 1000)
+	assert Bot.uploads == 2
+	assert Result[str(First)].file_id == Result[str(Second)].file_id
+
+	Alias = tmp_path / "alias.txt"
+	Alias.write_text("same")
+	assert Cache.cache_real_file(Alias).file_id == Result[str(First)].file_id
+	assert Bot.uploads == 2
+
+	Cache = TeleCache(Bot, tmp_path / "cache.json", deduplication = True) # type: ignore[arg-type]
+	Cache.set_chat_id(1, check_chat_access = False)
+	Third.write_text("changed")
+	assert not Cache.has_real_cache(Third)
+	assert Cache.cache_real_file(Third).file_id == "file-3"
+	assert Cache.get_real_cached_file(Alias).file_id == Result[str(First)].file_id
+	assert Bot.uploads == 3
+
+def test_lazy_loading(tmp_path):
+	Cache = TeleCache(FakeBot(), tmp_path / "cache.json") # type: ignore[arg-type]
+	Cache.register_real_file(tmp_path / "0.txt", 1, "file-0", 10, {"key": "value"}, types.InputMediaPhoto)
+	Cache.register_virtual_file("logo", 1, "file-logo", 11, attachment_type = types.InputMediaVideo)
+	Cache.save()
+
+	Cache = TeleCache(FakeBot(), tmp_path / "cache.json") # type: ignore[arg-type]
+	RealData = Cache._TeleCache__RealData # type: ignore[attr-defined]
+	assert type(RealData[str(tmp_path / "0.txt")]) is dict
+
+	(tmp_path / "0.txt").write_text("0")
+	File = Cache.get_real_cached_file(tmp_path / "0.txt")
+	assert RealData[str(tmp_path / "0.txt")] is File
+	assert File.file_type is types.InputMediaPhoto and File.data == {"key": "value"}
+	assert Cache.get_virtual_cached_file("logo").file_type is types.InputMediaVideo
+
+	Cache.save()
+	Cache = TeleCache(FakeBot(), tmp_path / "cache.json") # type: ignore[arg-type]
+	assert Cache.get_virtual_cached_file("logo").message_id == 11
+
+class FakeAsyncBot:
+
+	def __init__(self, limited: int = 0):
+		self.limited = limited
+		self.uploads = 0
+
+	async def send_document(self, chat_id: int, document):
+		await asyncio.sleep(0.01)
+
+		if self.limited:
+			self.limited -= 1
+			raise asyncio_helper.ApiTelegramException("sendDocument", None, {"error_code": 429, "description": "Too Many Requests", "parameters": {"retry_after": 0}})
+
+		self.uploads += 1
+
+		return SimpleNamespace(id = self.uploads, document = SimpleNamespace(file_id = f"file-{self.uploads}"))
+
+def test_async_cache(tmp_path):
+	FilePath = tmp_path / "0.txt"
+	FilePath.write_text("0")
+	Bot = FakeAsyncBot(limited = 1)
+
+	async def Run():
+		Cache = await AsyncTeleCache.create(Bot, tmp_path / "cache.json") # type: ignore[arg-type]
+		await Cache.set_chat_id(1, check_chat_access = False)
+		Files = await asyncio.gather(*(Cache.cache_real_file(FilePath) for _ in range(10)))
+		assert {File.file_id for File in Files} == {"file-1"}
+		Virtual = await asyncio.gather(*(Cache.cache_virtual_file(FilePath, "logo") for _ in range(5)))
+		assert {File.file_id for File in Virtual} == {"file-2"}
+		assert await Cache.has_real_cache(FilePath)
+		assert (await Cache.get_real_cached_file(FilePath, types.InputMediaDocument)).file_id == "file-1"
+
+	asyncio.run(Run())
+	assert Bot.uploads == 2
+	assert TeleCache(None, tmp_path / "cache.json").get_virtual_cached_file("logo").file_id == "file-2"
@@ -0,0 +1,475 @@
+import asyncio
+import atexit
+import os
+from datetime import datetime, timedelta
+from threading import Thread
+
+import orjson
+import pytest
+from telebot import types
+
+from dublib.telebot_utils.users import (
+	FrozenDict,
+	IndexRecord,
+	JournalStorage,
+	JSONCodec,
+	JSONStorage,
+	MsgPackCodec,
+	SQLiteStorage,
+	UsersManager,
+)
+from dublib.telebot_utils.users.asynchronous import AsyncUsersManager
+
+class CountingStorage(JSONStorage):
+
+	def __init__(self):
+		super().__init__()
+		self.writes = 0
+
+	def save(self, user_id: int, record: dict):
+		super().save(user_id, record)
+		self.writes += 1
+
+class FailingStorage(JSONStorage):
+
+	def __init__(self):
+		super().__init__()
+		self.failures = 1
+
+	def save_many(self, records: dict[int, dict]):
+
+		if self.failures:
+			self.failures -= 1
+			raise OSError("Storage is unavailable.")
+
+		super().save_many(records)
+
+def test_JSONStorage(tmp_path):
+	Manager = UsersManager(tmp_path)
+	User = Manager.auth(types.User(1, False, "Test", username = "test", language_code = "ru"))
+	User.add_flags("admin")
+	User.set_property("counter", 1)
+	assert User.path == tmp_path / "1.json"
+
+	Manager = UsersManager(tmp_path)
+	User = Manager.get_user(1)
+	assert User.username == "test"
+	assert User.check_flags("admin") is True
+	assert User.get_property("counter") == 1
+
+def test_SQLiteStorage(tmp_path):
+	Manager = UsersManager(tmp_path, storage = SQLiteStorage())
+	for UserID in range(1, 4): Manager.auth(types.User(UserID, False, "Test", language_code = "en")).set_property("id", UserID)
+	Manager.delete_user(3)
+	Manager.close()
+
+	Manager = UsersManager(tmp_path, storage = SQLiteStorage())
+	assert sorted(User.id for User in Manager.users) == [1, 2]
+	assert Manager.get_user(2).get_property("id") == 2
+	assert Manager.is_user_exists(3) is False
+	assert Manager.storage.get_path(1) == tmp_path / "users.sqlite"
+	Manager.close()
+
+def test_lazy_loading(tmp_path):
+	Manager = UsersManager(tmp_path)
+	for UserID in range(1, 6): Manager.auth(types.User(UserID, False, "Test"))
+
+	Manager = UsersManager(tmp_path, lazy = True)
+	assert Manager.users == ()
+	assert Manager.is_user_exists(5) is True
+	Manager.set_resident_limit(users = 2)
+
+	for UserID in (1, 2, 3): Manager.get_user(UserID).set_property("key", UserID)
+	assert sorted(User.id for User in Manager.users) == [2, 3]
+	assert Manager.get_user(1).get_property("key") == 1
+	assert sorted(User.id for User in Manager.users) == [1, 3]
+
+	Users = [Manager.get_user(UserID) for UserID in (1, 2, 3, 4)]
+	Users[0].set_property("key", -1)
+	assert Manager.get_user(1) is Users[0]
+	assert UsersManager(tmp_path, lazy = True).get_user(1).get_property("key") == -1
+
+	Manager = UsersManager(tmp_path)
+	Manager.set_resident_limit(users = 1)
+	assert Manager.is_user_exists(1) is True
+
+def test_index(tmp_path):
+	Manager = UsersManager(tmp_path)
+	for UserID in range(1, 5): Manager.auth(types.User(UserID, False, "Test", language_code = "ru", is_premium = UserID % 2 == 0))
+	Manager.get_user(1).add_flags(["admin", "tester"])
+	Manager.get_user(2).add_flags("tester")
+	Manager.close()
+	assert Manager.index.path.exists() is True
+
+	Manager = UsersManager(tmp_path, lazy = True)
+	assert Manager.index.journal_path.exists() is True
+	assert sorted(Manager.index.find(flags = "tester")) == [1, 2]
+	assert Manager.index.find(flags = ["admin", "tester"]) == (1,)
+	assert sorted(Manager.index.find(is_premium = True)) == [2, 4]
+	assert sorted(Manager.index.find(flags = "tester", is_premium = False)) == [1]
+	assert len(Manager.get_active_users()) == 4
+
+	Manager.delete_user(4)
+	Manager.get_user(3).add_flags("tester")
+	os.remove(Manager.storage.get_path(3))
+	assert sorted(UsersManager(tmp_path, lazy = True).index.find(flags = "tester")) == [1, 2, 3]
+
+	Manager.rebuild_index()
+	assert sorted(Manager.index.users_id) == [1, 2]
+
+def test_changes_tracking(tmp_path):
+	Manager = UsersManager(tmp_path)
+	User = Manager.auth(types.User(1, False, "Test"))
+	assert User.is_changed is False
+
+	User.suppress_saving(True)
+	User.set_property("list", [1])
+	User.set_property("list", [1])
+	assert User.is_changed is True
+	User.suppress_saving(False)
+	assert User.is_changed is False
+
+	User.get_property("list", copy = False).append(2)
+	User.mark_as_changed()
+	User.save()
+	assert UsersManager(tmp_path).get_user(1).get_property("list") == [1, 2]
+
+	Manager.enable_hash_verification(True)
+	User.refresh()
+	User.get_property("list", copy = False).append(3)
+	User.save()
+	assert UsersManager(tmp_path).get_user(1).get_property("list") == [1, 2, 3]
+
+def test_saving_queue(tmp_path):
+	Storage = CountingStorage()
+	Manager = UsersManager(tmp_path, storage = Storage)
+	Manager.enable_saving_queue(True, workers = 2, delay = 60)
+	User = Manager.auth(types.User(1, False, "Test"))
+	for Index in range(100): User.set_property("index", Index)
+	assert Storage.writes == 0
+
+	Manager.flush()
+	assert Storage.writes == 1
+	User.set_property("index", -1)
+	Manager.close()
+	assert Storage.writes == 2
+	assert UsersManager(tmp_path).get_user(1).get_property("index") == -1
+
+	Manager = UsersManager(tmp_path, lazy = True)
+	for UserID in (2, 3): Manager.auth(types.User(UserID, False, "Test"))
+	Manager.set_resident_limit(users = 1)
+	Manager.enable_saving_queue(True, delay = 60)
+	for User in Manager.get_active_users(): User.set_property("broadcast", True)
+	Manager.close()
+	Manager = UsersManager(tmp_path, lazy = True)
+	assert all(Manager.get_user(UserID).get_property("broadcast") for UserID in (1, 2, 3))
+
+	Manager = UsersManager(tmp_path, storage = FailingStorage())
+	Manager.enable_saving_queue(True)
+	Manager.get_user(1).set_property("index", -2)
+	Manager.close()
+	assert UsersManager(tmp_path).get_user(1).get_property("index") == -2
+
+def test_thread_safety(tmp_path):
+	Manager = UsersManager(tmp_path, threads = 4, lazy = True)
+	Manager.set_resident_limit(users = 3)
+	Manager.enable_saving_queue(True, workers = 2, max_size = 5)
+
+	def Handle(thread_index: int):
+
+		for Index in range(50):
+			User = Manager.auth(types.User(Index % 10 + 1, False, "Test"))
+			User.add_flags(f"{thread_index}-{Index}")
+
+	Threads = [Thread(target = Handle, args = (Index,)) for Index in range(8)]
+	for Worker in Threads: Worker.start()
+	for Worker in Threads: Worker.join()
+	Manager.close()
+
+	Manager = UsersManager(tmp_path, threads = 4)
+	assert len(Manager.users) == 10
+	assert sum(len(User.flags) for User in Manager.users) == 400
+	assert sorted(Manager.index.find(flags = "0-0")) == [1]
+
+def test_async_manager(tmp_path):
+
+	async def Run():
+		Manager = await AsyncUsersManager.create(tmp_path, lazy = True)
+		Users = await asyncio.gather(*(Manager.auth(types.User(UserID, False, "Test")) for UserID in range(1, 6)))
+		await asyncio.gather(*(User.set_property("id", User.id) for User in Users))
+		await Users[0].add_flags("admin")
+		assert Users[0].check_flags("admin") is True
+		assert await Manager.get_user(1) == Users[0]
+		assert await Manager.is_user_exists(6) is False
+		await Manager.close()
+
+	asyncio.run(Run())
+	Manager = UsersManager(tmp_path)
+	assert sorted(User.get_property("id") for User in Manager.users) == [1, 2, 3, 4, 5]
+	assert Manager.get_user(1).check_flags("admin") is True
+
+def test_process_loading(tmp_path):
+
+	for Storage in (JSONStorage, SQLiteStorage):
+		Directory = tmp_path / Storage.__name__
+		Manager = UsersManager(Directory, storage = Storage())
+		for UserID in range(1, 11): Manager.auth(types.User(UserID, False, "Test")).set_property("id", UserID)
+		Manager.write_record(11, {"id": 11, "last_activity": "5 January 2024 10:30", "flags": ["legacy"]})
+		Manager.close()
+
+		Manager = UsersManager(Directory, threads = 2, storage = Storage(), processes = True)
+		assert sorted(User.id for User in Manager.users) == list(range(1, 12))
+		assert Manager.get_user(10).get_property("id") == 10
+		assert Manager.get_user(11).last_activity == datetime(2024, 1, 5, 10, 30)
+		assert Manager.index.find(flags = "legacy") == (11,)
+		Manager.close()
+
+def test_compact_representation(tmp_path):
+	Manager = UsersManager(tmp_path)
+	Manager.write_record(3, {"username": "legacy", "flags": ["b", "a"], "custom": 1})
+	Manager.reload_users()
+	First, Second = (Manager.auth(types.User(UserID, False, "Test")) for UserID in (1, 2))
+	First.add_flags(("a", "b"))
+	Second.add_flags("b")
+	Second.add_flags("a")
+
+	assert not hasattr(First, "__dict__")
+	assert First.flags == ("a", "b")
+	assert Manager.intern_flags(First.flags) is Manager.intern_flags(Second.flags) is Manager.intern_flags(Manager.get_user(3).flags)
+	assert First.has_property("key") is False and First.objects == {}
+
+	Manager.get_user(3).set_property("key", 1)
+	assert orjson.loads((tmp_path / "3.json").read_bytes())["custom"] == 1
+
+def test_batch(tmp_path):
+	Storage = CountingStorage()
+	Manager = UsersManager(tmp_path, storage = Storage)
+	for UserID in range(1, 6): Manager.auth(types.User(UserID, False, "Test"))
+	Storage.writes = 0
+
+	Manager.add_flags("beta")
+	assert Storage.writes == 5
+	assert Manager.index.find(flags = "beta") == (1, 2, 3, 4, 5)
+
+	try:
+
+		with Manager.batch(threads = 2):
+			User = Manager.get_user(1)
+			User.set_property("key", 1)
+			User.add_flags("admin")
+			with Manager.batch(): Manager.remove_flags("beta")
+			assert User.is_changed is True
+			raise RuntimeError()
+
+	except RuntimeError: pass
+
+	assert Storage.writes == 10
+	Manager = UsersManager(tmp_path)
+	assert Manager.get_user(1).check_flags("admin") is True
+	assert Manager.index.find(flags = "beta") == ()
+
+def test_journal_storage(tmp_path):
+	Manager = UsersManager(tmp_path, storage = JournalStorage(compaction_threshold = 1000))
+	for UserID in range(1, 4): Manager.auth(types.User(UserID, False, "Test")).set_property("id", UserID)
+	Manager.delete_user(3)
+	assert Manager.get_user(2).get_property("id") == 2
+	assert not (tmp_path / "1.json").exists()
+	with open(tmp_path / "users.journal", "ab") as FileWriter: FileWriter.write(b"[4, {\"username\"")
+	# Имитация аварийного завершения: менеджер не закрывается.
+	atexit.unregister(Manager.close)
+
+	Manager = UsersManager(tmp_path, storage = JournalStorage(compaction_threshold = 2))
+	assert Manager.get_user(1).get_property("id") == 1
+	assert Manager.is_user_exists(3) is False and Manager.is_user_exists(4) is False
+	assert (tmp_path / "1.json").exists() and (tmp_path / "users.journal").stat().st_size == 0
+
+	for UserID in range(5, 10): Manager.auth(types.User(UserID, False, "Test"))
+	Manager.close()
+	assert sorted(UsersManager(tmp_path).storage.get_users_id()) == [1, 2, 5, 6, 7, 8, 9]
+	assert (tmp_path / "users.journal").stat().st_size == 0
+
+def test_unloading(tmp_path):
+	Manager = UsersManager(tmp_path)
+	for UserID in range(1, 5): Manager.write_record(UserID, {"last_activity": "2020-01-01 10:00", "flags": ["old"]})
+	Manager.reload_users()
+	Manager.auth(types.User(5, False, "Test"))
+
+	assert Manager.unload_users(1) == (1, 2, 3, 4)
+	assert Manager.get_unloaded_user(2).flags == {"old"}
+	assert Manager.is_user_exists(3) is True
+	assert Manager.get_user(1).check_flags("old") is True
+	assert Manager.unloaded_users_id == (2, 3, 4)
+
+	assert Manager.restore_unloaded_users(limit = 2) == (2, 3)
+	assert Manager.unloaded_users_id == (4,)
+	assert Manager.restore_unloaded_users() == (4,)
+	assert sorted(User.id for User in Manager.users) == [1, 2, 3, 4, 5]
+
+def test_change_feed(tmp_path):
+	Manager = UsersManager(tmp_path)
+	Manager.enable_change_feed(True, max_size = 3)
+	Received = []
+	Manager.change_feed.subscribe(Received.append)
+
+	User = Manager.auth(types.User(1, False, "Test", language_code = "en"), update_activity = False)
+	User.set_property("key", 1)
+	User.add_flags("admin")
+	User.remove_property("key")
+
+	assert [(Record.field, Record.key, Record.old, Record.new) for Record in Received] == [("is_premium", None, None, False), ("language", None, None, "en"), ("data", "key", None, 1), ("flags", None, frozenset(), frozenset({"admin"})), ("data", "key", 1, None)]
+	assert [Record.sequence for Record in Manager.change_feed.get_changes()] == [3, 4, 5]
+	assert Manager.change_feed.get_changes(since = 4) == (Received[-1],)
+
+def test_migrations(tmp_path):
+	def Rename(record: dict) -> dict:
+		record["data"]["title"] = record["data"].pop("name")
+		return record
+
+	Manager = UsersManager(tmp_path)
+	for UserID in (1, 2, 3): Manager.auth(types.User(UserID, False, "Test"), update_activity = False).set_property("name", UserID)
+	Manager.close()
+
+	Manager = UsersManager(tmp_path, lazy = True, migrations = {1: Rename})
+	assert Manager.get_user(1).get_property("title") == 1
+	assert Manager.storage.load(1)["schema_version"] == 1
+	assert "schema_version" not in Manager.storage.load(2)
+	assert Manager.migrate_users() == 2
+	assert Manager.storage.load(3) == {**Manager.storage.load(3), "schema_version": 1, "data": {"title": 3}}
+	assert Manager.migrate_users() == 0
+	Manager.close()
+
+	Manager = UsersManager(tmp_path)
+	Manager.register_migration(2, lambda Record: {**Record, "data": {"label": Record["data"]["title"]}})
+	assert Manager.schema_version == 2
+	assert Manager.migrate_users() == 3
+	assert Manager.get_user(2).get_property("label") == 2
+	assert Manager.storage.load(2)["schema_version"] == 2
+	Manager.close()
+
+def test_codecs(tmp_path):
+	Manager = UsersManager(tmp_path)
+	for UserID in (1, 2): Manager.auth(types.User(UserID, False, "Test"), update_activity = False).set_property("key", UserID)
+	Manager.close()
+	PrettySize = os.path.getsize(tmp_path / "1.json")
+
+	Manager = UsersManager(tmp_path, lazy = True)
+	Manager.set_codec(JSONCodec())
+	Manager.enable_pretty_saving(False)
+	assert Manager.convert_records() == 2
+	assert os.path.getsize(tmp_path / "1.json") < PrettySize
+	assert orjson.loads((tmp_path / "2.json").read_bytes()) == Manager.storage.load(2)
+	Manager.close()
+
+def test_msgpack_codec(tmp_path):
+	pytest.importorskip("msgpack")
+	Manager = UsersManager(tmp_path)
+	Manager.auth(types.User(1, False, "Test"), update_activity = False).set_property("key", 1)
+	Manager.set_codec(MsgPackCodec())
+	Manager.auth(types.User(2, False, "Test"), update_activity = False)
+	assert sorted(File.name for File in tmp_path.glob("[0-9]*")) == ["1.json", "2.msgpack"]
+	assert Manager.convert_records() == 2
+	assert sorted(File.name for File in tmp_path.glob("[0-9]*")) == ["1.msgpack", "2.msgpack"]
+	Manager.close()
+
+	Manager = UsersManager(tmp_path)
+	assert Manager.get_user(1).get_property("key") == 1
+
+	Manager = UsersManager(tmp_path / "sqlite", storage = SQLiteStorage())
+	Manager.set_codec(MsgPackCodec())
+	Manager.auth(types.User(1, False, "Test"), update_activity = False).set_property("key", 1)
+	Manager.close()
+	assert UsersManager(tmp_path / "sqlite", storage = SQLiteStorage()).get_user(1).get_property("key") == 1
+
+def test_sharded_storage(tmp_path):
+	Manager = UsersManager(tmp_path)
+	for UserID in (1, 258): Manager.auth(types.User(UserID, False, "Test"), update_activity = False).set_property("key", UserID)
+	Manager.close()
+
+	Manager = UsersManager(tmp_path, storage = JSONStorage(shard_depth = 2))
+	assert not list(tmp_path.glob("*.json"))
+	assert (tmp_path / "02" / "01" / "258.json").exists()
+	assert Manager.get_user(258).path == tmp_path / "02" / "01" / "258.json"
+	Manager.auth(types.User(513, False, "Test"), update_activity = False)
+	assert Manager.is_user_exists(513) and (tmp_path / "01" / "02" / "513.json").exists()
+	Manager.delete_user(1)
+	Manager.close()
+
+	Manager = UsersManager(tmp_path, storage = JSONStorage(shard_depth = 2), processes = True, threads = 2)
+	assert sorted(User.id for User in Manager.users) == [258, 513]
+	assert Manager.get_user(258).get_property("key") == 258
+	Manager.close()
+
+def test_snapshots(tmp_path):
+	Manager = UsersManager(tmp_path / "source")
+	for UserID in range(1, 2502): Manager.auth(types.User(UserID, False, "Test"), update_activity = False).set_property("key", UserID)
+	assert Manager.export_snapshot(tmp_path / "users.snapshot.gz", threads = 2) == 2501
+	Manager.close()
+
+	Manager = UsersManager(tmp_path / "target", storage = SQLiteStorage())
+	User = Manager.auth(types.User(7, False, "Test"), update_activity = False)
+	User.set_property("key", 0)
+	Manager.auth(types.User(9999, False, "Test"), update_activity = False)
+	assert Manager.import_snapshot(tmp_path / "users.snapshot.gz", threads = 2) == 2501
+	assert User.get_property("key") == 7
+	assert Manager.is_user_exists(9999) and Manager.storage.load(2501)["data"] == {"key": 2501}
+	assert Manager.index.get(2501) is not None and len(Manager.users) == 2502
+	Manager.close()
+
+def test_metrics(tmp_path):
+	Manager = UsersManager(tmp_path, lazy = True)
+	assert Manager.metrics is None
+	Manager.enable_metrics(True)
+	Received = []
+	Manager.metrics.subscribe(lambda Name, Value: Received.append(Name))
+
+	User = Manager.auth(types.User(1, False, "Test"), update_activity = False)
+	User.set_property("key", 1)
+	Manager.get_user(1)
+	with Manager.batch(): User.set_property("key", 2)
+	User.refresh()
+
+	assert Manager.metrics.counters == {"cache_hits_total": 1, "cache_misses_total": 1}
+	assert Manager.metrics.get_histogram("save_seconds").count == 2
+	assert Manager.metrics.get_histogram("batch_save_seconds").count == 1
+	assert "refresh_seconds" in Received
+	Text = Manager.metrics.to_prometheus()
+	assert "# TYPE dublib_users_save_seconds histogram" in Text
+	assert 'dublib_users_save_seconds_bucket{le="+Inf"} 2' in Text
+	assert "dublib_users_resident_users 1" in Text
+	Manager.close()
+
+def test_activity_buckets(tmp_path):
+	Manager = UsersManager(tmp_path)
+	Now = datetime(2026, 1, 10, 12, 30)
+	Activities = {1: Now - timedelta(days = 3), 2: Now - timedelta(minutes = 20), 3: Now - timedelta(minutes = 40), 4: None}
+	Manager.index.update_many(IndexRecord(UserID, Activity, False, False, None, frozenset(), frozenset()) for UserID, Activity in Activities.items())
+
+	assert sorted(Manager.index.get_active(Now - timedelta(minutes = 30))) == [2]
+	assert sorted(Manager.index.get_active(Now - timedelta(hours = 1), Now - timedelta(minutes = 30))) == [3]
+	assert sorted(Manager.index.get_inactive(Now - timedelta(minutes = 30))) == [1, 3, 4]
+	assert sorted(Manager.index.get_inactive(Now - timedelta(minutes = 30), among = {1, 2})) == [1]
+	assert sorted(Manager.index.get_inactive(Now - timedelta(minutes = 30), among = range(1, 100))) == [1, 3, 4]
+
+	Manager.index.update(IndexRecord(1, Now, False, False, None, frozenset(), frozenset()))
+	assert sorted(Manager.index.get_inactive(Now - timedelta(days = 1))) == [4]
+	Manager.index.remove(4)
+	assert Manager.index.get_inactive(Now - timedelta(days = 1)) == ()
+	Manager.close()
+
+def test_property_views(tmp_path):
+	Manager = UsersManager(tmp_path)
+	User = Manager.auth(types.User(1, False, "Test"), update_activity = False)
+	User.set_property("settings", {"tags": ["a", "b"], "limits": {"daily": 5}})
+
+	View = User.get_property("settings", view = True)
+	assert isinstance(View, FrozenDict) and View == {"tags": ["a", "b"], "limits": {"daily": 5}}
+	assert View["tags"][1:] == ["b"] and View["limits"]["daily"] == 5
+	with pytest.raises(TypeError): View["limits"]["daily"] = 6
+
+	Settings = View.copy()
+	Settings["limits"]["daily"] = 6
+	User.set_property("settings", Settings)
+	assert View["limits"]["daily"] == 5
+	User.set_property("copy", User.get_property("settings", view = True)["limits"])
+	assert Manager.storage.load(1)["data"]["copy"] == {"daily": 6}
+	Manager.close()